@@ -23,6 +23,7 @@ from app.models import (
     Participant,
     JoinRequest,
     AuditLog,
+    LeaderboardSnapshot,
 )
 
 # this is the Alembic Config object, which provides
@@ -0,0 +1,74 @@
+"""add materialized streak state to participants
+
+Revision ID: b7c1d2e3f4a5
+Revises: e9a967f12abd
+Create Date: 2026-03-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c1d2e3f4a5'
+down_revision: Union[str, None] = 'e9a967f12abd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BACKFILL_STREAKS = """
+UPDATE participants
+SET current_streak = agg.current_streak,
+    longest_streak = agg.longest_streak,
+    last_scored_game_at = agg.last_scored_game_at
+FROM (
+    SELECT participant_id,
+           SUM(wins) FILTER (WHERE island = last_island) AS current_streak,
+           MAX(wins) AS longest_streak,
+           MAX(last_at) AS last_scored_game_at
+    FROM (
+        SELECT participant_id,
+               island,
+               MAX(island) OVER (PARTITION BY participant_id) AS last_island,
+               COUNT(*) FILTER (WHERE is_correct IS TRUE) AS wins,
+               MAX(completed_at) AS last_at
+        FROM (
+            SELECT p.id AS participant_id,
+                   pk.is_correct,
+                   COALESCE(g.end_time, g.scheduled_start_time) AS completed_at,
+                   COUNT(*) FILTER (WHERE pk.is_correct IS FALSE) OVER (
+                       PARTITION BY p.id
+                       ORDER BY COALESCE(g.end_time, g.scheduled_start_time), pk.id
+                       ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
+                   ) AS island
+            FROM participants p
+            LEFT OUTER JOIN picks pk
+                ON pk.user_id = p.user_id
+               AND pk.competition_id = p.competition_id
+               AND pk.is_correct IS NOT NULL
+            LEFT OUTER JOIN games g ON g.id = pk.game_id
+        ) per_pick
+        GROUP BY participant_id, island
+    ) per_island
+    GROUP BY participant_id
+) agg
+WHERE participants.id = agg.participant_id
+"""
+
+
+def downgrade() -> None:
+    op.drop_column('participants', 'last_scored_game_at')
+    op.drop_column('participants', 'longest_streak')
+
+
+def upgrade() -> None:
+    op.add_column('participants', sa.Column('longest_streak', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('participants', sa.Column('last_scored_game_at', sa.DateTime(), nullable=True))
+    # Existing streaks were ordered by pick submission time. Rebuild all streak
+    # state in game completion order, as score_service.rebuild_streaks does:
+    # scored picks split into islands at each loss; the longest island is the
+    # longest streak and the last one the current streak.
+    op.execute(BACKFILL_STREAKS)
+
@@ -0,0 +1,24 @@
+"""Add competition_rescored audit action
+
+Revision ID: c8d2e3f4a5b6
+Revises: b7c1d2e3f4a5
+Create Date: 2026-03-17
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c8d2e3f4a5b6"
+down_revision = "b7c1d2e3f4a5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Uppercase to match initial migration
+    op.execute("ALTER TYPE auditaction ADD VALUE IF NOT EXISTS 'COMPETITION_RESCORED'")
+
+
+def downgrade() -> None:
+    # PostgreSQL does not support removing values from enums.
+    pass
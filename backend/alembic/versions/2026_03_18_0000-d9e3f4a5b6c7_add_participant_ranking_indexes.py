@@ -0,0 +1,55 @@
+"""add covering leaderboard ranking indexes to participants
+
+Revision ID: d9e3f4a5b6c7
+Revises: c8d2e3f4a5b6
+Create Date: 2026-03-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9e3f4a5b6c7'
+down_revision: Union[str, None] = 'c8d2e3f4a5b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# One index per leaderboard sort key, matching app.services.ranking's order
+# with the default tie-breakers (accuracy, wins, earliest last_pick_at).
+RANKING_INDEXES = {
+    'ix_participants_rank_points': (
+        ['total_points DESC', 'accuracy_percentage DESC', 'total_wins DESC'],
+        ['total_losses', 'current_streak', 'longest_streak'],
+    ),
+    'ix_participants_rank_accuracy': (
+        ['accuracy_percentage DESC', 'total_wins DESC'],
+        ['total_points', 'total_losses', 'current_streak', 'longest_streak'],
+    ),
+    'ix_participants_rank_wins': (
+        ['total_wins DESC', 'accuracy_percentage DESC'],
+        ['total_points', 'total_losses', 'current_streak', 'longest_streak'],
+    ),
+    'ix_participants_rank_streak': (
+        ['current_streak DESC', 'longest_streak DESC', 'accuracy_percentage DESC', 'total_wins DESC'],
+        ['total_points', 'total_losses'],
+    ),
+}
+
+
+def upgrade() -> None:
+    for name, (ordering, include) in RANKING_INDEXES.items():
+        op.create_index(
+            name,
+            'participants',
+            ['competition_id', *(sa.text(column) for column in ordering), 'last_pick_at', 'user_id'],
+            postgresql_include=include,
+        )
+
+
+def downgrade() -> None:
+    for name in RANKING_INDEXES:
+        op.drop_index(name, table_name='participants')
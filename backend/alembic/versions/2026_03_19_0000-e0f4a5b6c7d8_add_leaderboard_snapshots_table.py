@@ -0,0 +1,44 @@
+"""add leaderboard_snapshots table
+
+Revision ID: e0f4a5b6c7d8
+Revises: d9e3f4a5b6c7
+Create Date: 2026-03-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e0f4a5b6c7d8'
+down_revision: Union[str, None] = 'd9e3f4a5b6c7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'leaderboard_snapshots',
+        sa.Column('competition_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('total_points', sa.Integer(), nullable=False),
+        sa.Column('rank', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['competition_id'], ['competitions.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('competition_id', 'user_id', 'day'),
+    )
+    op.create_index(
+        'ix_leaderboard_snapshots_competition_day_rank',
+        'leaderboard_snapshots',
+        ['competition_id', 'day', 'rank', 'user_id'],
+        postgresql_include=['total_points'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_leaderboard_snapshots_competition_day_rank', table_name='leaderboard_snapshots')
+    op.drop_table('leaderboard_snapshots')
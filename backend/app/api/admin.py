@@ -15,6 +15,7 @@ from app.models.pick import Pick
 from app.models.user import AccountStatus, User, UserRole
 from app.schemas.admin import (
     AdminManagement,
+    CompetitionRescoreRequest,
     CompetitionStatusChange,
     ScoreCorrectionRequest,
     UserRoleUpdate,
@@ -23,6 +24,7 @@ from app.schemas.admin import (
 )
 from app.schemas.participant import JoinRequestResponse, ParticipantWithUserResponse
 from app.schemas.user import UserResponse
+from app.services import leaderboard_index, ranking, task_tracker
 
 logger = logging.getLogger(__name__)
 
@@ -290,6 +292,7 @@ async def correct_game_score(
     )
 
     await db.commit()
+    await leaderboard_index.refresh_pending(db)
     return {
         "message": "Score corrected and picks re-scored",
         "old_score": f"{old_home}-{old_away}",
@@ -322,10 +325,59 @@ async def rescore_game(
 
     await score_picks_for_game(db, game)
     await db.commit()
+    await leaderboard_index.refresh_pending(db)
 
     return {"message": f"Re-scored picks for game {game_id}"}
 
 
+@router.post("/competitions/{competition_id}/rescore", status_code=202)
+@limiter.limit("2/minute")
+async def rescore_competition(
+    request: Request,
+    competition_id: str,
+    body: CompetitionRescoreRequest,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_global_admin),
+    db: AsyncSession = Depends(get_db),
+):
+    """Re-score every final game in a competition (global admin only).
+
+    For repairs after a provider outage or scoring bug. All picks are
+    regraded and every participant's stats rebuilt in a fixed number of
+    set-based statements, in a tracked background task. Poll
+    ``GET /admin/tasks/{task_id}`` for progress.
+    """
+    result = await db.execute(select(Competition).where(Competition.id == competition_id))
+    competition = result.scalar_one_or_none()
+    if not competition:
+        raise HTTPException(status_code=404, detail="Competition not found")
+
+    task = await task_tracker.create_task(
+        "competition_rescore",
+        competition_id=str(competition.id),
+        requested_by=str(current_user.id),
+    )
+
+    from app.services.background_jobs import run_competition_rescore
+
+    background_tasks.add_task(
+        run_competition_rescore, task["id"], competition.id, current_user.id, body.reason
+    )
+    return {"message": "Competition rescore started", "task_id": task["id"]}
+
+
+@router.get("/tasks/{task_id}")
+async def get_admin_task(
+    task_id: str,
+    current_user: User = Depends(get_current_global_admin),
+):
+    """Get status and progress of an admin background task (global admin only)."""
+    task = await task_tracker.get_task(task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return task
+
+
 # ===========================================================================
 # WINNER DESIGNATION
 # ===========================================================================
@@ -431,6 +483,7 @@ async def remove_participant(
     )
 
     await db.commit()
+    await leaderboard_index.invalidate(competition.id)
     return {"message": "Participant removed"}
 
 
@@ -439,33 +492,33 @@ async def remove_participant(
 )
 async def list_competition_participants(
     competition_id: str,
+    sort_by: str = Query("points", regex="^(points|accuracy|wins|streak)$"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """List all participants in a competition with user details (competition admin or global admin)."""
+    """List all participants in a competition with user details (competition admin or global admin).
+
+    Ordered and ranked exactly like the public leaderboard.
+    """
     await _require_competition_admin(competition_id, current_user, db)
 
-    rows_result = await db.execute(
-        select(Participant, User)
-        .join(User, Participant.user_id == User.id)
-        .where(Participant.competition_id == competition_id)
-        .order_by(Participant.total_points.desc())
-    )
-    rows = rows_result.all()
+    rows = await ranking.fetch_ranked(db, competition_id, sort_by)
 
     return [
         ParticipantWithUserResponse(
             id=p.id,
             user_id=p.user_id,
-            username=u.username,
+            username=username,
+            rank=rank,
             joined_at=p.joined_at,
             total_points=p.total_points,
             total_wins=p.total_wins,
             total_losses=p.total_losses,
             accuracy_percentage=p.accuracy_percentage,
             current_streak=p.current_streak,
+            longest_streak=p.longest_streak,
         )
-        for p, u in rows
+        for p, username, rank, _ in rows
     ]
 
 
@@ -626,6 +679,7 @@ async def approve_join_request(
     )
 
     await db.commit()
+    await leaderboard_index.invalidate(competition.id)
     return {"message": "Join request approved"}
 
 
@@ -22,6 +22,7 @@ from app.schemas.competition import (
 )
 from app.schemas.invite_link import InviteLinkResponse, JoinCompetitionRequest
 from app.schemas.participant import JoinRequestResponse
+from app.services import leaderboard_index
 
 router = APIRouter()
 
@@ -364,6 +365,7 @@ async def delete_competition(
 
     await db.delete(competition)
     await db.commit()
+    await leaderboard_index.invalidate(competition_id)
 
     return {"message": "Competition deleted successfully"}
 
@@ -457,6 +459,7 @@ async def join_competition(
             )
 
         await db.commit()
+        await leaderboard_index.invalidate(competition.id)
         return {"message": "Joined competition successfully"}
 
     # Otherwise, create join request (requires_approval path)
@@ -818,6 +821,7 @@ async def sync_competition_games(
     try:
         sync_result = await sync_games_for_competition(db, competition_id)
         await db.commit()
+        await leaderboard_index.refresh_pending(db)
     except Exception as exc:
         await db.rollback()
         import logging
@@ -2,6 +2,8 @@ from fastapi import APIRouter, Depends
 
 from app.core.deps import get_current_global_admin, get_current_user
 from app.models.user import User
+from app.services import leaderboard_cache
+from app.services.sports_api.quota import quota_manager
 from app.services.sports_api.sports_service import sports_service
 
 router = APIRouter()
@@ -16,7 +18,23 @@ async def get_api_status(
 
     Available to all authenticated users.
     """
-    return sports_service.get_api_health_status()
+    return {
+        **sports_service.get_api_health_status(),
+        # Read from Redis: budgets are shared by every process
+        "quotas": await quota_manager.get_status(),
+    }
+
+
+@router.get("/leaderboard-cache")
+async def get_leaderboard_cache_stats(
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Hit, miss, 304 and invalidation counters for the leaderboard response cache.
+
+    Available to all authenticated users.
+    """
+    return await leaderboard_cache.get_stats()
 
 
 @router.post("/reset-circuit-breakers")
@@ -1,12 +1,24 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import and_, select
+import json
+import uuid
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import JSONResponse
+from sqlalchemy import and_, any_, cast, select
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.deps import get_current_user, get_db
 from app.models.competition import Competition, Visibility
 from app.models.participant import Participant
 from app.models.user import User
-from app.schemas.participant import LeaderboardEntry
+from app.schemas.participant import (
+    LeaderboardEntry,
+    LeaderboardHistoryDay,
+    LeaderboardHistoryEntry,
+    LeaderboardHistoryPoint,
+)
+from app.services import leaderboard_cache, leaderboard_history, leaderboard_index
 
 router = APIRouter()
 
@@ -14,11 +26,167 @@ router = APIRouter()
 @router.get("/{competition_id}", response_model=list[LeaderboardEntry])
 async def get_leaderboard(
     competition_id: str,
+    request: Request,
     sort_by: str = Query("points", regex="^(points|accuracy|wins|streak)$"),
+    limit: int | None = Query(None, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    cursor: str | None = None,
+    around_me: int | None = Query(None, ge=0, le=100),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Get leaderboard for a competition.
+
+    Returns every participant by default. ``limit``/``offset`` or ``cursor``
+    return one page; ``X-Total-Count`` carries the participant count and
+    ``X-Next-Cursor`` the cursor for the following page. ``around_me=N``
+    returns the N entries above and below the caller. Ranks are always
+    absolute.
+
+    Windows are served from a read-through cache with strong ETags, so
+    polling clients sending ``If-None-Match`` get ``304 Not Modified``.
+    """
+    competition = await _get_visible_competition(db, competition_id, current_user)
+
+    # Work out the window, then read just that slice of the sorted-set index
+    if around_me is not None:
+        if cursor or offset:
+            raise HTTPException(
+                status_code=400,
+                detail="around_me cannot be combined with offset or cursor",
+            )
+        position = await leaderboard_index.position_of(db, competition.id, sort_by, current_user.id)
+        if position is None:
+            raise HTTPException(
+                status_code=404,
+                detail="You are not a participant in this competition",
+            )
+        start = max(0, position - around_me)
+        stop = position + around_me
+    else:
+        if cursor:
+            if offset:
+                raise HTTPException(
+                    status_code=400,
+                    detail="cursor cannot be combined with offset",
+                )
+            try:
+                start = await leaderboard_index.resolve_cursor(db, competition.id, sort_by, cursor)
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid cursor") from None
+        else:
+            start = offset
+        stop = start + limit - 1 if limit else -1
+
+    # Serve the window from the response cache, rendering it on a miss
+    variant = f"{sort_by}:{start}:{stop}"
+    if_none_match = request.headers.get("if-none-match")
+    cached = None
+    base_etag = await leaderboard_cache.get_etag(competition.id, variant)
+    if base_etag:
+        etag = leaderboard_cache.user_etag(base_etag, current_user.id)
+        if leaderboard_cache.etag_matches(if_none_match, etag):
+            await leaderboard_cache.record("not_modified")
+            return Response(status_code=304, headers=_cache_headers(etag))
+        cached = await leaderboard_cache.get_body(competition.id, variant)
+
+    if cached:
+        base_etag, body = cached
+        await leaderboard_cache.record("hits")
+    else:
+        generation = await leaderboard_cache.generation(competition.id)
+        body = await _render_window(db, competition.id, sort_by, start, stop)
+        base_etag = await leaderboard_cache.store(competition.id, variant, body, generation)
+        await leaderboard_cache.record("misses")
+
+    # A re-rendered window can still match what the client already has
+    etag = leaderboard_cache.user_etag(base_etag, current_user.id)
+    headers = _cache_headers(etag)
+    if leaderboard_cache.etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    window = json.loads(body)
+    current_user_id = str(current_user.id)
+    for entry in window["entries"]:
+        entry["is_current_user"] = entry["user_id"] == current_user_id
+    headers["X-Total-Count"] = str(window["total"])
+    if around_me is None and window["next_cursor"]:
+        headers["X-Next-Cursor"] = window["next_cursor"]
+    return JSONResponse(window["entries"], headers=headers)
+
+
+@router.get("/{competition_id}/history", response_model=list[LeaderboardHistoryPoint])
+async def get_leaderboard_history(
+    competition_id: str,
+    user_id: uuid.UUID | None = None,
+    start: date | None = None,
+    end: date | None = None,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Daily points and rank for one participant (the caller by default).
+
+    Covers the last LEADERBOARD_HISTORY_DAYS days unless ``start``/``end``
+    are given. Days without scored games have no snapshot.
+    """
+    competition = await _get_visible_competition(db, competition_id, current_user)
+    start, end = _history_range(start, end)
+
+    rows = await leaderboard_history.participant_series(
+        db, competition.id, user_id or current_user.id, start, end
+    )
+    points, previous_rank = [], None
+    for row in rows:
+        rank_change = previous_rank - row.rank if previous_rank is not None else None
+        points.append(
+            LeaderboardHistoryPoint(
+                day=row.day, total_points=row.total_points, rank=row.rank, rank_change=rank_change
+            )
+        )
+        previous_rank = row.rank
+    return points
+
+
+@router.get("/{competition_id}/history/top", response_model=list[LeaderboardHistoryDay])
+async def get_competition_history(
+    competition_id: str,
+    top: int = Query(10, ge=1, le=100),
+    start: date | None = None,
+    end: date | None = None,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get leaderboard for a competition"""
+    """The top ``top`` ranks of a competition for each snapshotted day."""
+    competition = await _get_visible_competition(db, competition_id, current_user)
+    start, end = _history_range(start, end)
+
+    rows = await leaderboard_history.competition_series(db, competition.id, start, end, top)
+    usernames = await _usernames(db, list({row.user_id for row in rows}))
+
+    days: dict[date, list[LeaderboardHistoryEntry]] = {}
+    for row in rows:
+        days.setdefault(row.day, []).append(
+            LeaderboardHistoryEntry(
+                rank=row.rank,
+                user_id=row.user_id,
+                username=usernames.get(str(row.user_id), ""),
+                total_points=row.total_points,
+            )
+        )
+    return [LeaderboardHistoryDay(day=day, entries=entries) for day, entries in days.items()]
+
+
+def _history_range(start: date | None, end: date | None) -> tuple[date, date]:
+    start, end = leaderboard_history.default_range(end, start)
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must not be after end")
+    return start, end
+
+
+async def _get_visible_competition(
+    db: AsyncSession, competition_id: str, current_user: User
+) -> Competition:
+    """Load a competition, 404 if missing and 403 if private to a non-participant."""
     # Verify competition exists
     comp_result = await db.execute(select(Competition).where(Competition.id == competition_id))
     competition = comp_result.scalar_one_or_none()
@@ -45,42 +213,46 @@ async def get_leaderboard(
                 detail="You are not a participant in this private competition",
             )
 
-    # Get all participants with user data
-    query = (
-        select(Participant, User)
-        .join(User, Participant.user_id == User.id)
-        .where(Participant.competition_id == competition_id)
-    )
+    return competition
+
 
-    # Sort based on query parameter
-    if sort_by == "points":
-        query = query.order_by(Participant.total_points.desc())
-    elif sort_by == "accuracy":
-        query = query.order_by(Participant.accuracy_percentage.desc())
-    elif sort_by == "wins":
-        query = query.order_by(Participant.total_wins.desc())
-    elif sort_by == "streak":
-        query = query.order_by(Participant.current_streak.desc())
-
-    result = await db.execute(query)
-    participants = result.all()
-
-    # Build leaderboard entries
-    leaderboard = []
-    rank = 1
-    for participant, user in participants:
-        entry = LeaderboardEntry(
-            rank=rank,
-            user_id=participant.user_id,
-            username=user.username,
-            total_points=participant.total_points,
-            total_wins=participant.total_wins,
-            total_losses=participant.total_losses,
-            accuracy_percentage=participant.accuracy_percentage,
-            current_streak=participant.current_streak,
-            is_current_user=(participant.user_id == current_user.id),
+async def _usernames(db: AsyncSession, user_ids: list) -> dict[str, str]:
+    if not user_ids:
+        return {}
+    # One array parameter keeps large pages under the bind-parameter limit
+    result = await db.execute(
+        select(User.id, User.username).where(
+            User.id == any_(cast([str(uid) for uid in user_ids], ARRAY(UUID(as_uuid=False))))
         )
-        leaderboard.append(entry)
-        rank += 1
+    )
+    return {str(row.id): row.username for row in result}
+
+
+def _cache_headers(etag: str) -> dict[str, str]:
+    # Clients may keep the body but must revalidate it on every poll
+    return {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+
+async def _render_window(db: AsyncSession, competition_id, sort_by: str, start: int, stop: int):
+    """Serialize one leaderboard window for the cache (``is_current_user`` left false)."""
+    ranked, total = await leaderboard_index.read_window(db, competition_id, sort_by, start, stop)
+    next_cursor = None
+    if ranked and ranked[-1][0] + 1 < total:
+        _, last_user_id, last_stats = ranked[-1]
+        next_cursor = leaderboard_index.encode_cursor(sort_by, last_user_id, last_stats)
+
+    # Only usernames for the window hit the DB; ranks come from the index
+    usernames = await _usernames(db, [user_id for _, user_id, _ in ranked])
+    ranks = await leaderboard_index.window_ranks(db, competition_id, sort_by, ranked)
 
-    return leaderboard
+    entries = [
+        LeaderboardEntry(
+            rank=ranks[user_id],
+            user_id=user_id,
+            username=usernames[user_id],
+            **stats,
+        ).model_dump(mode="json")
+        for _, user_id, stats in ranked
+        if user_id in usernames and user_id in ranks
+    ]
+    return json.dumps({"total": total, "next_cursor": next_cursor, "entries": entries})
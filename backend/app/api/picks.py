@@ -19,6 +19,7 @@ from app.schemas.pick import (
     PickBatchCreate,
     PickResponse,
 )
+from app.services import leaderboard_index, ranking
 
 logger = logging.getLogger(__name__)
 
@@ -195,9 +196,14 @@ async def create_daily_picks_batch(
 
     # Update participant last_pick_at
     participant.last_pick_at = now
+    participant_id = participant.id
 
     await db.commit()
 
+    # Pick time can break leaderboard ties, so the index has to see it
+    if "last_pick_at" in ranking.tie_breakers():
+        await leaderboard_index.refresh_participants(db, Participant.id == participant_id)
+
     # Refresh all picks
     for pick in created_picks:
         await db.refresh(pick)
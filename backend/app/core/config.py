@@ -8,6 +8,8 @@ class Settings(BaseSettings):
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
+    # Connection cap of the shared async Redis pool (app.db.redis)
+    REDIS_MAX_CONNECTIONS: int = 50
 
     # Security
     SECRET_KEY: str = "dev-secret-key-change-in-production"
@@ -93,11 +95,63 @@ class Settings(BaseSettings):
     API_TIMEOUT_SECONDS: int = 10
     API_MAX_RETRIES: int = 3
     API_RETRY_DELAY_SECONDS: int = 2
+    # Connection pool shared by all provider clients (see sports_api/http_pool.py)
+    API_HTTP_MAX_CONNECTIONS: int = 50
+    API_HTTP_MAX_KEEPALIVE: int = 20
+    API_HTTP_KEEPALIVE_SECONDS: float = 30.0
+    API_HTTP_MAX_CONNECTIONS_PER_HOST: int = 10
+    # Negotiate HTTP/2 with providers that offer it (needs the h2 package)
+    API_HTTP2: bool = False
+    # How many days of schedule are requested at once when syncing a date range
+    SCHEDULE_FETCH_CONCURRENCY: int = 5
+    # Redis lock letting one process fetch a key while others wait for the cache (0 disables)
+    SPORTS_FETCH_LOCK_SECONDS: int = 15
+    # Hedged live scores: start the next provider when the current one is slower
+    # than its p95 (API_HEDGE_DEFAULT_DELAY_MS until enough calls are timed);
+    # at most API_HEDGE_BUDGET_PERCENT of a league's fetches are hedged
+    API_HEDGE_LIVE_SCORES: bool = False
+    API_HEDGE_DEFAULT_DELAY_MS: int = 1000
+    API_HEDGE_BUDGET_PERCENT: int = 10
+    # Providers are tried in order of EWMA latency / success rate per league and
+    # operation; a share of calls tries a random other provider first
+    API_PROVIDER_EWMA_ALPHA: float = 0.2
+    API_PROVIDER_EXPLORATION_RATE: float = 0.05
+    # In-process tier of deserialized games in front of Redis (0 seconds disables)
+    SPORTS_LOCAL_CACHE_SECONDS: int = 10
+    SPORTS_LOCAL_CACHE_MAX_ENTRIES: int = 256
+    # Provider responses remembered per client for conditional requests (kept
+    # CACHE_API_RESPONSE_SECONDS after the last fetch)
+    API_REVALIDATION_MAX_ENTRIES: int = 128
+    # Monthly request budgets of metered providers (0 = unknown until the
+    # provider reports its remaining quota in response headers)
+    THE_ODDS_API_MONTHLY_QUOTA: int = 500
+    RAPIDAPI_MONTHLY_QUOTA: int = 0
+    # Day of the month (UTC, 1-28) the budgets reset
+    API_QUOTA_RESET_DAY: int = 1
+    # Requests held back for manual use; the provider is skipped below this
+    API_QUOTA_RESERVE_REQUESTS: int = 25
+    # Requests a provider may make back to back before pacing applies
+    API_QUOTA_BURST: int = 10
+    # Period the burn rate shown in /api/health/api-status is measured over
+    API_QUOTA_BURN_WINDOW_SECONDS: int = 86400
 
     # Circuit Breaker Settings
     CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = 5
     CIRCUIT_BREAKER_TIMEOUT_SECONDS: int = 60
     CIRCUIT_BREAKER_EXPECTED_EXCEPTION: str = "httpx.HTTPError"
+    # "consecutive" trips after FAILURE_THRESHOLD failures in a row;
+    # "sliding_window" trips on failure / slow-call rates over a time window,
+    # limits HALF_OPEN trial calls and probes open breakers in the background
+    CIRCUIT_BREAKER_MODE: str = "consecutive"
+    CIRCUIT_BREAKER_WINDOW_SECONDS: int = 60
+    CIRCUIT_BREAKER_MIN_CALLS: int = 10
+    CIRCUIT_BREAKER_FAILURE_RATE: float = 0.5
+    CIRCUIT_BREAKER_SLOW_CALL_SECONDS: float = 5.0
+    CIRCUIT_BREAKER_SLOW_CALL_RATE: float = 0.8
+    CIRCUIT_BREAKER_HALF_OPEN_CALLS: int = 2
+    CIRCUIT_BREAKER_PROBE_INTERVAL_SECONDS: int = 15
+    # League whose live scores probe an open provider (one cheap request)
+    CIRCUIT_BREAKER_PROBE_LEAGUE: str = "NFL"
 
     # Rate Limiting
     RATE_LIMIT_PER_MINUTE: int = 100
@@ -106,8 +160,17 @@ class Settings(BaseSettings):
     # Caching
     CACHE_SCORES_SECONDS: int = 60
     CACHE_LEADERBOARD_SECONDS: int = 30
+    LEADERBOARD_INDEX_TTL_SECONDS: int = 86400  # Redis sorted-set leaderboard index
+    # Leaderboard ties: comma-separated tie-breakers applied after the sort key
+    # (points, accuracy, wins, last_pick_at), and "rank" (1, 1, 3) or "dense" (1, 1, 2)
+    LEADERBOARD_TIE_BREAKERS: str = "accuracy,wins,last_pick_at"
+    LEADERBOARD_RANK_MODE: str = "rank"
     CACHE_USER_PREFS_SECONDS: int = 300
     CACHE_SCHEDULE_SECONDS: int = 3600  # 1 hour for schedules
+    # How long past those TTLs an entry may still be served, marked stale, while it is
+    # refreshed in the background or when every provider is failing
+    CACHE_SCORES_STALE_SECONDS: int = 600
+    CACHE_SCHEDULE_STALE_SECONDS: int = 86400
     CACHE_API_RESPONSE_SECONDS: int = 300  # 5 minutes for API responses
 
     # Monitoring
@@ -115,6 +178,14 @@ class Settings(BaseSettings):
 
     # Background Jobs
     SCORE_UPDATE_INTERVAL_SECONDS: int = 60
+    # How many leagues' score pipelines run at once
+    SCORE_UPDATE_CONCURRENCY: int = 4
+    # How often incremental participant totals are checked against pick history
+    STATS_RECONCILE_INTERVAL_MINUTES: int = 60
+    # Daily leaderboard snapshots: hour (UTC) the previous day is recorded,
+    # and how many days the history endpoint returns by default
+    LEADERBOARD_SNAPSHOT_HOUR_UTC: int = 8
+    LEADERBOARD_HISTORY_DAYS: int = 30
     # Set to True on API instances when running a separate worker process
     DISABLE_BACKGROUND_JOBS: bool = False
 
@@ -0,0 +1,44 @@
+"""Process-wide async Redis client.
+
+Like ``session.engine`` for Postgres, one ``redis.asyncio`` connection pool
+is shared by everything in the process that talks to Redis on the event
+loop: the sports data cache and fetch locks, score publishing, provider
+quotas, the leaderboard index and response cache, and admin task records.
+
+Connections are reused across commands and opened on demand up to
+REDIS_MAX_CONNECTIONS; a command needing one more fails with a
+ConnectionError, which the cache paths already treat as a miss. (A
+BlockingConnectionPool would queue instead, but its acquire path roughly
+halves throughput under concurrency in redis-py 5.0.)
+"""
+
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+
+_client: aioredis.Redis | None = None
+
+
+def get_redis() -> aioredis.Redis:
+    """Return the shared client, creating its pool on first use.
+
+    Connections are opened lazily, so this never touches the network.
+    """
+    global _client
+    if _client is None:
+        pool = aioredis.ConnectionPool.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            socket_connect_timeout=2,
+        )
+        _client = aioredis.Redis.from_pool(pool)
+    return _client
+
+
+async def close_redis() -> None:
+    """Close the shared client and disconnect its pool (on shutdown)."""
+    global _client
+    if _client is not None:
+        client, _client = _client, None
+        await client.aclose()
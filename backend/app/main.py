@@ -25,10 +25,14 @@ from app.api import (
 )
 from app.core.config import settings
 from app.core.limiter import limiter
+from app.db.redis import close_redis
 from app.db.session import AsyncSessionLocal
 
 # Import for lifespan
 from app.services.background_jobs import start_background_jobs, stop_background_jobs
+from app.services.circuit_breaker import circuit_breaker_manager
+from app.services.sports_api.http_pool import close_http_client
+from app.services.sports_api.sports_service import sports_service
 
 logger = logging.getLogger(__name__)
 
@@ -105,13 +109,19 @@ async def lifespan(app: FastAPI):
     from app.services.ws_manager import score_manager
 
     await score_manager.start_subscriber()
+    await sports_service.start_cache_listener()
+    await circuit_breaker_manager.start_prober()
 
     yield
 
     logger.info("Shutting down United Degenerates League API...")
     await score_manager.stop_subscriber()
+    await sports_service.stop_cache_listener()
+    await circuit_breaker_manager.stop_prober()
     if not settings.DISABLE_BACKGROUND_JOBS:
         stop_background_jobs()
+    await close_http_client()
+    await close_redis()
 
 
 app = FastAPI(
@@ -152,6 +162,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
     allow_headers=["Authorization", "Content-Type"],
+    expose_headers=["ETag", "X-Total-Count", "X-Next-Cursor"],
 )
 
 
@@ -3,6 +3,7 @@ from app.models.bug_report import BugReport, BugReportCategory, BugReportStatus
 from app.models.competition import Competition
 from app.models.game import Game
 from app.models.invite_link import InviteLink
+from app.models.leaderboard_snapshot import LeaderboardSnapshot
 from app.models.league import Golfer, League, Team
 from app.models.participant import JoinRequest, Participant
 from app.models.pick import FixedTeamSelection, Pick
@@ -19,6 +20,7 @@ __all__ = [
     "Golfer",
     "InviteLink",
     "JoinRequest",
+    "LeaderboardSnapshot",
     "League",
     "Participant",
     "Pick",
@@ -25,6 +25,7 @@ class AuditAction(str, enum.Enum):
 
     # Score corrections
     SCORE_CORRECTED = "score_corrected"
+    COMPETITION_RESCORED = "competition_rescored"
 
     # Winner designation
     WINNER_DESIGNATED = "winner_designated"
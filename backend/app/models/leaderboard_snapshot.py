@@ -0,0 +1,39 @@
+from sqlalchemy import Column, Date, ForeignKey, Index, Integer
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.db.session import Base
+
+
+class LeaderboardSnapshot(Base):
+    """A participant's points and rank at the end of one scoring day.
+
+    Written in bulk by the daily snapshot job; never updated by the scoring
+    path. The primary key serves one participant's series and the
+    ``(competition_id, day, rank, user_id)`` index serves a competition's, both as a
+    single range scan.
+    """
+
+    __tablename__ = "leaderboard_snapshots"
+    __table_args__ = (
+        Index(
+            "ix_leaderboard_snapshots_competition_day_rank",
+            "competition_id",
+            "day",
+            "rank",
+            "user_id",
+            postgresql_include=["total_points"],
+        ),
+    )
+
+    competition_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("competitions.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    user_id = Column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    day = Column(Date, primary_key=True)
+
+    total_points = Column(Integer, nullable=False)
+    rank = Column(Integer, nullable=False)
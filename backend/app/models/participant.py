@@ -2,7 +2,7 @@ import enum
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Enum, Float, ForeignKey, Integer, String
+from sqlalchemy import Column, DateTime, Enum, Float, ForeignKey, Index, Integer, String, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -19,6 +19,50 @@ class Participant(Base):
     """Represents a user's participation in a specific competition"""
 
     __tablename__ = "participants"
+    # One covering index per leaderboard sort key, in the exact order
+    # app.services.ranking ranks by (with the default tie-breakers), so a
+    # competition's leaderboard is an index-only scan with no sort step.
+    __table_args__ = (
+        Index(
+            "ix_participants_rank_points",
+            "competition_id",
+            text("total_points DESC"),
+            text("accuracy_percentage DESC"),
+            text("total_wins DESC"),
+            "last_pick_at",
+            "user_id",
+            postgresql_include=["total_losses", "current_streak", "longest_streak"],
+        ),
+        Index(
+            "ix_participants_rank_accuracy",
+            "competition_id",
+            text("accuracy_percentage DESC"),
+            text("total_wins DESC"),
+            "last_pick_at",
+            "user_id",
+            postgresql_include=["total_points", "total_losses", "current_streak", "longest_streak"],
+        ),
+        Index(
+            "ix_participants_rank_wins",
+            "competition_id",
+            text("total_wins DESC"),
+            text("accuracy_percentage DESC"),
+            "last_pick_at",
+            "user_id",
+            postgresql_include=["total_points", "total_losses", "current_streak", "longest_streak"],
+        ),
+        Index(
+            "ix_participants_rank_streak",
+            "competition_id",
+            text("current_streak DESC"),
+            text("longest_streak DESC"),
+            text("accuracy_percentage DESC"),
+            text("total_wins DESC"),
+            "last_pick_at",
+            "user_id",
+            postgresql_include=["total_points", "total_losses"],
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
 
@@ -33,8 +77,10 @@ class Participant(Base):
     total_losses = Column(Integer, default=0, nullable=False)
     accuracy_percentage = Column(Float, default=0.0, nullable=False)  # For sorting leaderboard
 
-    # Current streak (optional, v2 feature)
+    # Streak state, maintained incrementally in game completion order
     current_streak = Column(Integer, default=0, nullable=False)
+    longest_streak = Column(Integer, default=0, nullable=False)
+    last_scored_game_at = Column(DateTime, nullable=True)
 
     # Timestamps
     joined_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -19,6 +19,10 @@ class ScoreCorrectionRequest(BaseModel):
     reason: str = Field(..., min_length=1, max_length=500)
 
 
+class CompetitionRescoreRequest(BaseModel):
+    reason: str = Field(..., min_length=1, max_length=500)
+
+
 class WinnerDesignationRequest(BaseModel):
     winner_user_id: UUID4
     reason: str | None = Field(None, max_length=500)
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime
 
 from pydantic import UUID4, BaseModel
 
@@ -12,6 +12,8 @@ class ParticipantResponse(BaseModel):
     total_losses: int
     accuracy_percentage: float
     current_streak: int
+    longest_streak: int = 0
+    last_scored_game_at: datetime | None = None
     joined_at: datetime
     last_pick_at: datetime | None = None
 
@@ -28,12 +30,37 @@ class LeaderboardEntry(BaseModel):
     total_losses: int
     accuracy_percentage: float
     current_streak: int
+    longest_streak: int = 0
     is_current_user: bool = False
 
     class Config:
         from_attributes = True
 
 
+class LeaderboardHistoryPoint(BaseModel):
+    """One participant's standing at the end of a scoring day."""
+
+    day: date
+    total_points: int
+    rank: int
+    # Places gained since the previous snapshot (negative when dropping)
+    rank_change: int | None = None
+
+
+class LeaderboardHistoryEntry(BaseModel):
+    rank: int
+    user_id: UUID4
+    username: str
+    total_points: int
+
+
+class LeaderboardHistoryDay(BaseModel):
+    """The top of a competition's leaderboard at the end of a scoring day."""
+
+    day: date
+    entries: list[LeaderboardHistoryEntry]
+
+
 class ParticipantWithUserResponse(BaseModel):
     """Participant record joined with basic user info, used in admin views.
 
@@ -44,12 +71,14 @@ class ParticipantWithUserResponse(BaseModel):
     id: UUID4
     user_id: UUID4
     username: str
+    rank: int | None = None
     joined_at: datetime
     total_points: int
     total_wins: int
     total_losses: int
     accuracy_percentage: float
     current_streak: int
+    longest_streak: int = 0
 
     class Config:
         from_attributes = True
@@ -1,4 +1,7 @@
+import asyncio
 import logging
+import time
+from collections import defaultdict
 from datetime import datetime, timedelta
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -11,15 +14,23 @@ import app.services.pick_service as pick_service
 import app.services.user_service as user_service
 from app.core.config import settings
 from app.db.session import async_session
+from app.models.audit_log import AuditAction, AuditLog
 from app.models.competition import Competition, CompetitionStatus
 from app.models.game import Game, GameStatus
-from app.models.league import Team
-from app.services.score_service import score_picks_for_game
+from app.models.league import League, Team
+from app.models.participant import Participant
+from app.services import leaderboard_history, leaderboard_index, task_tracker
+from app.services.score_service import (
+    reconcile_participant_stats,
+    rescore_competition,
+    score_picks_for_games,
+)
 from app.services.sports_api.sports_service import sports_service
 from app.services.sync_service import (
     _apply_team_record,
     _find_or_create_team,
     _sync_game_for_competition,
+    fetch_schedule_range,
 )
 from app.services.ws_manager import ScoreManager
 
@@ -31,100 +42,126 @@ scheduler = AsyncIOScheduler()
 async def update_game_scores():
     """
     Background job to update game scores from external APIs.
+
+    Each league runs as its own pipeline (fetch live scores, apply them,
+    score newly final games, commit, refresh the leaderboard index and
+    publish over WebSocket), concurrently with the others and at most
+    SCORE_UPDATE_CONCURRENCY at a time, so a slow provider only delays its
+    own league. Competitions belong to a single league, so pipelines never
+    update the same participant rows.
     """
     logger.info(f"Running score update job at {datetime.utcnow()}")
 
-    async with async_session() as db:
-        try:
-            # Fetch games that need score updates
-            stmt = (
-                select(Game)
+    try:
+        async with async_session() as db:
+            active = await db.execute(
+                select(Game.id, League.name)
+                .join(Competition, Game.competition_id == Competition.id)
+                .join(League, Competition.league_id == League.id)
                 .where(Game.status.in_([GameStatus.SCHEDULED, GameStatus.IN_PROGRESS]))
-                .options(
-                    selectinload(Game.competition).selectinload(Competition.league),
-                    selectinload(Game.home_team),
-                    selectinload(Game.away_team),
-                )
             )
-            result = await db.execute(stmt)
-            games = result.scalars().all()
+            # FINAL games whose scoring failed in an earlier cycle are retried
+            # in their league's batch this cycle.
+            retries = await db.execute(
+                select(Game.id, League.name)
+                .join(Competition, Game.competition_id == Competition.id)
+                .join(League, Competition.league_id == League.id)
+                .where(Game.status == GameStatus.FINAL, Game.scoring_completed.is_(False))
+            )
+            games_by_league = defaultdict(list)
+            for game_id, league_name in active:
+                games_by_league[league_name].append(game_id)
+            retries_by_league = defaultdict(list)
+            for game_id, league_name in retries:
+                retries_by_league[league_name].append(game_id)
+    except Exception as e:
+        logger.error(f"Error in update_game_scores: {e!s}", exc_info=True)
+        return
+
+    if not games_by_league and not retries_by_league:
+        logger.debug("No active games to update")
+        return
+
+    semaphore = asyncio.Semaphore(settings.SCORE_UPDATE_CONCURRENCY)
+
+    async def _bounded(league_name):
+        async with semaphore:
+            await _update_league_scores(
+                league_name, games_by_league[league_name], retries_by_league[league_name]
+            )
 
-            if not games:
-                logger.debug("No active games to update")
-                return
+    leagues = sorted(games_by_league.keys() | retries_by_league.keys())
+    await asyncio.gather(*(_bounded(league_name) for league_name in leagues))
 
-            games = sorted(games, key=lambda g: g.id)
 
-            # Group games by league
-            games_by_league = {}
-            for game in games:
-                league_name = game.competition.league.name
-                if league_name not in games_by_league:
-                    games_by_league[league_name] = []
-                games_by_league[league_name].append(game)
+async def _update_league_scores(league_name, game_ids: list, retry_ids: list):
+    """One league's score pipeline, in its own session and transaction."""
+    started = time.perf_counter()
+    fetch_ms = None
+    async with async_session() as db:
+        try:
+            games = []
+            if game_ids:
+                result = await db.execute(
+                    select(Game).where(Game.id.in_(game_ids)).order_by(Game.id)
+                )
+                games = result.scalars().all()
+            games_to_score = []
+            if retry_ids:
+                result = await db.execute(select(Game).where(Game.id.in_(retry_ids)))
+                games_to_score = list(result.scalars().all())
 
             updated_games = []
-            for league_name, league_games in games_by_league.items():
+            unchanged = 0
+            if games:
                 try:
-                    live_scores = await sports_service.get_live_scores(league_name)
+                    fetch_started = time.perf_counter()
+                    live_scores = await sports_service.get_live_scores(league_name, revalidate=True)
+                    fetch_ms = (time.perf_counter() - fetch_started) * 1000
                     scores_by_id = {score.external_id: score for score in live_scores}
 
-                    for game in league_games:
+                    for game in games:
                         score_data = scores_by_id.get(game.external_id)
                         if not score_data:
                             continue
+                        if _score_fingerprint(game) == _score_fingerprint(game, score_data):
+                            # Nothing to write, invalidate or publish
+                            unchanged += 1
+                            continue
 
-                        game.status = GameStatus(score_data.status)
-                        game.home_team_score = score_data.home_score
-                        game.away_team_score = score_data.away_score
-
-                        if score_data.spread is not None:
-                            game.spread = score_data.spread
-                        if score_data.over_under is not None:
-                            game.over_under = score_data.over_under
-
-                        if game.status == GameStatus.FINAL:
-                            if (
-                                score_data.home_score is not None
-                                and score_data.away_score is not None
-                            ):
-                                if score_data.home_score > score_data.away_score:
-                                    game.winner_team_id = game.home_team_id
-                                elif score_data.away_score > score_data.home_score:
-                                    game.winner_team_id = game.away_team_id
-                                else:
-                                    game.winner_team_id = None
-                            else:
-                                game.winner_team_id = None
-                        elif game.status in [
-                            GameStatus.CANCELLED,
-                            GameStatus.POSTPONED,
-                            GameStatus.NO_RESULT,
-                        ]:
-                            game.winner_team_id = None
-
-                        game.updated_at = datetime.utcnow()
+                        _apply_live_score(game, score_data)
                         updated_games.append(game)
 
                         if game.status == GameStatus.FINAL and not game.scoring_completed:
-                            try:
-                                await score_picks_for_game(db, game)
-                                game.scoring_completed = True
-                            except Exception as score_err:
-                                # Keep the game FINAL — the API data is correct.
-                                # scoring_completed stays False so the next sync
-                                # cycle will retry automatically.
-                                logger.error(
-                                    f"Pick scoring failed for game {game.id}. "
-                                    f"Will retry on next sync cycle. Error: {score_err}",
-                                    exc_info=True,
-                                )
+                            games_to_score.append(game)
 
                 except Exception as e:
                     logger.error(f"Error updating scores for {league_name}: {e!s}")
-                    continue
+
+            if games_to_score:
+                try:
+                    # One batched pass per cycle so each participant's stats
+                    # are updated once, however many of their games went FINAL.
+                    async with db.begin_nested():
+                        summary = await score_picks_for_games(db, games_to_score)
+                    for game in games_to_score:
+                        game.scoring_completed = True
+                    logger.info(
+                        f"Scoring cycle ({league_name}): {summary['games']} games, "
+                        f"{summary['picks']} picks, {summary['participants']} participants"
+                    )
+                except Exception as score_err:
+                    # Keep the games FINAL — the API data is correct.
+                    # scoring_completed stays False so the next sync
+                    # cycle will retry automatically.
+                    logger.error(
+                        f"Pick scoring failed for games {[str(g.id) for g in games_to_score]}. "
+                        f"Will retry on next sync cycle. Error: {score_err}",
+                        exc_info=True,
+                    )
 
             await db.commit()
+            await leaderboard_index.refresh_pending(db)
 
             if updated_games:
                 ws_payload = [
@@ -141,20 +178,77 @@ async def update_game_scores():
                 ]
                 await ScoreManager.publish_score_update(ws_payload)
 
-            if updated_games and sports_service.redis_client:
-                competition_ids = {game.competition_id for game in updated_games}
-                for comp_id in competition_ids:
-                    cache_key = f"leaderboard:{comp_id}"
-                    try:
-                        sports_service.redis_client.delete(cache_key)
-                    except Exception as e:
-                        logger.error(f"Error invalidating cache: {e}")
+            fetch = f"{fetch_ms:.0f}ms" if fetch_ms is not None else "skipped"
+            logger.info(
+                f"Score pipeline {league_name}: {len(updated_games)} changed, "
+                f"{unchanged} unchanged, "
+                f"{len(games_to_score)} scored, fetch {fetch}, "
+                f"total {(time.perf_counter() - started) * 1000:.0f}ms"
+            )
 
         except Exception as e:
-            logger.error(f"Error in update_game_scores: {e!s}", exc_info=True)
+            logger.error(f"Error in update_game_scores for {league_name}: {e!s}", exc_info=True)
             await db.rollback()
 
 
+def _score_fingerprint(game: Game, score_data=None) -> tuple:
+    """The scoring-relevant state of ``game``, or what it becomes once ``score_data`` applies.
+
+    Covers status, scores, spread and over/under, read from the Game row so
+    the comparison is always against what is stored. Odds a provider omits
+    leave the stored ones in place, as in _apply_live_score.
+    """
+    if score_data is None:
+        return (
+            game.status,
+            game.home_team_score,
+            game.away_team_score,
+            game.spread,
+            game.over_under,
+        )
+    return (
+        GameStatus(score_data.status),
+        score_data.home_score,
+        score_data.away_score,
+        game.spread if score_data.spread is None else score_data.spread,
+        game.over_under if score_data.over_under is None else score_data.over_under,
+    )
+
+
+def _apply_live_score(game: Game, score_data) -> None:
+    """Copy a provider's live score onto ``game`` and settle the winner."""
+    game.status = GameStatus(score_data.status)
+    game.home_team_score = score_data.home_score
+    game.away_team_score = score_data.away_score
+
+    if score_data.spread is not None:
+        game.spread = score_data.spread
+    if score_data.over_under is not None:
+        game.over_under = score_data.over_under
+
+    if game.status == GameStatus.FINAL:
+        if game.end_time is None:
+            # First cycle seen as FINAL; orders streaks by completion
+            game.end_time = datetime.utcnow()
+        if score_data.home_score is not None and score_data.away_score is not None:
+            if score_data.home_score > score_data.away_score:
+                game.winner_team_id = game.home_team_id
+            elif score_data.away_score > score_data.home_score:
+                game.winner_team_id = game.away_team_id
+            else:
+                game.winner_team_id = None
+        else:
+            game.winner_team_id = None
+    elif game.status in [
+        GameStatus.CANCELLED,
+        GameStatus.POSTPONED,
+        GameStatus.NO_RESULT,
+    ]:
+        game.winner_team_id = None
+
+    game.updated_at = datetime.utcnow()
+
+
 async def wrap_update_competition_statuses():
     async with async_session() as db:
         try:
@@ -185,6 +279,73 @@ async def wrap_cleanup_pending_deletions():
             await db.rollback()
 
 
+async def wrap_reconcile_participant_stats():
+    """Repair any drift between incremental participant totals and pick history."""
+    async with async_session() as db:
+        try:
+            active_competitions = select(Competition.id).where(
+                Competition.status == CompetitionStatus.ACTIVE
+            )
+            repaired = await reconcile_participant_stats(
+                db, Participant.competition_id.in_(active_competitions)
+            )
+            await db.commit()
+            if repaired:
+                await leaderboard_index.refresh_participants(
+                    db, Participant.competition_id.in_(active_competitions)
+                )
+                logger.warning(f"Participant stats reconciliation repaired {repaired} rows")
+            else:
+                logger.info("Participant stats reconciliation found no drift")
+        except Exception as e:
+            logger.error(f"Error in reconcile_participant_stats: {e!s}", exc_info=True)
+            await db.rollback()
+
+
+async def wrap_take_leaderboard_snapshots():
+    """Record yesterday's points and ranks for competitions that scored games."""
+    async with async_session() as db:
+        try:
+            await leaderboard_history.take_snapshots(db, leaderboard_history.scoring_day())
+            await db.commit()
+        except Exception as e:
+            logger.error(f"Error in take_leaderboard_snapshots: {e!s}", exc_info=True)
+            await db.rollback()
+
+
+async def run_competition_rescore(task_id: str, competition_id, admin_user_id, reason: str):
+    """Tracked background task behind POST /admin/competitions/{id}/rescore.
+
+    Regrades the whole competition in one transaction and records an audit
+    log entry alongside it, reporting progress through the task tracker.
+    """
+
+    async def _report(stage, progress):
+        await task_tracker.update_task(task_id, status="running", stage=stage, progress=progress)
+
+    async with async_session() as db:
+        try:
+            summary = await rescore_competition(db, competition_id, on_stage=_report)
+            db.add(
+                AuditLog(
+                    admin_user_id=admin_user_id,
+                    action=AuditAction.COMPETITION_RESCORED,
+                    target_type="competition",
+                    target_id=competition_id,
+                    details={"task_id": task_id, "reason": reason, **summary},
+                )
+            )
+            await db.commit()
+            await leaderboard_index.rebuild(db, competition_id)
+            await task_tracker.update_task(
+                task_id, status="completed", stage="done", progress=100, result=summary
+            )
+        except Exception as e:
+            logger.error(f"Error rescoring competition {competition_id}: {e!s}", exc_info=True)
+            await db.rollback()
+            await task_tracker.update_task(task_id, status="failed", error=str(e))
+
+
 async def sync_games_from_api():
     """
     Import today's games from ESPN into the database for active competitions.
@@ -225,11 +386,9 @@ async def sync_games_from_api():
 
                 try:
                     today_bg = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-                    api_games = []
-                    for days_ahead in range(3):
-                        day = today_bg + timedelta(days=days_ahead)
-                        day_games = await sports_service.get_schedule(league_key, day, day)
-                        api_games.extend(day_games)
+                    api_games = await fetch_schedule_range(
+                        league_key, today_bg, today_bg + timedelta(days=2)
+                    )
 
                     if not api_games:
                         continue
@@ -288,6 +447,7 @@ async def sync_games_from_api():
                     continue
 
             await db.commit()
+            await leaderboard_index.refresh_pending(db)
             logger.info(f"Game sync completed: {total_created} created, {total_updated} updated")
 
         except Exception as e:
@@ -327,6 +487,23 @@ def start_background_jobs():
         replace_existing=True,
     )
 
+    scheduler.add_job(
+        wrap_reconcile_participant_stats,
+        trigger=IntervalTrigger(minutes=settings.STATS_RECONCILE_INTERVAL_MINUTES),
+        id="reconcile_participant_stats",
+        replace_existing=True,
+    )
+
+    scheduler.add_job(
+        wrap_take_leaderboard_snapshots,
+        trigger="cron",
+        hour=settings.LEADERBOARD_SNAPSHOT_HOUR_UTC,
+        minute=0,
+        timezone="UTC",
+        id="take_leaderboard_snapshots",
+        replace_existing=True,
+    )
+
     scheduler.add_job(
         wrap_cleanup_pending_deletions,
         trigger="cron",
@@ -1,7 +1,13 @@
+import asyncio
+import contextlib
 import logging
+import time
+from collections import deque
 from datetime import datetime
 from enum import Enum
 
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
 
@@ -57,6 +63,8 @@ class CircuitBreaker:
             result = await func(*args, **kwargs)
             self._on_success()
             return result
+        except CallSkippedError:
+            raise
         except Exception as e:
             self._on_failure()
             raise e
@@ -81,6 +89,8 @@ class CircuitBreaker:
             result = func(*args, **kwargs)
             self._on_success()
             return result
+        except CallSkippedError:
+            raise
         except Exception as e:
             self._on_failure()
             raise e
@@ -158,11 +168,224 @@ class CircuitBreakerOpenError(Exception):
     """Raised when circuit breaker is open"""
 
 
+class CallSkippedError(Exception):
+    """Raised by a call that chose not to run once admitted; the breaker records nothing.
+
+    Lets a call check something that costs, like a request budget, only
+    after the breaker has let it through.
+    """
+
+
+class SlidingWindowCircuitBreaker(CircuitBreaker):
+    """
+    Circuit breaker that trips on failure and slow-call rates over a time window.
+
+    Selected with CIRCUIT_BREAKER_MODE=sliding_window. Once at least
+    CIRCUIT_BREAKER_MIN_CALLS calls were made in the last
+    CIRCUIT_BREAKER_WINDOW_SECONDS, the breaker opens when the share that
+    failed reaches CIRCUIT_BREAKER_FAILURE_RATE, or the share slower than
+    CIRCUIT_BREAKER_SLOW_CALL_SECONDS reaches CIRCUIT_BREAKER_SLOW_CALL_RATE.
+
+    After timeout_seconds it goes HALF_OPEN and lets through at most
+    CIRCUIT_BREAKER_HALF_OPEN_CALLS trial calls at a time; that many
+    successes close it, and a failed or slow one reopens it. While the
+    background prober runs (``CircuitBreakerManager.start_prober``) the trial
+    calls are the breaker's ``probe_call``, a cheap fixed request set by
+    whoever created it, and callers are turned away until it has closed.
+    A probe that raises CallSkippedError (say, no request budget left) is
+    dropped without judging the breaker.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, timeout_seconds: int = 60):
+        super().__init__(name, failure_threshold, timeout_seconds)
+        # (monotonic time, failed, slow) of recent calls, oldest first
+        self.calls: deque[tuple[float, bool, bool]] = deque()
+        self.opened_at: datetime | None = None
+        self.half_open_in_flight = 0
+        self.half_open_successes = 0
+        self.probed_in_background = False
+        self.probes = {"succeeded": 0, "failed": 0, "skipped": 0}
+        # No-argument coroutine function probe() calls; without one the
+        # breaker recovers through callers' trial calls
+        self.probe_call = None
+
+    async def async_call(self, func, *args, **kwargs):
+        return await self._async_call(func, args, kwargs, probing=False)
+
+    def call(self, func, *args, **kwargs):
+        trial = self._admit(probing=False)
+        started = time.monotonic()
+        try:
+            result = func(*args, **kwargs)
+        except CallSkippedError:
+            raise
+        except Exception:
+            self._record(started, failed=True, trial=trial)
+            raise
+        finally:
+            if trial:
+                self.half_open_in_flight -= 1
+        self._record(started, failed=False, trial=trial)
+        return result
+
+    async def probe(self) -> bool:
+        """Make ``probe_call`` trial calls while the breaker is due one; True once it closes."""
+        if self.state == CircuitState.CLOSED or self.probe_call is None:
+            return False
+        while self.state != CircuitState.CLOSED:
+            try:
+                await self._async_call(self.probe_call, (), {}, probing=True)
+            except CircuitBreakerOpenError:
+                # Not due yet, or the trial slots are taken
+                return False
+            except CallSkippedError as e:
+                self.probes["skipped"] += 1
+                logger.info(f"Circuit breaker '{self.name}': Probe skipped - {e!s}")
+                return False
+            except Exception as e:
+                self.probes["failed"] += 1
+                logger.info(f"Circuit breaker '{self.name}': Probe failed - {e!s}")
+                return False
+            if self.state == CircuitState.OPEN:
+                # Answered, but too slowly
+                self.probes["failed"] += 1
+                return False
+            self.probes["succeeded"] += 1
+        logger.info(f"Circuit breaker '{self.name}': Probes successful - circuit CLOSED")
+        return True
+
+    async def _async_call(self, func, args, kwargs, probing: bool):
+        trial = self._admit(probing)
+        started = time.monotonic()
+        try:
+            result = await func(*args, **kwargs)
+        except CallSkippedError:
+            raise
+        except Exception:
+            self._record(started, failed=True, trial=trial)
+            raise
+        finally:
+            if trial:
+                self.half_open_in_flight -= 1
+        self._record(started, failed=False, trial=trial)
+        return result
+
+    def _admit(self, probing: bool) -> bool:
+        """Raise unless a call may go through now; True if it is a HALF_OPEN trial."""
+        if self.state == CircuitState.CLOSED:
+            return False
+        # With background probing, only the prober makes trial calls
+        may_try = probing or not (self.probed_in_background and self.probe_call is not None)
+        if may_try and self.state == CircuitState.OPEN and self._should_attempt_reset():
+            logger.info(f"Circuit breaker '{self.name}': Attempting reset (half-open)")
+            self.state = CircuitState.HALF_OPEN
+            self.half_open_successes = 0
+        if (
+            may_try
+            and self.state == CircuitState.HALF_OPEN
+            and self.half_open_in_flight < settings.CIRCUIT_BREAKER_HALF_OPEN_CALLS
+        ):
+            self.half_open_in_flight += 1
+            return True
+        time_remaining = self._time_until_reset()
+        raise CircuitBreakerOpenError(
+            f"Circuit breaker '{self.name}' is {self.state.value.upper()}. "
+            f"Retry in {time_remaining}s"
+        )
+
+    def _record(self, started: float, failed: bool, trial: bool):
+        now = time.monotonic()
+        slow = now - started >= settings.CIRCUIT_BREAKER_SLOW_CALL_SECONDS
+        if failed:
+            self.last_failure_time = datetime.utcnow()
+        else:
+            self.last_success_time = datetime.utcnow()
+
+        if trial:
+            if failed or slow:
+                self._trip()
+            else:
+                self.half_open_successes += 1
+                if self.half_open_successes >= settings.CIRCUIT_BREAKER_HALF_OPEN_CALLS:
+                    logger.info(f"Circuit breaker '{self.name}': Test successful - CLOSING circuit")
+                    self._close()
+            return
+        if self.state != CircuitState.CLOSED:
+            # Admitted before the breaker opened; the window was already judged
+            return
+
+        self.calls.append((now, failed, slow))
+        while self.calls[0][0] < now - settings.CIRCUIT_BREAKER_WINDOW_SECONDS:
+            self.calls.popleft()
+        self.failure_count = sum(1 for _, call_failed, _ in self.calls if call_failed)
+        if len(self.calls) < settings.CIRCUIT_BREAKER_MIN_CALLS:
+            return
+        slow_calls = sum(1 for _, _, call_slow in self.calls if call_slow)
+        if (
+            self.failure_count / len(self.calls) >= settings.CIRCUIT_BREAKER_FAILURE_RATE
+            or slow_calls / len(self.calls) >= settings.CIRCUIT_BREAKER_SLOW_CALL_RATE
+        ):
+            self._trip()
+
+    def _trip(self):
+        """Open the breaker (again) for timeout_seconds"""
+        calls = len(self.calls)
+        slow_calls = sum(1 for _, _, call_slow in self.calls if call_slow)
+        self.state = CircuitState.OPEN
+        self.opened_at = datetime.utcnow()
+        logger.error(
+            f"Circuit breaker '{self.name}': TRIPPED - {self.failure_count}/{calls} failed, "
+            f"{slow_calls}/{calls} slow in the last {settings.CIRCUIT_BREAKER_WINDOW_SECONDS}s. "
+            f"Circuit will remain open for {self.timeout_seconds}s"
+        )
+
+    def _close(self):
+        self.state = CircuitState.CLOSED
+        self.calls.clear()
+        self.failure_count = 0
+        self.opened_at = None
+
+    def _should_attempt_reset(self) -> bool:
+        if self.opened_at is None:
+            return True
+        return (datetime.utcnow() - self.opened_at).total_seconds() >= self.timeout_seconds
+
+    def _time_until_reset(self) -> int:
+        if self.opened_at is None:
+            return 0
+        time_since_open = (datetime.utcnow() - self.opened_at).total_seconds()
+        return max(0, int(self.timeout_seconds - time_since_open))
+
+    def reset(self):
+        super().reset()
+        self._close()
+
+    def get_status(self) -> dict:
+        status = super().get_status()
+        calls = len(self.calls)
+        slow_calls = sum(1 for _, _, call_slow in self.calls if call_slow)
+        status.update(
+            {
+                "mode": "sliding_window",
+                "window": {
+                    "calls": calls,
+                    "failure_rate": round(self.failure_count / calls, 3) if calls else None,
+                    "slow_call_rate": round(slow_calls / calls, 3) if calls else None,
+                },
+                "half_open_in_flight": self.half_open_in_flight,
+                "probed_in_background": self.probed_in_background,
+                "probes": dict(self.probes),
+            }
+        )
+        return status
+
+
 class CircuitBreakerManager:
     """Manages multiple circuit breakers for different APIs"""
 
     def __init__(self):
         self.breakers: dict[str, CircuitBreaker] = {}
+        self._prober_task: asyncio.Task | None = None
 
     def get_breaker(
         self,
@@ -172,11 +395,20 @@ class CircuitBreakerManager:
     ) -> CircuitBreaker:
         """Get or create a circuit breaker"""
         if name not in self.breakers:
-            self.breakers[name] = CircuitBreaker(
-                name=name,
-                failure_threshold=failure_threshold,
-                timeout_seconds=timeout_seconds,
-            )
+            if settings.CIRCUIT_BREAKER_MODE == "sliding_window":
+                breaker = SlidingWindowCircuitBreaker(
+                    name=name,
+                    failure_threshold=failure_threshold,
+                    timeout_seconds=timeout_seconds,
+                )
+                breaker.probed_in_background = self._prober_task is not None
+            else:
+                breaker = CircuitBreaker(
+                    name=name,
+                    failure_threshold=failure_threshold,
+                    timeout_seconds=timeout_seconds,
+                )
+            self.breakers[name] = breaker
         return self.breakers[name]
 
     def reset_all(self):
@@ -188,6 +420,51 @@ class CircuitBreakerManager:
         """Get status of all circuit breakers"""
         return {name: breaker.get_status() for name, breaker in self.breakers.items()}
 
+    async def start_prober(self):
+        """Probe open sliding-window breakers in the background.
+
+        Runs in each process that calls the providers (the API and the
+        worker), so recovery checks never hold up a caller.
+        """
+        if self._prober_task is None and settings.CIRCUIT_BREAKER_MODE == "sliding_window":
+            self._prober_task = asyncio.create_task(self._probe_loop())
+            self._set_background_probing(True)
+            logger.info("Circuit breaker prober started")
+
+    async def stop_prober(self):
+        if self._prober_task:
+            self._prober_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._prober_task
+            self._prober_task = None
+            self._set_background_probing(False)
+            logger.info("Circuit breaker prober stopped")
+
+    async def probe_all(self):
+        """Probe every open sliding-window breaker that is due a trial, concurrently."""
+        breakers = [
+            breaker
+            for breaker in self.breakers.values()
+            if isinstance(breaker, SlidingWindowCircuitBreaker)
+            and breaker.state != CircuitState.CLOSED
+        ]
+        results = await asyncio.gather(
+            *(breaker.probe() for breaker in breakers), return_exceptions=True
+        )
+        for breaker, result in zip(breakers, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(f"Circuit breaker '{breaker.name}': Probe error - {result!s}")
+
+    async def _probe_loop(self):
+        while True:
+            await asyncio.sleep(settings.CIRCUIT_BREAKER_PROBE_INTERVAL_SECONDS)
+            await self.probe_all()
+
+    def _set_background_probing(self, enabled: bool):
+        for breaker in self.breakers.values():
+            if isinstance(breaker, SlidingWindowCircuitBreaker):
+                breaker.probed_in_background = enabled
+
 
 # Global circuit breaker manager
 circuit_breaker_manager = CircuitBreakerManager()
@@ -0,0 +1,284 @@
+"""Read-through cache for serialized leaderboard responses.
+
+Every cached window of a competition's leaderboard lives in one Redis hash,
+``leaderboard:{competition_id}``, so deleting that key (as the scoring path
+does) drops every sort order and page at once. Each window is stored as two
+fields, ``{variant}:etag`` and ``{variant}:body``, so conditional requests
+can be answered from the ETag alone. The hash expires after
+``CACHE_LEADERBOARD_SECONDS``.
+
+Cached bodies are user-agnostic (``is_current_user`` is always false); the
+endpoint marks the caller's row and derives a per-user strong ETag from the
+cached one.
+
+A render can race an invalidation: a window read before scoring committed
+must not be written back after the hash was dropped. ``invalidate`` bumps
+``leaderboard_generation:{competition_id}`` along with the delete; the
+endpoint reads the generation before rendering and ``store`` writes only if
+it is unchanged, checked in the same Lua script as the write.
+
+Hit, miss, 304 and invalidation counts are kept in the Redis hash
+``leaderboard_cache:stats`` so every process contributes to the same totals.
+
+Tests swap in ``InMemoryLeaderboardCache`` via ``set_backend``.
+"""
+
+import hashlib
+import logging
+import time
+from collections import Counter
+
+from app.core.config import settings
+from app.db.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+STATS_KEY = "leaderboard_cache:stats"
+COUNTERS = ("hits", "misses", "not_modified", "invalidations")
+
+# Generations outlive any render by far; expiring them keeps idle
+# competitions from leaving keys behind
+GENERATION_TTL_SECONDS = 7 * 24 * 3600
+
+# Write a window unless the competition was invalidated since the render began.
+# KEYS: cache hash, generation. ARGV: expected generation, ttl, field, value, ...
+# Returns 1 if written, 0 if skipped.
+_PUT_SCRIPT = """
+if tonumber(redis.call("get", KEYS[2]) or "0") ~= tonumber(ARGV[1]) then
+    return 0
+end
+for i = 3, #ARGV, 2 do
+    redis.call("hset", KEYS[1], ARGV[i], ARGV[i + 1])
+end
+-- Only a new hash gets an expiry, so busy keys still age out
+if redis.call("ttl", KEYS[1]) < 0 then
+    redis.call("expire", KEYS[1], ARGV[2])
+end
+return 1
+"""
+
+
+def cache_key(competition_id) -> str:
+    return f"leaderboard:{competition_id}"
+
+
+def generation_key(competition_id) -> str:
+    return f"leaderboard_generation:{competition_id}"
+
+
+def body_etag(body: str) -> str:
+    """Content hash of a cached body."""
+    return hashlib.sha256(body.encode()).hexdigest()[:32]
+
+
+def user_etag(base_etag: str, user_id) -> str:
+    """Strong ETag for the body as rendered for ``user_id``."""
+    return '"' + hashlib.sha256(f"{base_etag}:{user_id}".encode()).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """True if an If-None-Match header matches ``etag`` (RFC 9110 weak comparison)."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+class InMemoryLeaderboardCache:
+    """Process-local stand-in for the Redis cache, used by tests."""
+
+    def __init__(self):
+        self._hashes: dict[str, tuple[float, dict[str, str]]] = {}
+        self._generations: Counter = Counter()
+        self._stats: Counter = Counter()
+
+    def _live(self, key: str) -> dict[str, str]:
+        expires_at, fields = self._hashes.get(key, (0.0, {}))
+        return fields if expires_at > time.monotonic() else {}
+
+    async def get(self, key: str, *fields: str) -> list[str | None]:
+        live = self._live(key)
+        return [live.get(field) for field in fields]
+
+    async def generation(self, generation_key: str) -> int:
+        return self._generations[generation_key]
+
+    async def put(
+        self, key: str, generation_key: str, generation: int, mapping: dict[str, str], ttl: int
+    ) -> bool:
+        if self._generations[generation_key] != generation:
+            return False
+        live = self._live(key)
+        expires_at = self._hashes[key][0] if live else time.monotonic() + ttl
+        self._hashes[key] = (expires_at, {**live, **mapping})
+        return True
+
+    async def delete(self, key: str, generation_key: str) -> None:
+        self._hashes.pop(key, None)
+        self._generations[generation_key] += 1
+
+    async def incr(self, counter: str) -> None:
+        self._stats[counter] += 1
+
+    async def counters(self) -> dict[str, int]:
+        return dict(self._stats)
+
+
+class RedisLeaderboardCache:
+    """Cache stored in Redis hashes through the shared client (``get_redis``)."""
+
+    @property
+    def _client(self):
+        return get_redis()
+
+    async def get(self, key: str, *fields: str) -> list[str | None]:
+        return await self._client.hmget(key, list(fields))
+
+    async def generation(self, generation_key: str) -> int:
+        return int(await self._client.get(generation_key) or 0)
+
+    async def put(
+        self, key: str, generation_key: str, generation: int, mapping: dict[str, str], ttl: int
+    ) -> bool:
+        fields = [item for pair in mapping.items() for item in pair]
+        written = await self._client.eval(
+            _PUT_SCRIPT, 2, key, generation_key, generation, ttl, *fields
+        )
+        return bool(written)
+
+    async def delete(self, key: str, generation_key: str) -> None:
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.incr(generation_key)
+            pipe.expire(generation_key, GENERATION_TTL_SECONDS)
+            await pipe.execute()
+
+    async def incr(self, counter: str) -> None:
+        await self._client.hincrby(STATS_KEY, counter, 1)
+
+    async def counters(self) -> dict[str, int]:
+        return {k: int(v) for k, v in (await self._client.hgetall(STATS_KEY)).items()}
+
+
+_backend = None
+_retry_at = 0.0
+
+# After a Redis error, bypass the cache for a while instead of paying the
+# connect timeout on every request.
+REDIS_RETRY_SECONDS = 30
+
+
+def get_backend():
+    """Return the active cache backend, creating the Redis one on first use."""
+    global _backend
+    if _backend is None:
+        _backend = RedisLeaderboardCache()
+    return _backend
+
+
+def set_backend(backend) -> None:
+    """Replace the cache backend (tests use ``InMemoryLeaderboardCache``)."""
+    global _backend, _retry_at
+    _backend = backend
+    _retry_at = 0.0
+
+
+async def _call(action: str, method: str, *args, default=None):
+    """Run a backend call, degrading to ``default`` while Redis is failing."""
+    global _retry_at
+    if time.monotonic() < _retry_at:
+        return default
+    try:
+        return await getattr(get_backend(), method)(*args)
+    except Exception as e:
+        _retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+        logger.warning(f"Leaderboard cache {action} failed, bypassing cache: {e}")
+        return default
+
+
+async def get_etag(competition_id, variant: str) -> str | None:
+    """Base ETag of a cached window, or None if it is not cached."""
+    (etag,) = await _call(
+        "read", "get", cache_key(competition_id), f"{variant}:etag", default=[None]
+    )
+    return etag
+
+
+async def get_body(competition_id, variant: str) -> tuple[str, str] | None:
+    """``(base_etag, body)`` of a cached window, or None on a miss."""
+    etag, body = await _call(
+        "read",
+        "get",
+        cache_key(competition_id),
+        f"{variant}:etag",
+        f"{variant}:body",
+        default=[None, None],
+    )
+    if etag is None or body is None:
+        return None
+    return etag, body
+
+
+async def generation(competition_id) -> int | None:
+    """Current cache generation of a competition; read before rendering a window.
+
+    None while the cache is being bypassed, in which case nothing is stored.
+    """
+    return await _call("read", "generation", generation_key(competition_id))
+
+
+async def store(competition_id, variant: str, body: str, generation: int | None) -> str:
+    """Cache a serialized window and return its base ETag.
+
+    Skipped if the competition was invalidated after ``generation`` was read,
+    since the body may predate that change.
+    """
+    etag = body_etag(body)
+    if generation is None:
+        return etag
+    written = await _call(
+        "write",
+        "put",
+        cache_key(competition_id),
+        generation_key(competition_id),
+        generation,
+        {f"{variant}:etag": etag, f"{variant}:body": body},
+        settings.CACHE_LEADERBOARD_SECONDS,
+    )
+    if written is False:
+        logger.debug(f"Leaderboard {competition_id} changed while rendering; not cached")
+    return etag
+
+
+async def record(counter: str) -> None:
+    """Count a hit, miss, 304 or invalidation for monitoring."""
+    await _call("counter", "incr", counter)
+
+
+async def invalidate(competition_id) -> None:
+    """Drop every cached window of a competition.
+
+    Always attempted, even while reads are bypassing the cache, so a Redis
+    blip never leaves stale leaderboards behind.
+    """
+    try:
+        await get_backend().delete(cache_key(competition_id), generation_key(competition_id))
+    except Exception as e:
+        logger.error(f"Error invalidating cache: {e}")
+        return
+    await record("invalidations")
+
+
+async def get_stats() -> dict:
+    """Counters plus hit ratio, for the monitoring endpoint."""
+    try:
+        counters = await get_backend().counters()
+    except Exception as e:
+        logger.warning(f"Leaderboard cache stats unavailable: {e}")
+        return {"status": "unavailable"}
+    stats = {name: counters.get(name, 0) for name in COUNTERS}
+    served = stats["hits"] + stats["not_modified"]
+    lookups = served + stats["misses"]
+    stats["hit_ratio"] = round(served / lookups, 4) if lookups else None
+    stats["ttl_seconds"] = settings.CACHE_LEADERBOARD_SECONDS
+    return stats
@@ -0,0 +1,181 @@
+"""Daily leaderboard snapshots for rank movement and points-over-time charts.
+
+After each scoring day the snapshot job writes every participant's points
+and points-leaderboard rank as of the end of that day into
+``leaderboard_snapshots`` with a single ``INSERT ... SELECT`` per run. A
+game's points belong to the day it was scheduled, so the totals are the
+current ones less whatever picks on games scheduled after the day have
+earned since; wins, losses and accuracy, which break rank ties, are rolled
+back the same way. Only competitions that finished scoring a game scheduled
+that day get a row, so quiet days cost nothing; re-running a day overwrites
+it.
+
+Reads are single range scans: one participant's series over the primary key
+``(competition_id, user_id, day)``, a competition's over
+``(competition_id, day, rank, user_id)``.
+"""
+
+import logging
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy import Float, and_, case, cast, exists, func, literal, or_, select
+from sqlalchemy.dialects.postgresql import insert
+
+from app.core.config import settings
+from app.models.competition import Competition, CompetitionStatus
+from app.models.game import Game
+from app.models.leaderboard_snapshot import LeaderboardSnapshot
+from app.models.participant import Participant
+from app.models.pick import Pick
+from app.services import ranking
+
+logger = logging.getLogger(__name__)
+
+
+def scoring_day(now: datetime | None = None) -> date:
+    """The (UTC) day a snapshot run at ``now`` closes out.
+
+    The job runs at LEADERBOARD_SNAPSHOT_HOUR_UTC, once the previous day's
+    late games have gone final, so it always snapshots yesterday. Games
+    scheduled since midnight are left out of that snapshot.
+    """
+    now = now or datetime.utcnow()
+    return (now - timedelta(days=1)).date()
+
+
+async def take_snapshots(db, day: date) -> int:
+    """Snapshot every competition that scored a game scheduled on ``day``.
+
+    Returns the number of rows written. The caller commits.
+    """
+    day_start = datetime.combine(day, time.min)
+    day_end = day_start + timedelta(days=1)
+    scored_that_day = exists().where(
+        and_(
+            Game.competition_id == Participant.competition_id,
+            Game.scoring_completed.is_(True),
+            Game.scheduled_start_time >= day_start,
+            Game.scheduled_start_time < day_end,
+        )
+    )
+    # Completed competitions still get their final day
+    live_competitions = select(Competition.id).where(
+        or_(Competition.status == CompetitionStatus.ACTIVE, Competition.end_date >= day_start)
+    )
+    # What picks on games scheduled after the day have added since
+    later = (
+        select(
+            Pick.user_id,
+            Pick.competition_id,
+            func.sum(Pick.points_earned).label("points"),
+            func.count().filter(Pick.is_correct.is_(True)).label("wins"),
+            func.count().filter(Pick.is_correct.is_(False)).label("losses"),
+        )
+        .join(Game, Game.id == Pick.game_id)
+        .where(Pick.is_correct.isnot(None), Game.scheduled_start_time >= day_end)
+        .group_by(Pick.user_id, Pick.competition_id)
+        .subquery()
+    )
+    wins = Participant.total_wins - func.coalesce(later.c.wins, 0)
+    decided = wins + Participant.total_losses - func.coalesce(later.c.losses, 0)
+    last_pick_before_end = (
+        select(func.max(Pick.created_at))
+        .where(
+            Pick.user_id == Participant.user_id,
+            Pick.competition_id == Participant.competition_id,
+            Pick.created_at < day_end,
+        )
+        .scalar_subquery()
+    )
+    as_of = (
+        select(
+            Participant.competition_id,
+            Participant.user_id,
+            (Participant.total_points - func.coalesce(later.c.points, 0)).label("total_points"),
+            wins.label("total_wins"),
+            case(
+                (later.c.user_id.is_(None), Participant.accuracy_percentage),
+                (decided > 0, cast(wins, Float) / decided * 100.0),
+                else_=0.0,
+            ).label("accuracy_percentage"),
+            case(
+                (Participant.last_pick_at < day_end, Participant.last_pick_at),
+                else_=last_pick_before_end,
+            ).label("last_pick_at"),
+        )
+        .outerjoin(
+            later,
+            and_(
+                later.c.user_id == Participant.user_id,
+                later.c.competition_id == Participant.competition_id,
+            ),
+        )
+        .where(Participant.competition_id.in_(live_competitions), scored_that_day)
+        .subquery()
+    )
+    rows = select(
+        as_of.c.competition_id,
+        as_of.c.user_id,
+        literal(day).label("day"),
+        as_of.c.total_points,
+        ranking.rank_column("points", partition_by=as_of.c.competition_id, source=as_of.c),
+    )
+
+    statement = insert(LeaderboardSnapshot).from_select(
+        ["competition_id", "user_id", "day", "total_points", "rank"], rows
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=["competition_id", "user_id", "day"],
+        set_={"total_points": statement.excluded.total_points, "rank": statement.excluded.rank},
+    )
+    result = await db.execute(statement)
+    logger.info(f"Wrote {result.rowcount} leaderboard snapshot rows for {day}")
+    return result.rowcount
+
+
+def participant_series_query(competition_id, user_id, start: date, end: date):
+    """SELECT of ``(day, total_points, rank)`` for one participant, oldest first."""
+    return (
+        select(LeaderboardSnapshot.day, LeaderboardSnapshot.total_points, LeaderboardSnapshot.rank)
+        .where(
+            LeaderboardSnapshot.competition_id == competition_id,
+            LeaderboardSnapshot.user_id == user_id,
+            LeaderboardSnapshot.day.between(start, end),
+        )
+        .order_by(LeaderboardSnapshot.day)
+    )
+
+
+def competition_series_query(competition_id, start: date, end: date, top: int):
+    """SELECT of ``(day, rank, user_id, total_points)`` for the top ``top`` ranks per day."""
+    return (
+        select(
+            LeaderboardSnapshot.day,
+            LeaderboardSnapshot.rank,
+            LeaderboardSnapshot.user_id,
+            LeaderboardSnapshot.total_points,
+        )
+        .where(
+            LeaderboardSnapshot.competition_id == competition_id,
+            LeaderboardSnapshot.day.between(start, end),
+            LeaderboardSnapshot.rank <= top,
+        )
+        .order_by(LeaderboardSnapshot.day, LeaderboardSnapshot.rank, LeaderboardSnapshot.user_id)
+    )
+
+
+async def participant_series(db, competition_id, user_id, start: date, end: date):
+    result = await db.execute(participant_series_query(competition_id, user_id, start, end))
+    return result.all()
+
+
+async def competition_series(db, competition_id, start: date, end: date, top: int):
+    result = await db.execute(competition_series_query(competition_id, start, end, top))
+    return result.all()
+
+
+def default_range(end: date | None, start: date | None) -> tuple[date, date]:
+    """Fill in a missing range end (today) and start (LEADERBOARD_HISTORY_DAYS earlier)."""
+    end = end or datetime.utcnow().date()
+    start = start or end - timedelta(days=settings.LEADERBOARD_HISTORY_DAYS - 1)
+    return start, end
@@ -0,0 +1,537 @@
+"""Leaderboard index kept in Redis sorted sets.
+
+Each competition has one sorted set per leaderboard sort key plus a hash
+holding each participant's current stats:
+
+    leaderboard_index:{competition_id}:points    ZSET sort member per participant
+    leaderboard_index:{competition_id}:accuracy  ZSET
+    leaderboard_index:{competition_id}:wins      ZSET
+    leaderboard_index:{competition_id}:streak    ZSET
+    leaderboard_index:{competition_id}:entries   HASH user_id -> JSON stats
+    leaderboard_index:{competition_id}:built     marker set by a full rebuild
+
+Every member has score 0 and is a fixed-width string encoding the
+participant's rank keys (``ranking.rank_keys``, tie-breakers included) and
+user id, so ``ZREVRANGE`` returns exactly the order the database ranks by.
+
+The scoring path pushes the participants it touched into the index after
+committing. Membership changes (join, leave, removal) invalidate the index and
+the next read rebuilds it from the database. Every change also drops the
+competition's cached leaderboard responses (``leaderboard_cache``). Any Redis failure falls back to
+ranking straight from the database, so the index is never a source of truth.
+
+Tests swap in ``InMemoryLeaderboardBackend`` via ``set_backend``.
+"""
+
+import base64
+import json
+import logging
+import struct
+import time
+from collections import defaultdict
+from datetime import UTC, datetime
+from typing import Any
+
+from redis.exceptions import WatchError
+from sqlalchemy import and_, exists, select
+
+from app.core.config import settings
+from app.db.redis import get_redis
+from app.models.participant import Participant
+from app.models.pick import Pick
+from app.services import leaderboard_cache, ranking
+
+logger = logging.getLogger(__name__)
+
+SORT_KEYS = ("points", "accuracy", "wins", "streak")
+
+STAT_FIELDS = (
+    "total_points",
+    "total_wins",
+    "total_losses",
+    "accuracy_percentage",
+    "current_streak",
+    "longest_streak",
+)
+
+# Stored with the stats so tie-breaks on pick time need no database read
+ORDER_FIELDS = ("last_pick_at",)
+
+# After a Redis error, skip the index for a while instead of paying the
+# connect timeout on every request.
+REDIS_RETRY_SECONDS = 30
+
+# Session.info key holding games scored in the current transaction
+PENDING_GAMES_KEY = "leaderboard_index_pending_games"
+
+
+def _encode_int(value: int) -> str:
+    return f"{value + 10**9:010d}"
+
+
+def _encode_float(value: float) -> str:
+    # IEEE 754 bits, adjusted so byte order matches numeric order
+    (bits,) = struct.unpack(">Q", struct.pack(">d", value))
+    bits = bits ^ 0xFFFFFFFFFFFFFFFF if bits >> 63 else bits | 1 << 63
+    return f"{bits:016x}"
+
+
+def _encode_pick_time(value: str | None) -> str:
+    # Earlier picks sort higher; participants who never picked sort last
+    if value is None:
+        return "0" * 16
+    picked_at = datetime.fromisoformat(value)
+    if picked_at.tzinfo is None:
+        picked_at = picked_at.replace(tzinfo=UTC)
+    micros = int(picked_at.timestamp() * 1_000_000)
+    return f"{10**16 - micros:016d}"
+
+
+_INVERT_HEX = str.maketrans("0123456789abcdef", "fedcba9876543210")
+
+
+def sort_member(sort_by: str, user_id: str, stats: dict[str, Any]) -> str:
+    """Sorted-set member for a participant under ``sort_by``.
+
+    Members compare byte-wise in leaderboard order: each rank key is encoded
+    so that better values sort higher, then the inverted user id breaks the
+    remaining ties ascending, as ``ranking.order_by`` does. The plain user id
+    follows the last ``:`` so it can be read back.
+    """
+    parts = []
+    for column, _ in ranking.rank_keys(sort_by):
+        value = stats.get(column)
+        if column == "last_pick_at":
+            parts.append(_encode_pick_time(value))
+        elif column == "accuracy_percentage":
+            parts.append(_encode_float(value))
+        else:
+            parts.append(_encode_int(value))
+    parts.append(user_id.replace("-", "").translate(_INVERT_HEX))
+    return ".".join(parts) + ":" + user_id
+
+
+def member_user_id(member: str) -> str:
+    return member.rsplit(":", 1)[1]
+
+
+def tie_group(sort_by: str, user_id: str, stats: dict[str, Any]) -> str:
+    """The rank-key prefix of a participant's member, shared by everyone tied with them."""
+    member = sort_member(sort_by, user_id, stats)
+    return member[: member.rindex(".")]
+
+
+def _above_tie_group(group: str) -> str:
+    # Members of the group continue with "." after the prefix; "/" sorts just
+    # after it, so every member at or above this bound is in a better group
+    return group + "/"
+
+
+def order_entries(entries: dict[str, dict[str, Any]], sort_by: str) -> list[tuple[str, dict]]:
+    """Order entries exactly like ZREVRANGE over ``sort_member`` members."""
+    return sorted(
+        entries.items(),
+        key=lambda item: sort_member(sort_by, item[0], item[1]),
+        reverse=True,
+    )
+
+
+class InMemoryLeaderboardBackend:
+    """Process-local stand-in for the Redis index, used by tests."""
+
+    def __init__(self):
+        self._entries: dict[str, dict[str, dict[str, Any]]] = defaultdict(dict)
+        self._built: set[str] = set()
+
+    async def read_window(self, competition_id: str, sort_by: str, start: int, stop: int):
+        if competition_id not in self._built:
+            return None
+        ordered = order_entries(self._entries[competition_id], sort_by)
+        end = None if stop < 0 else stop + 1
+        rows = [(start + i, uid, stats) for i, (uid, stats) in enumerate(ordered[start:end])]
+        return rows, len(ordered)
+
+    async def rank(self, competition_id: str, sort_by: str, user_id: str):
+        if competition_id not in self._built:
+            return False, None
+        ordered = [uid for uid, _ in order_entries(self._entries[competition_id], sort_by)]
+        return True, ordered.index(user_id) if user_id in ordered else None
+
+    async def seek(self, competition_id: str, sort_by: str, member: str):
+        if competition_id not in self._built:
+            return False, None
+        entries = self._entries[competition_id]
+        return True, sum(
+            1 for uid, stats in entries.items() if sort_member(sort_by, uid, stats) >= member
+        )
+
+    async def replace(self, competition_id: str, entries: dict[str, dict[str, Any]]) -> None:
+        self._entries[competition_id] = dict(entries)
+        self._built.add(competition_id)
+
+    async def upsert(self, competition_id: str, entries: dict[str, dict[str, Any]]) -> None:
+        self._entries[competition_id].update(entries)
+
+    async def invalidate(self, competition_id: str) -> None:
+        self._entries.pop(competition_id, None)
+        self._built.discard(competition_id)
+
+
+class RedisLeaderboardBackend:
+    """Sorted-set index stored in Redis through the shared client (``get_redis``)."""
+
+    @property
+    def _client(self):
+        return get_redis()
+
+    @staticmethod
+    def _key(competition_id: str, suffix: str) -> str:
+        return f"leaderboard_index:{competition_id}:{suffix}"
+
+    def _all_keys(self, competition_id: str) -> list[str]:
+        return [self._key(competition_id, s) for s in (*SORT_KEYS, "entries", "built")]
+
+    async def read_window(self, competition_id: str, sort_by: str, start: int, stop: int):
+        async with self._client.pipeline(transaction=False) as pipe:
+            pipe.exists(self._key(competition_id, "built"))
+            pipe.zcard(self._key(competition_id, sort_by))
+            pipe.zrevrange(self._key(competition_id, sort_by), start, stop)
+            built, total, members = await pipe.execute()
+        if not built:
+            return None
+        user_ids = [member_user_id(member) for member in members]
+        if not user_ids:
+            return [], total
+        raw = await self._client.hmget(self._key(competition_id, "entries"), user_ids)
+        rows = [
+            (start + i, uid, json.loads(stats))
+            for i, (uid, stats) in enumerate(zip(user_ids, raw, strict=True))
+            if stats
+        ]
+        return rows, total
+
+    async def rank(self, competition_id: str, sort_by: str, user_id: str):
+        async with self._client.pipeline(transaction=False) as pipe:
+            pipe.exists(self._key(competition_id, "built"))
+            pipe.hget(self._key(competition_id, "entries"), user_id)
+            built, stats = await pipe.execute()
+        if not built or not stats:
+            return bool(built), None
+        member = sort_member(sort_by, user_id, json.loads(stats))
+        return True, await self._client.zrevrank(self._key(competition_id, sort_by), member)
+
+    async def seek(self, competition_id: str, sort_by: str, member: str):
+        async with self._client.pipeline(transaction=False) as pipe:
+            pipe.exists(self._key(competition_id, "built"))
+            # Everything ranked at or above the cursor's member, whether or not
+            # that participant has moved since
+            pipe.zlexcount(self._key(competition_id, sort_by), f"[{member}", "+")
+            built, position = await pipe.execute()
+        if not built:
+            return False, None
+        return True, position
+
+    def _write(self, pipe, competition_id: str, entries: dict[str, dict[str, Any]]) -> None:
+        for sort_by in SORT_KEYS:
+            pipe.zadd(
+                self._key(competition_id, sort_by),
+                {sort_member(sort_by, uid, stats): 0 for uid, stats in entries.items()},
+            )
+        pipe.hset(
+            self._key(competition_id, "entries"),
+            mapping={uid: json.dumps(stats) for uid, stats in entries.items()},
+        )
+
+    async def replace(self, competition_id: str, entries: dict[str, dict[str, Any]]) -> None:
+        ttl = settings.LEADERBOARD_INDEX_TTL_SECONDS
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.delete(*self._all_keys(competition_id))
+            if entries:
+                self._write(pipe, competition_id, entries)
+            pipe.set(self._key(competition_id, "built"), int(time.time()))
+            for key in self._all_keys(competition_id):
+                pipe.expire(key, ttl)
+            await pipe.execute()
+
+    async def upsert(self, competition_id: str, entries: dict[str, dict[str, Any]]) -> None:
+        if not entries:
+            return
+        ttl = settings.LEADERBOARD_INDEX_TTL_SECONDS
+        entries_key = self._key(competition_id, "entries")
+        user_ids = list(entries)
+        async with self._client.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    # Old members encode the old stats; drop them atomically
+                    # with writing the new ones, retrying if a concurrent
+                    # update got there first
+                    await pipe.watch(entries_key)
+                    previous = await pipe.hmget(entries_key, user_ids)
+                    pipe.multi()
+                    for sort_by in SORT_KEYS:
+                        stale = [
+                            sort_member(sort_by, uid, json.loads(old))
+                            for uid, old in zip(user_ids, previous, strict=True)
+                            if old
+                        ]
+                        if stale:
+                            pipe.zrem(self._key(competition_id, sort_by), *stale)
+                    self._write(pipe, competition_id, entries)
+                    for key in self._all_keys(competition_id)[:-1]:
+                        pipe.expire(key, ttl)
+                    await pipe.execute()
+                    return
+                except WatchError:
+                    continue
+
+    async def invalidate(self, competition_id: str) -> None:
+        await self._client.delete(*self._all_keys(competition_id))
+
+
+_backend = None
+_redis_retry_at = 0.0
+
+
+def get_backend():
+    """Return the active index backend, creating the Redis one on first use."""
+    global _backend
+    if _backend is None:
+        _backend = RedisLeaderboardBackend()
+    return _backend
+
+
+def set_backend(backend) -> None:
+    """Replace the index backend (tests use ``InMemoryLeaderboardBackend``)."""
+    global _backend, _redis_retry_at
+    _backend = backend
+    _redis_retry_at = 0.0
+
+
+def _available() -> bool:
+    return time.monotonic() >= _redis_retry_at
+
+
+def _mark_failed(action: str, error: Exception) -> None:
+    global _redis_retry_at
+    _redis_retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+    logger.warning(f"Leaderboard index {action} failed, using database: {error}")
+
+
+async def _load_entries(db, scope) -> dict[str, dict[str, dict[str, Any]]]:
+    """Current stats of participants matching ``scope``, grouped by competition."""
+    result = await db.execute(
+        select(
+            Participant.competition_id,
+            Participant.user_id,
+            *(getattr(Participant, field) for field in STAT_FIELDS + ORDER_FIELDS),
+        ).where(scope)
+    )
+    grouped: dict[str, dict[str, dict[str, Any]]] = defaultdict(dict)
+    for row in result:
+        stats = {field: getattr(row, field) for field in STAT_FIELDS}
+        stats["last_pick_at"] = row.last_pick_at.isoformat() if row.last_pick_at else None
+        grouped[str(row.competition_id)][str(row.user_id)] = stats
+    return grouped
+
+
+async def _rebuild_ordered(db, competition_id: str, sort_by: str) -> list[tuple[str, dict]]:
+    """Rebuild the index from the database and return the full ordering."""
+    grouped = await _load_entries(db, Participant.competition_id == competition_id)
+    entries = grouped.get(competition_id, {})
+    if _available():
+        try:
+            await get_backend().replace(competition_id, entries)
+            logger.info(f"Rebuilt leaderboard index for {competition_id} ({len(entries)} entries)")
+        except Exception as e:
+            _mark_failed("rebuild", e)
+    return order_entries(entries, sort_by)
+
+
+async def read_window(
+    db, competition_id, sort_by: str, start: int = 0, stop: int = -1
+) -> tuple[list[tuple[int, str, dict]], int]:
+    """Return one slice of the leaderboard and the total participant count.
+
+    Rows are ``(position, user_id, stats)`` with 0-based absolute positions.
+    ``start``/``stop`` are inclusive like ZREVRANGE, and ``stop=-1`` reads to
+    the end. Served from the index when it is built; otherwise the index is
+    rebuilt from the database first. If Redis is unavailable the ranking is
+    computed from the database directly.
+    """
+    competition_id = str(competition_id)
+    if _available():
+        try:
+            window = await get_backend().read_window(competition_id, sort_by, start, stop)
+            if window is not None:
+                return window
+        except Exception as e:
+            _mark_failed("read", e)
+
+    ordered = await _rebuild_ordered(db, competition_id, sort_by)
+    end = None if stop < 0 else stop + 1
+    rows = [(start + i, uid, stats) for i, (uid, stats) in enumerate(ordered[start:end])]
+    return rows, len(ordered)
+
+
+async def position_of(db, competition_id, sort_by: str, user_id) -> int | None:
+    """0-based leaderboard position of ``user_id``, or None if not a participant."""
+    competition_id, user_id = str(competition_id), str(user_id)
+    if _available():
+        try:
+            built, position = await get_backend().rank(competition_id, sort_by, user_id)
+            if built:
+                return position
+        except Exception as e:
+            _mark_failed("rank", e)
+
+    ordered = await _rebuild_ordered(db, competition_id, sort_by)
+    return next((i for i, (uid, _) in enumerate(ordered) if uid == user_id), None)
+
+
+async def window_ranks(db, competition_id, sort_by: str, rows) -> dict[str, int]:
+    """Tie-aware ranks of the entries in a ``read_window`` slice, keyed by user id.
+
+    With ``LEADERBOARD_RANK_MODE=rank`` the index answers this with one
+    ZLEXCOUNT: the first entry's rank is one more than the number of members
+    in better tie groups, and each later entry either shares the previous
+    entry's tie group or starts a new one at its own position. Dense ranks,
+    or an index that is cold or unavailable, are ranked by the database.
+    """
+    if not rows:
+        return {}
+    competition_id = str(competition_id)
+    if settings.LEADERBOARD_RANK_MODE != "dense" and _available():
+        _, first_user_id, first_stats = rows[0]
+        group = tie_group(sort_by, first_user_id, first_stats)
+        try:
+            built, above = await get_backend().seek(
+                competition_id, sort_by, _above_tie_group(group)
+            )
+        except Exception as e:
+            _mark_failed("rank", e)
+            built = False
+        if built:
+            ranks = {}
+            rank = above + 1
+            for position, user_id, stats in rows:
+                entry_group = tie_group(sort_by, user_id, stats)
+                if entry_group != group:
+                    rank, group = position + 1, entry_group
+                ranks[user_id] = rank
+            return ranks
+
+    return await ranking.ranks_for(db, competition_id, sort_by, [uid for _, uid, _ in rows])
+
+
+def encode_cursor(sort_by: str, user_id: str, stats: dict[str, Any]) -> str:
+    """Opaque cursor pointing just past the given entry."""
+    raw = json.dumps({"m": sort_member(sort_by, user_id, stats)}).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> str:
+    """Inverse of ``encode_cursor``. Raises ValueError for malformed cursors."""
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        member = data["m"]
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(member, str) or ":" not in member:
+        raise ValueError("Invalid cursor")
+    return member
+
+
+async def resolve_cursor(db, competition_id, sort_by: str, cursor: str) -> int:
+    """Position the page after ``cursor`` starts at.
+
+    The cursor records where its entry sat in the (total) leaderboard order,
+    so the next page starts with the first entry ranked below that point.
+    Entries that moved across it since may be skipped or repeated, but
+    nothing that stayed put is.
+    """
+    member = decode_cursor(cursor)
+    competition_id = str(competition_id)
+    if _available():
+        try:
+            built, position = await get_backend().seek(competition_id, sort_by, member)
+            if built:
+                return position
+        except Exception as e:
+            _mark_failed("seek", e)
+
+    ordered = await _rebuild_ordered(db, competition_id, sort_by)
+    fallback = InMemoryLeaderboardBackend()
+    await fallback.replace(competition_id, dict(ordered))
+    _, position = await fallback.seek(competition_id, sort_by, member)
+    return position
+
+
+async def rebuild(db, competition_id) -> int:
+    """Rebuild one competition's index from the database. Returns the entry count."""
+    competition_id = str(competition_id)
+    grouped = await _load_entries(db, Participant.competition_id == competition_id)
+    entries = grouped.get(competition_id, {})
+    try:
+        await get_backend().replace(competition_id, entries)
+    except Exception as e:
+        _mark_failed("rebuild", e)
+    await leaderboard_cache.invalidate(competition_id)
+    return len(entries)
+
+
+async def refresh_participants(db, scope) -> int:
+    """Push the current stats of participants matching ``scope`` into the index.
+
+    Call after the transaction that changed those stats has committed.
+    """
+    grouped = await _load_entries(db, scope)
+    backend = get_backend()
+    for competition_id, entries in grouped.items():
+        try:
+            await backend.upsert(competition_id, entries)
+        except Exception as e:
+            _mark_failed("update", e)
+            await invalidate(competition_id)
+            continue
+        await leaderboard_cache.invalidate(competition_id)
+    return sum(len(entries) for entries in grouped.values())
+
+
+async def refresh_for_games(db, game_ids) -> int:
+    """Refresh the index for every participant with a pick on ``game_ids``."""
+    if not game_ids:
+        return 0
+    picked = exists().where(
+        and_(
+            Pick.user_id == Participant.user_id,
+            Pick.competition_id == Participant.competition_id,
+            Pick.game_id.in_(list(game_ids)),
+        )
+    )
+    return await refresh_participants(db, picked)
+
+
+def mark_games_scored(db, game_ids) -> None:
+    """Remember on the session that picks for ``game_ids`` were just scored.
+
+    The index must only see committed stats, so scoring records the games here
+    and the caller flushes them with ``refresh_pending`` after committing.
+    """
+    db.info.setdefault(PENDING_GAMES_KEY, set()).update(game_ids)
+
+
+async def refresh_pending(db) -> int:
+    """Refresh the index for games recorded by ``mark_games_scored``."""
+    game_ids = db.info.pop(PENDING_GAMES_KEY, None)
+    if not game_ids:
+        return 0
+    return await refresh_for_games(db, game_ids)
+
+
+async def invalidate(competition_id) -> None:
+    """Drop a competition's index so the next read rebuilds it."""
+    try:
+        await get_backend().invalidate(str(competition_id))
+    except Exception as e:
+        logger.warning(f"Leaderboard index invalidation failed for {competition_id}: {e}")
+    await leaderboard_cache.invalidate(competition_id)
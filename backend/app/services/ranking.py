@@ -0,0 +1,144 @@
+"""Leaderboard ordering and tie-aware ranks, computed in SQL.
+
+Every sort key orders participants by its primary column(s), then by the
+configured tie-breakers (``LEADERBOARD_TIE_BREAKERS``, by default accuracy,
+then wins, then earliest ``last_pick_at``), and finally by ``user_id`` so the
+order is total and deterministic. Participants equal on everything except
+``user_id`` are tied: ``RANK()`` gives them the same rank and skips the
+following ones (1, 1, 3), ``DENSE_RANK()`` does not skip (1, 1, 2), chosen by
+``LEADERBOARD_RANK_MODE``.
+
+Each sort key has a covering index on ``participants(competition_id, <order
+columns>, user_id) INCLUDE (<remaining stats>)`` matching the default
+tie-breakers, so a competition's ranking is read in index order with no
+sort step. The admin participant list ranks through this module;
+``leaderboard_index`` mirrors the same order in Redis and ranks leaderboard
+windows from it, falling back to ``ranks_for`` when the index is cold.
+"""
+
+from sqlalchemy import any_, cast, func, select
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+
+from app.core.config import settings
+from app.models.participant import Participant
+from app.models.user import User
+
+SORT_KEYS = ("points", "accuracy", "wins", "streak")
+
+# Primary ordering per sort key, as (column name, descending)
+PRIMARY_KEYS = {
+    "points": (("total_points", True),),
+    "accuracy": (("accuracy_percentage", True),),
+    "wins": (("total_wins", True),),
+    "streak": (("current_streak", True), ("longest_streak", True)),
+}
+
+TIE_BREAKERS = {
+    "points": ("total_points", True),
+    "accuracy": ("accuracy_percentage", True),
+    "wins": ("total_wins", True),
+    "last_pick_at": ("last_pick_at", False),  # earliest first; never picked goes last
+}
+
+
+def tie_breakers() -> list[str]:
+    """Configured tie-breaker names, in order."""
+    names = [name.strip() for name in settings.LEADERBOARD_TIE_BREAKERS.split(",") if name.strip()]
+    unknown = [name for name in names if name not in TIE_BREAKERS]
+    if unknown:
+        raise ValueError(f"Unknown leaderboard tie-breakers: {unknown}")
+    return names
+
+
+def rank_keys(sort_by: str) -> list[tuple[str, bool]]:
+    """``(column, descending)`` pairs that decide rank for ``sort_by``.
+
+    Tie-breakers already covered by the primary ordering are skipped.
+    """
+    keys = list(PRIMARY_KEYS[sort_by])
+    for name in tie_breakers():
+        if TIE_BREAKERS[name] not in keys:
+            keys.append(TIE_BREAKERS[name])
+    return keys
+
+
+def _rank_order(sort_by: str, source=Participant) -> list:
+    # Postgres defaults (DESC NULLS FIRST, ASC NULLS LAST) match the indexes;
+    # only last_pick_at is nullable and it sorts ascending.
+    return [
+        getattr(source, column).desc() if descending else getattr(source, column).asc()
+        for column, descending in rank_keys(sort_by)
+    ]
+
+
+def order_by(sort_by: str) -> list:
+    """Total leaderboard order for ``sort_by``: rank keys, then user_id."""
+    return [*_rank_order(sort_by), Participant.user_id.asc()]
+
+
+def rank_column(sort_by: str, partition_by=None, source=Participant):
+    """``RANK()`` or ``DENSE_RANK()`` over the rank keys, per LEADERBOARD_RANK_MODE.
+
+    ``partition_by`` ranks several competitions in one query. ``source`` reads
+    the rank keys from another selectable (its ``.c``) with the same column names.
+    """
+    rank_func = func.dense_rank if settings.LEADERBOARD_RANK_MODE == "dense" else func.rank
+    order = _rank_order(sort_by, source)
+    return rank_func().over(partition_by=partition_by, order_by=order).label("rank")
+
+
+def position_column(sort_by: str):
+    """0-based ``ROW_NUMBER()`` over the total order.
+
+    Besides numbering rows, this window tells the planner the rows are
+    already in ``order_by`` order, so the covering index satisfies the final
+    ORDER BY without an extra sort on ``user_id``.
+    """
+    return (func.row_number().over(order_by=order_by(sort_by)) - 1).label("position")
+
+
+def ranked_participants(competition_id, sort_by: str):
+    """SELECT of ``(Participant, username, rank, position)`` rows in leaderboard order."""
+    return (
+        select(Participant, User.username, rank_column(sort_by), position_column(sort_by))
+        .join(User, Participant.user_id == User.id)
+        .where(Participant.competition_id == competition_id)
+        .order_by(*order_by(sort_by))
+    )
+
+
+def ranked_user_ids(competition_id, sort_by: str):
+    """SELECT of ``(user_id, rank, position)`` in leaderboard order, read from the covering index."""
+    return (
+        select(Participant.user_id, rank_column(sort_by), position_column(sort_by))
+        .where(Participant.competition_id == competition_id)
+        .order_by(*order_by(sort_by))
+    )
+
+
+async def fetch_ranked(db, competition_id, sort_by: str, offset: int = 0, limit: int | None = None):
+    """Ranked ``(Participant, username, rank, position)`` rows for one competition."""
+    query = ranked_participants(competition_id, sort_by).offset(offset)
+    if limit is not None:
+        query = query.limit(limit)
+    result = await db.execute(query)
+    return result.all()
+
+
+async def ranks_for(db, competition_id, sort_by: str, user_ids) -> dict[str, int]:
+    """Ranks of ``user_ids`` within their competition, keyed by user id.
+
+    The ranking is read in index order and stops once every requested user
+    has been seen, so a window near the top of a large table stays cheap.
+    """
+    user_ids = [str(user_id) for user_id in user_ids]
+    if not user_ids:
+        return {}
+    ranked = ranked_user_ids(competition_id, sort_by).subquery()
+    result = await db.execute(
+        select(ranked.c.user_id, ranked.c.rank)
+        # One array parameter keeps large windows under the bind-parameter limit
+        .where(ranked.c.user_id == any_(cast(user_ids, ARRAY(UUID(as_uuid=False)))))
+        .limit(len(user_ids))
+    )
+    return {str(row.user_id): row.rank for row in result}
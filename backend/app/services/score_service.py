@@ -1,99 +1,453 @@
 import logging
 
-from sqlalchemy import and_, select, update
+from sqlalchemy import Float, and_, case, cast, func, null, or_, select, update
+from sqlalchemy.orm import aliased
 
-from app.models.game import Game
+from app.models.game import Game, GameStatus
 from app.models.participant import Participant
 from app.models.pick import Pick
+from app.services import leaderboard_index
 
 logger = logging.getLogger(__name__)
 
+# Streaks follow the order games finished in, not the order picks were made.
+# Games that never recorded an end time fall back to their scheduled start.
+_game_completed_at = func.coalesce(Game.end_time, Game.scheduled_start_time)
 
-async def score_picks_for_game(db, game: Game):
+
+def _accuracy(wins, losses):
+    """SQL expression for accuracy percentage derived from win/loss counts."""
+    decided = wins + losses
+    return case((decided > 0, cast(wins, Float) / decided * 100.0), else_=0.0)
+
+
+def _count_if(condition):
+    return func.sum(case((condition, 1), else_=0))
+
+
+async def score_picks_for_game(db, game: Game) -> int:
     """
-    Score all picks for a completed game.
+    Score all picks for a completed game. Returns the number of picks graded.
     """
-    # Fetch all picks for this game
-    stmt = select(Pick).where(Pick.game_id == game.id)
+    summary = await score_picks_for_games(db, [game])
+    return summary["picks"]
+
+
+async def score_picks_for_games(db, games) -> dict:
+    """
+    Score all picks for a batch of completed games in one pass.
+
+    Grading and participant updates happen in one statement: a data-modifying
+    CTE regrades every pick against its game's ``winner_team_id`` (locking it
+    and capturing its previous grade), and each affected Participant row
+    receives a single atomic delta to its points, wins and losses, however
+    many of the batch's games it picked. Only actual transitions move the
+    totals, so re-scoring an unchanged game is a no-op and a score correction
+    that flips a pick moves it from one column to the other.
+
+    Streak state is extended from the newly graded picks in game completion
+    order. When that cannot be done incrementally — a previously graded pick
+    flipped, or a game finished before the participant's last scored game —
+    the affected participants' streaks are rebuilt from history instead.
+
+    The scored games are recorded for ``leaderboard_index.refresh_pending``,
+    which callers run once the transaction has committed.
+
+    Returns counts of games, picks and participants touched.
+    """
+    game_ids = [game.id for game in games]
+    summary = {"games": len(game_ids), "picks": 0, "participants": 0}
+    if not game_ids:
+        return summary
+
+    previous = (
+        select(
+            Pick.id,
+            Pick.is_correct,
+            Pick.points_earned,
+            Game.winner_team_id,
+            _game_completed_at.label("completed_at"),
+        )
+        .join(Game, Game.id == Pick.game_id)
+        .where(Pick.game_id.in_(game_ids))
+        .with_for_update(of=Pick)
+        .cte("previous")
+    )
+    # Tie, cancelled, or no result (no winner): award no points and void the
+    # pick so it counts as neither a win nor a loss.
+    picked_winner = Pick.predicted_winner_team_id == previous.c.winner_team_id
+    graded = (
+        update(Pick)
+        .where(Pick.id == previous.c.id)
+        .values(
+            is_correct=case((previous.c.winner_team_id.is_(None), null()), else_=picked_winner),
+            points_earned=case((picked_winner, 1), else_=0),
+        )
+        .returning(
+            Pick.id,
+            Pick.user_id,
+            Pick.competition_id,
+            Pick.is_correct,
+            Pick.points_earned,
+            previous.c.is_correct.label("was_correct"),
+            previous.c.points_earned.label("old_points"),
+            previous.c.completed_at,
+        )
+        .cte("graded")
+    )
+
+    # Newly decided picks split into "islands" at each new loss, in game
+    # completion order: island 0 extends the existing streak and the last
+    # island is the new current streak.
+    was_unscored = graded.c.was_correct.is_(None)
+    per_pick = select(
+        graded,
+        func.count()
+        .filter(and_(was_unscored, graded.c.is_correct.is_(False)))
+        .over(
+            partition_by=(graded.c.user_id, graded.c.competition_id),
+            order_by=(graded.c.completed_at, graded.c.id),
+            rows=(None, 0),
+        )
+        .label("island"),
+    ).subquery()
+
+    is_new = per_pick.c.was_correct.is_(None)
+    per_island = (
+        select(
+            per_pick.c.user_id,
+            per_pick.c.competition_id,
+            per_pick.c.island,
+            func.max(per_pick.c.island)
+            .over(partition_by=(per_pick.c.user_id, per_pick.c.competition_id))
+            .label("last_island"),
+            func.count().label("picks"),
+            func.sum(
+                case((per_pick.c.is_correct.isnot(None), per_pick.c.points_earned), else_=0)
+                - case((per_pick.c.was_correct.isnot(None), per_pick.c.old_points), else_=0)
+            ).label("points"),
+            (
+                _count_if(per_pick.c.is_correct.is_(True))
+                - _count_if(per_pick.c.was_correct.is_(True))
+            ).label("wins"),
+            (
+                _count_if(per_pick.c.is_correct.is_(False))
+                - _count_if(per_pick.c.was_correct.is_(False))
+            ).label("losses"),
+            _count_if(and_(is_new, per_pick.c.is_correct.is_(True))).label("new_wins"),
+            _count_if(and_(is_new, per_pick.c.is_correct.is_(False))).label("new_losses"),
+            _count_if(
+                and_(
+                    per_pick.c.was_correct.isnot(None),
+                    per_pick.c.was_correct.is_distinct_from(per_pick.c.is_correct),
+                )
+            ).label("flips"),
+            func.min(per_pick.c.completed_at).filter(is_new).label("first_new_at"),
+            func.max(per_pick.c.completed_at)
+            .filter(per_pick.c.is_correct.isnot(None))
+            .label("last_decided_at"),
+        )
+        .group_by(per_pick.c.user_id, per_pick.c.competition_id, per_pick.c.island)
+        .subquery()
+    )
+
+    prior = aliased(Participant)
+    deltas = (
+        select(
+            prior.id.label("participant_id"),
+            func.sum(per_island.c.picks).label("picks"),
+            func.sum(per_island.c.points).label("points"),
+            func.sum(per_island.c.wins).label("wins"),
+            func.sum(per_island.c.losses).label("losses"),
+            func.sum(per_island.c.new_losses).label("new_losses"),
+            func.coalesce(
+                func.sum(per_island.c.new_wins).filter(per_island.c.island == 0), 0
+            ).label("head_run"),
+            func.sum(per_island.c.new_wins)
+            .filter(per_island.c.island == per_island.c.last_island)
+            .label("tail_run"),
+            func.max(per_island.c.new_wins).label("max_run"),
+            func.max(per_island.c.last_decided_at).label("last_decided_at"),
+            or_(
+                func.sum(per_island.c.flips) > 0,
+                func.coalesce(
+                    func.min(per_island.c.first_new_at) < func.max(prior.last_scored_game_at),
+                    False,
+                ),
+            ).label("needs_rebuild"),
+        )
+        .join(
+            prior,
+            and_(
+                prior.user_id == per_island.c.user_id,
+                prior.competition_id == per_island.c.competition_id,
+            ),
+        )
+        .group_by(prior.id)
+        .subquery()
+    )
+
+    wins = Participant.total_wins + deltas.c.wins
+    losses = Participant.total_losses + deltas.c.losses
+    extended_streak = Participant.current_streak + deltas.c.head_run
+    stmt = (
+        update(Participant)
+        .where(Participant.id == deltas.c.participant_id)
+        .values(
+            total_points=Participant.total_points + deltas.c.points,
+            total_wins=wins,
+            total_losses=losses,
+            accuracy_percentage=_accuracy(wins, losses),
+            current_streak=case(
+                (deltas.c.new_losses > 0, deltas.c.tail_run), else_=extended_streak
+            ),
+            longest_streak=func.greatest(
+                Participant.longest_streak, extended_streak, deltas.c.max_run
+            ),
+            last_scored_game_at=func.greatest(
+                Participant.last_scored_game_at, deltas.c.last_decided_at
+            ),
+        )
+        .returning(Participant.id, deltas.c.picks, deltas.c.needs_rebuild)
+        .execution_options(synchronize_session=False)
+    )
     result = await db.execute(stmt)
-    picks = result.scalars().all()
+    rows = result.all()
+    summary["picks"] = sum(row.picks for row in rows)
+    summary["participants"] = len(rows)
+
+    if not summary["picks"]:
+        logger.debug(f"No picks found for games {game_ids}")
+        return summary
+
+    out_of_order = [row.id for row in rows if row.needs_rebuild]
+    if out_of_order:
+        await rebuild_streaks(db, Participant.id.in_(out_of_order))
+
+    leaderboard_index.mark_games_scored(db, game_ids)
+    logger.info(
+        f"Scored {summary['picks']} picks across {summary['games']} games "
+        f"for {summary['participants']} participants"
+    )
+    return summary
+
+
+async def rescore_competition(db, competition_id, on_stage=None) -> dict:
+    """
+    Regrade every FINAL game in a competition and rebuild all aggregates.
 
-    if not picks:
-        logger.debug(f"No picks found for game {game.id}")
-        return
+    Runs a fixed three statements however many games, picks or participants
+    the competition has: mark the games scored, regrade every pick against
+    its game's winner, then recompute every participant's totals and streaks
+    from scratch. ``on_stage`` is an optional async callback invoked as
+    ``on_stage(stage, progress)`` before each step.
 
-    scored_count = 0
-    for pick in picks:
-        # Determine if pick is correct
-        if game.winner_team_id is None:
-            # Tie, cancelled, or no result: award no points
-            pick.points_earned = 0
-        elif pick.predicted_winner_team_id == game.winner_team_id:
-            # Correct pick
-            pick.is_correct = True
-            pick.points_earned = 1
-        else:
-            # Incorrect pick
-            pick.is_correct = False
-            pick.points_earned = 0
+    Returns counts of games, picks and participants touched.
+    """
 
-        scored_count += 1
+    async def _stage(name, progress):
+        if on_stage is not None:
+            await on_stage(name, progress)
 
-    logger.info(f"Scored {scored_count} picks for game {game.id}")
+    final_game = and_(Game.competition_id == competition_id, Game.status == GameStatus.FINAL)
 
-    # Recalculate participant aggregate stats
-    participant_keys = {(pick.user_id, pick.competition_id) for pick in picks}
+    await _stage("marking_games", 0)
+    result = await db.execute(
+        update(Game)
+        .where(final_game)
+        .values(scoring_completed=True)
+        .execution_options(synchronize_session=False)
+    )
+    games = result.rowcount
 
-    for user_id, competition_id in participant_keys:
-        await recalculate_participant_stats(db, user_id, competition_id)
+    await _stage("grading_picks", 25)
+    # Tie, cancelled, or no result (no winner): void the pick.
+    picked_winner = Pick.predicted_winner_team_id == Game.winner_team_id
+    result = await db.execute(
+        update(Pick)
+        .where(and_(Pick.game_id == Game.id, final_game))
+        .values(
+            is_correct=case((Game.winner_team_id.is_(None), null()), else_=picked_winner),
+            points_earned=case((picked_winner, 1), else_=0),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    picks = result.rowcount
+
+    await _stage("rebuilding_participants", 60)
+    participants = await refresh_participant_stats(db, Participant.competition_id == competition_id)
+
+    logger.info(
+        f"Rescored competition {competition_id}: {games} games, {picks} picks, "
+        f"{participants} participants"
+    )
+    return {"games": games, "picks": picks, "participants": participants}
 
 
 async def recalculate_participant_stats(db, user_id, competition_id):
     """
-    Recalculate aggregate stats for a participant.
+    Recalculate aggregate stats for a participant from scratch.
     """
-    # Fetch all scored picks for this participant
-    stmt = select(Pick).where(
-        and_(
-            Pick.user_id == user_id,
-            Pick.competition_id == competition_id,
-            Pick.is_correct.isnot(None),
+    await refresh_participant_stats(
+        db,
+        and_(Participant.user_id == user_id, Participant.competition_id == competition_id),
+    )
+
+    logger.debug(f"Updated participant stats: user={user_id}, comp={competition_id}")
+
+
+def _participant_aggregates(scope):
+    """Build a per-participant aggregate subquery over scored picks.
+
+    ``scope`` is a WHERE clause on ``Participant`` selecting whose stats to
+    compute. Participants with no scored picks still get a row of zeros.
+    Picks are ordered by game completion time and split into islands at each
+    loss; the longest island is the longest streak and the last one is the
+    current streak.
+    """
+    scored_pick = and_(
+        Pick.user_id == Participant.user_id,
+        Pick.competition_id == Participant.competition_id,
+        Pick.is_correct.isnot(None),
+    )
+    per_pick = (
+        select(
+            Participant.id.label("participant_id"),
+            Pick.is_correct,
+            Pick.points_earned,
+            _game_completed_at.label("completed_at"),
+            func.count()
+            .filter(Pick.is_correct.is_(False))
+            .over(
+                partition_by=Participant.id,
+                order_by=(_game_completed_at, Pick.id),
+                rows=(None, 0),
+            )
+            .label("island"),
         )
+        .select_from(Participant)
+        .outerjoin(Pick, scored_pick)
+        .outerjoin(Game, Game.id == Pick.game_id)
+        .where(scope)
+        .subquery()
     )
-    result = await db.execute(stmt)
-    picks = result.scalars().all()
+    per_island = (
+        select(
+            per_pick.c.participant_id,
+            per_pick.c.island,
+            func.max(per_pick.c.island)
+            .over(partition_by=per_pick.c.participant_id)
+            .label("last_island"),
+            func.coalesce(func.sum(per_pick.c.points_earned), 0).label("points"),
+            func.count().filter(per_pick.c.is_correct.is_(True)).label("wins"),
+            func.count().filter(per_pick.c.is_correct.is_(False)).label("losses"),
+            func.max(per_pick.c.completed_at).label("last_at"),
+        )
+        .group_by(per_pick.c.participant_id, per_pick.c.island)
+        .subquery()
+    )
+    return (
+        select(
+            per_island.c.participant_id,
+            func.sum(per_island.c.points).label("total_points"),
+            func.sum(per_island.c.wins).label("total_wins"),
+            func.sum(per_island.c.losses).label("total_losses"),
+            func.sum(per_island.c.wins)
+            .filter(per_island.c.island == per_island.c.last_island)
+            .label("current_streak"),
+            func.max(per_island.c.wins).label("longest_streak"),
+            func.max(per_island.c.last_at).label("last_scored_game_at"),
+        )
+        .group_by(per_island.c.participant_id)
+        .subquery()
+    )
+
 
-    total_points = sum(pick.points_earned for pick in picks)
-    total_wins = sum(1 for pick in picks if pick.is_correct is True)
-    total_losses = sum(1 for pick in picks if pick.is_correct is False)
+async def refresh_participant_stats(db, scope) -> int:
+    """Recompute aggregates for every participant matching ``scope``.
+
+    Issues a single ``UPDATE participants ... FROM (SELECT ... GROUP BY)``
+    regardless of how many participants or picks are involved. Returns the
+    number of participant rows updated.
+    """
+    agg = _participant_aggregates(scope)
+    stmt = (
+        update(Participant)
+        .where(Participant.id == agg.c.participant_id)
+        .values(
+            total_points=agg.c.total_points,
+            total_wins=agg.c.total_wins,
+            total_losses=agg.c.total_losses,
+            accuracy_percentage=_accuracy(agg.c.total_wins, agg.c.total_losses),
+            current_streak=agg.c.current_streak,
+            longest_streak=agg.c.longest_streak,
+            last_scored_game_at=agg.c.last_scored_game_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    result = await db.execute(stmt)
+    return result.rowcount
 
-    total_picks = total_wins + total_losses
-    accuracy = (total_wins / total_picks * 100.0) if total_picks > 0 else 0.0
 
-    # Calculate current streak (consecutive correct picks, most recent first)
-    streak_picks = sorted(picks, key=lambda p: p.created_at, reverse=True)
-    current_streak = 0
-    for pick in streak_picks:
-        if pick.is_correct is True:
-            current_streak += 1
-        else:
-            break
+async def rebuild_streaks(db, scope) -> int:
+    """Rebuild streak state from pick history for participants matching ``scope``.
 
-    # Update participant record
+    Returns the number of participant rows updated.
+    """
+    agg = _participant_aggregates(scope)
     stmt = (
         update(Participant)
-        .where(and_(Participant.user_id == user_id, Participant.competition_id == competition_id))
+        .where(Participant.id == agg.c.participant_id)
         .values(
-            total_points=total_points,
-            total_wins=total_wins,
-            total_losses=total_losses,
-            accuracy_percentage=accuracy,
-            current_streak=current_streak,
+            current_streak=agg.c.current_streak,
+            longest_streak=agg.c.longest_streak,
+            last_scored_game_at=agg.c.last_scored_game_at,
         )
+        .execution_options(synchronize_session=False)
     )
-    await db.execute(stmt)
+    result = await db.execute(stmt)
+    return result.rowcount
+
 
-    logger.debug(
-        f"Updated participant stats: user={user_id}, comp={competition_id}, "
-        f"points={total_points}, wins={total_wins}, losses={total_losses}"
+async def rebuild_competition_streaks(db, competition_id) -> int:
+    """Rebuild streak state for every participant in a competition."""
+    rebuilt = await rebuild_streaks(db, Participant.competition_id == competition_id)
+    logger.info(f"Rebuilt streaks for {rebuilt} participants in competition {competition_id}")
+    return rebuilt
+
+
+async def reconcile_participant_stats(db, scope=None) -> int:
+    """Verify incrementally-maintained stats against a full recompute.
+
+    Only rows whose totals or streaks have drifted from the pick history are
+    rewritten. ``scope`` optionally narrows the check to a WHERE clause on
+    ``Participant``. Returns the number of participant rows repaired.
+    """
+    agg = _participant_aggregates(scope if scope is not None else Participant.id.isnot(None))
+    stmt = (
+        update(Participant)
+        .where(
+            and_(
+                Participant.id == agg.c.participant_id,
+                or_(
+                    Participant.total_points != agg.c.total_points,
+                    Participant.total_wins != agg.c.total_wins,
+                    Participant.total_losses != agg.c.total_losses,
+                    Participant.current_streak != agg.c.current_streak,
+                    Participant.longest_streak != agg.c.longest_streak,
+                ),
+            )
+        )
+        .values(
+            total_points=agg.c.total_points,
+            total_wins=agg.c.total_wins,
+            total_losses=agg.c.total_losses,
+            accuracy_percentage=_accuracy(agg.c.total_wins, agg.c.total_losses),
+            current_streak=agg.c.current_streak,
+            longest_streak=agg.c.longest_streak,
+            last_scored_game_at=agg.c.last_scored_game_at,
+        )
+        .execution_options(synchronize_session=False)
     )
+    result = await db.execute(stmt)
+    return result.rowcount
@@ -1,4 +1,4 @@
-from app.services.sports_api.base import APIProvider, GameData
+from app.services.sports_api.base import APIProvider, GameData, GameList
 from app.services.sports_api.sports_service import SportsDataService
 
-__all__ = ["APIProvider", "GameData", "SportsDataService"]
+__all__ = ["APIProvider", "GameData", "GameList", "SportsDataService"]
@@ -1,12 +1,19 @@
+import hashlib
 import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import Enum
+from operator import attrgetter
+from types import MappingProxyType
+from urllib.parse import urlencode
 
 import httpx
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 from app.core.config import settings
+from app.services.sports_api.http_pool import get_http_client, stats_for
+from app.services.sports_api.local_cache import LocalCache
+from app.services.sports_api.quota import quota_manager
 
 logger = logging.getLogger(__name__)
 
@@ -21,8 +28,45 @@ class APIProvider(str, Enum):
     PGA_TOUR = "pga_tour"
 
 
+# Shared, read-only raw_data for games built without one (a fresh {} is 64 bytes each)
+_NO_RAW_DATA = MappingProxyType({})
+
+
 class GameData:
-    """Standardized game data structure"""
+    """Standardized game data structure.
+
+    Slotted: parsing, cache round trips and syncs create thousands of these.
+    Equality and hashing cover only ``SCORING_FIELDS``, so ``a == b`` means
+    nothing a competition scores on has changed between two fetches of a
+    game. Treat instances as immutable once built; they are shared between
+    callers by the local cache tier.
+    """
+
+    # Every field but raw_data, in __init__ order: the shape of to_cache()
+    CACHE_FIELDS = (
+        "external_id",
+        "home_team",
+        "away_team",
+        "scheduled_start_time",
+        "status",
+        "home_score",
+        "away_score",
+        "venue",
+        "home_team_external_id",
+        "away_team_external_id",
+        "home_team_abbreviation",
+        "away_team_abbreviation",
+        "home_team_wins",
+        "home_team_losses",
+        "home_team_ties",
+        "away_team_wins",
+        "away_team_losses",
+        "away_team_ties",
+        "spread",
+        "over_under",
+    )
+    __slots__ = (*CACHE_FIELDS, "raw_data")
+    SCORING_FIELDS = ("external_id", "status", "home_score", "away_score", "spread", "over_under")
 
     def __init__(
         self,
@@ -63,7 +107,7 @@ class GameData:
         self.home_score = home_score
         self.away_score = away_score
         self.venue = venue
-        self.raw_data = raw_data or {}
+        self.raw_data = raw_data or _NO_RAW_DATA
         self.home_team_external_id = home_team_external_id
         self.away_team_external_id = away_team_external_id
         self.home_team_abbreviation = home_team_abbreviation
@@ -77,6 +121,103 @@ class GameData:
         self.spread = spread
         self.over_under = over_under
 
+    def to_cache(self) -> list:
+        """The ``CACHE_FIELDS`` values, JSON-ready (start time as ISO 8601)."""
+        values = list(_cache_values(self))
+        values[3] = self.scheduled_start_time.isoformat()
+        return values
+
+    @classmethod
+    def from_cache(cls, values: list) -> "GameData":
+        """Rebuild a game from ``to_cache()`` output (without raw_data).
+
+        Fills the slots directly rather than through ``__init__``, which
+        makes this about 2.5x cheaper than keyword construction. Raises
+        ValueError if ``values`` has the wrong number of fields.
+        """
+        game = object.__new__(cls)
+        (
+            game.external_id,
+            game.home_team,
+            game.away_team,
+            start,
+            game.status,
+            game.home_score,
+            game.away_score,
+            game.venue,
+            game.home_team_external_id,
+            game.away_team_external_id,
+            game.home_team_abbreviation,
+            game.away_team_abbreviation,
+            game.home_team_wins,
+            game.home_team_losses,
+            game.home_team_ties,
+            game.away_team_wins,
+            game.away_team_losses,
+            game.away_team_ties,
+            game.spread,
+            game.over_under,
+        ) = values
+        game.scheduled_start_time = datetime.fromisoformat(start)
+        game.raw_data = _NO_RAW_DATA
+        return game
+
+    def __eq__(self, other):
+        if not isinstance(other, GameData):
+            return NotImplemented
+        return _scoring_values(self) == _scoring_values(other)
+
+    def __hash__(self):
+        return hash(_scoring_values(self))
+
+    def __repr__(self):
+        return (
+            f"GameData(external_id={self.external_id!r}, status={self.status!r}, "
+            f"home_score={self.home_score!r}, away_score={self.away_score!r})"
+        )
+
+
+_cache_values = attrgetter(*GameData.CACHE_FIELDS)
+_scoring_values = attrgetter(*GameData.SCORING_FIELDS)
+
+
+class GameList(list):
+    """A list of GameData that knows how old it is.
+
+    ``age_seconds`` counts from when a provider returned the data. ``stale``
+    is set once that is past the cache's freshness TTL: the list was served
+    while a refresh runs in the background, or because every provider failed.
+    """
+
+    def __init__(self, games=(), age_seconds: float = 0.0, stale: bool = False):
+        super().__init__(games)
+        self.age_seconds = age_seconds
+        self.stale = stale
+
+
+# Returned by _make_request when a revalidated response matches the previous one
+UNCHANGED = object()
+
+
+class _Revalidation:
+    """The validators and body digest of a request's last full response, and its parse."""
+
+    __slots__ = ("digest", "etag", "last_modified", "result")
+
+    def __init__(self, etag: str | None, last_modified: str | None, digest: bytes, result=None):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.digest = digest
+        self.result = result
+
+    def request_headers(self) -> dict:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
 
 class BaseSportsAPIClient(ABC):
     """
@@ -87,14 +228,15 @@ class BaseSportsAPIClient(ABC):
 
     def __init__(self, provider: APIProvider):
         self.provider = provider
-        self.client = httpx.AsyncClient(
-            timeout=settings.API_TIMEOUT_SECONDS,
-            follow_redirects=True,
-        )
-
-    async def close(self):
-        """Close the HTTP client"""
-        await self.client.aclose()
+        # Shared, process-wide pool; closed by close_http_client on shutdown
+        self.client = get_http_client()
+        self.http_stats = stats_for(provider)
+        # request key -> _Revalidation of its last parsed response
+        self._revalidations = LocalCache(settings.API_REVALIDATION_MAX_ENTRIES)
+        # request key -> _Revalidation of a response still being parsed
+        self._unparsed: dict[str, _Revalidation] = {}
+        # Responses whose JSON decode and parse were skipped, by reason
+        self.skipped_parses = {"not_modified": 0, "unchanged_body": 0}
 
     @abstractmethod
     async def get_schedule(
@@ -151,6 +293,7 @@ class BaseSportsAPIClient(ABC):
         url: str,
         headers: dict | None = None,
         params: dict | None = None,
+        revalidate_key: str | None = None,
     ) -> dict:
         """
         Make HTTP request with retry logic.
@@ -160,9 +303,12 @@ class BaseSportsAPIClient(ABC):
             url: Full URL to request
             headers: Optional headers
             params: Optional query parameters
+            revalidate_key: Set by _get_parsed. The request is made conditional
+                on that key's last parsed response (ETag / Last-Modified), and a
+                304 or a byte-identical body returns UNCHANGED without decoding.
 
         Returns:
-            JSON response as dictionary
+            JSON response as dictionary, or UNCHANGED
 
         Raises:
             httpx.HTTPStatusError: For 4xx/5xx responses
@@ -171,14 +317,35 @@ class BaseSportsAPIClient(ABC):
         try:
             logger.debug(f"{self.provider}: {method} {url}")
 
-            response = await self.client.request(
-                method=method,
-                url=url,
-                headers=headers,
-                params=params,
-            )
-
+            previous = self._revalidations.get(revalidate_key) if revalidate_key else None
+            if previous is not None:
+                headers = {**(headers or {}), **previous.request_headers()}
+
+            async with self.http_stats.track(url) as trace:
+                response = await self.client.request(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    params=params,
+                    extensions={"trace": trace},
+                )
+            # Metered providers report their remaining budget on every response
+            await quota_manager.record(self.provider, response.headers)
+
+            if previous is not None and response.status_code == 304:
+                self.skipped_parses["not_modified"] += 1
+                return self._still_valid(revalidate_key, previous)
             response.raise_for_status()
+            if revalidate_key is None:
+                return response.json()
+
+            digest = hashlib.sha256(response.content).digest()
+            if previous is not None and digest == previous.digest:
+                self.skipped_parses["unchanged_body"] += 1
+                return self._still_valid(revalidate_key, previous)
+            self._unparsed[revalidate_key] = _Revalidation(
+                response.headers.get("etag"), response.headers.get("last-modified"), digest
+            )
             return response.json()
 
         except httpx.HTTPStatusError as e:
@@ -199,6 +366,33 @@ class BaseSportsAPIClient(ABC):
             logger.error(f"{self.provider}: Unexpected error - {url}: {e!s}")
             raise
 
+    def _still_valid(self, key: str, previous: _Revalidation):
+        # Keep polled entries from expiring while the upstream stays unchanged
+        self._revalidations.set(key, previous, settings.CACHE_API_RESPONSE_SECONDS)
+        return UNCHANGED
+
+    async def _get_parsed(self, url: str, parse, headers: dict | None = None, params=None):
+        """GET ``url`` and return ``parse(json)``, or the last result if nothing changed.
+
+        Validators and a body digest are kept per URL and params for
+        CACHE_API_RESPONSE_SECONDS after the last response. ``parse`` must
+        depend on the response body alone. The result is shared between
+        calls and must not be mutated.
+        """
+        key = f"{url}?{urlencode(sorted((params or {}).items()))}"
+        body = await self._make_request(
+            "GET", url, headers=headers, params=params, revalidate_key=key
+        )
+        if body is UNCHANGED:
+            logger.debug(f"{self.provider}: {url} unchanged, reusing last parse")
+            return self._revalidations.get(key).result
+        result = parse(body)
+        fresh = self._unparsed.pop(key, None)
+        if fresh is not None:
+            fresh.result = result
+            self._revalidations.set(key, fresh, settings.CACHE_API_RESPONSE_SECONDS)
+        return result
+
     def _parse_datetime(self, date_str: str) -> datetime:
         """
         Parse datetime string to UTC datetime.
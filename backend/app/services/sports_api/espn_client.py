@@ -51,18 +51,10 @@ class ESPNAPIClient(BaseSportsAPIClient):
             if self.api_key:
                 params["apikey"] = self.api_key
 
-            response = await self._make_request("GET", url, params=params)
-
-            games = []
-            events = response.get("events", [])
-
-            for event in events:
-                game_data = self._parse_event(event)
-                if game_data:
-                    games.append(game_data)
+            games = await self._get_parsed(url, self._parse_scoreboard, params=params)
 
             logger.info(f"ESPN: Fetched {len(games)} games for {league}")
-            return games
+            return list(games)
 
         except RateLimitExceededError:
             raise
@@ -84,18 +76,10 @@ class ESPNAPIClient(BaseSportsAPIClient):
             if self.api_key:
                 params["apikey"] = self.api_key
 
-            response = await self._make_request("GET", url, params=params)
-
-            games = []
-            events = response.get("events", [])
-
-            for event in events:
-                game_data = self._parse_event(event)
-                if game_data:
-                    games.append(game_data)
+            games = await self._get_parsed(url, self._parse_scoreboard, params=params)
 
             logger.info(f"ESPN: Fetched {len(games)} games for {league}")
-            return games
+            return list(games)
 
         except RateLimitExceededError:
             raise
@@ -127,6 +111,14 @@ class ESPNAPIClient(BaseSportsAPIClient):
             logger.error(f"ESPN: Error fetching game {game_id}: {e!s}")
             return None
 
+    def _parse_scoreboard(self, response: dict) -> list[GameData]:
+        games = []
+        for event in response.get("events", []):
+            game_data = self._parse_event(event)
+            if game_data:
+                games.append(game_data)
+        return games
+
     def _parse_event(self, event: dict) -> GameData | None:
         """Parse ESPN event data into standardized GameData"""
         try:
@@ -0,0 +1,134 @@
+"""Versioned encoding of cached GameData lists.
+
+Version 2 (written) is a JSON array without per-game keys::
+
+    [2, cached_at, strings, rows]
+
+``strings`` holds each distinct string value once -- team names, ids and
+abbreviations, statuses, venues and ISO start times, which a slate repeats
+across many games. ``rows`` has one array per game, ``GameData.to_cache()``
+with strings replaced by their index into ``strings``. Adding, removing or
+reordering a ``GameData.CACHE_FIELDS`` field means a new version number.
+
+Entries stay text (the shared Redis client decodes responses) and only carry
+the fields competition rules need. raw_data is intentionally excluded: ESPN
+event payloads are 50-200KB each and would inflate the cache by 10-100x with
+no benefit.
+
+``decode`` also reads the earlier JSON formats still found in Redis: a bare
+list of per-game dicts, and ``{"cached_at": ..., "games": [...]}``.
+"""
+
+import json
+import logging
+from datetime import datetime
+
+from app.services.sports_api.base import GameData
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 2
+
+FIELDS = GameData.CACHE_FIELDS
+_STRING_FIELDS = frozenset(
+    {
+        "external_id",
+        "home_team",
+        "away_team",
+        "scheduled_start_time",
+        "status",
+        "venue",
+        "home_team_external_id",
+        "away_team_external_id",
+        "home_team_abbreviation",
+        "away_team_abbreviation",
+    }
+)
+_STRING_POSITIONS = tuple(i for i, field in enumerate(FIELDS) if field in _STRING_FIELDS)
+
+
+def encode(games: list[GameData], cached_at: float | None = None) -> str:
+    """Encode ``games`` fetched at ``cached_at`` (epoch seconds; None if unknown)."""
+    index: dict[str, int] = {}
+    rows = []
+    for game in games:
+        row = game.to_cache()
+        for i in _STRING_POSITIONS:
+            value = row[i]
+            if value is not None:
+                row[i] = index.setdefault(value, len(index))
+        rows.append(row)
+    return json.dumps([FORMAT_VERSION, cached_at, list(index), rows], separators=(",", ":"))
+
+
+def decode(data: str) -> tuple[list[GameData], float | None] | None:
+    """Games and fetch time (None if unknown) of an entry in any known format.
+
+    Returns None for an entry that cannot be read at all (not JSON, or an
+    unknown version), which callers treat as a cache miss rather than an
+    empty schedule. Failures are otherwise isolated per game so a single bad
+    entry does not silently drop the entire league's game list.
+    """
+    try:
+        payload = json.loads(data)
+    except Exception as e:
+        logger.error(f"Error parsing cached game JSON: {e}")
+        return None
+    if isinstance(payload, list) and payload and isinstance(payload[0], int):
+        if payload[0] != FORMAT_VERSION:
+            logger.error(f"Unknown cached game format version {payload[0]}")
+            return None
+        _, cached_at, strings, rows = payload
+        return _decode_rows(strings, rows), cached_at
+    if isinstance(payload, dict):
+        return _decode_dicts(payload.get("games", [])), payload.get("cached_at")
+    return _decode_dicts(payload), None
+
+
+def _decode_rows(strings: list[str], rows: list[list]) -> list[GameData]:
+    games = []
+    for i, row in enumerate(rows):
+        try:
+            for j in _STRING_POSITIONS:
+                value = row[j]
+                if value is not None:
+                    row[j] = strings[value]
+            games.append(GameData.from_cache(row))
+        except Exception as e:
+            logger.error(f"Error deserializing cached game at index={i}: {e}")
+    return games
+
+
+def _decode_dicts(games_data: list[dict]) -> list[GameData]:
+    """Version 0 and 1 entries: one dict per game, keyed by field name."""
+    games = []
+    for i, game_dict in enumerate(games_data):
+        try:
+            game = GameData(
+                external_id=game_dict["external_id"],
+                home_team=game_dict["home_team"],
+                away_team=game_dict["away_team"],
+                scheduled_start_time=datetime.fromisoformat(game_dict["scheduled_start_time"]),
+                status=game_dict["status"],
+                home_score=game_dict.get("home_score"),
+                away_score=game_dict.get("away_score"),
+                venue=game_dict.get("venue"),
+                home_team_external_id=game_dict.get("home_team_external_id"),
+                away_team_external_id=game_dict.get("away_team_external_id"),
+                home_team_abbreviation=game_dict.get("home_team_abbreviation"),
+                away_team_abbreviation=game_dict.get("away_team_abbreviation"),
+                home_team_wins=game_dict.get("home_team_wins"),
+                home_team_losses=game_dict.get("home_team_losses"),
+                home_team_ties=game_dict.get("home_team_ties"),
+                away_team_wins=game_dict.get("away_team_wins"),
+                away_team_losses=game_dict.get("away_team_losses"),
+                away_team_ties=game_dict.get("away_team_ties"),
+                spread=game_dict.get("spread"),
+                over_under=game_dict.get("over_under"),
+            )
+            games.append(game)
+        except Exception as e:
+            external_id = game_dict.get("external_id", f"index={i}")
+            logger.error(f"Error deserializing game {external_id}: {e}")
+            continue
+    return games
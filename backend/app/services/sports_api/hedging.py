@@ -0,0 +1,60 @@
+"""Bookkeeping for hedged live-score requests.
+
+With API_HEDGE_LIVE_SCORES on, ``SportsDataService`` starts the next
+provider in parallel when the one in flight has not answered within its
+observed p95 latency, and keeps the first good answer. ``LatencyWindow``
+tracks that p95 per provider; ``HedgeBudget`` limits how many fetches per
+league may be hedged, so hedging cannot double provider usage.
+"""
+
+import math
+from collections import deque
+
+from app.core.config import settings
+
+# Latencies kept per provider, and needed before their p95 is trusted
+_LATENCY_SAMPLES = 200
+_MIN_LATENCY_SAMPLES = 20
+# Hedges a league can save up while it is not hedging
+_MAX_HEDGE_TOKENS = 5.0
+
+
+class LatencyWindow:
+    """The most recent call latencies of one provider, in milliseconds."""
+
+    def __init__(self, size: int = _LATENCY_SAMPLES):
+        self.samples: deque[float] = deque(maxlen=size)
+
+    def add(self, ms: float) -> None:
+        self.samples.append(ms)
+
+    def percentile(self, q: float) -> float | None:
+        """The ``q`` quantile (0-1), or None until enough samples are in."""
+        if len(self.samples) < _MIN_LATENCY_SAMPLES:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, math.ceil(q * len(ordered)) - 1)]
+
+
+class HedgeBudget:
+    """Per-league allowance of hedged fetches.
+
+    Every live-score fetch for a league earns API_HEDGE_BUDGET_PERCENT / 100
+    of a hedge (saved up to a few), and a hedge spends one, so at most that
+    share of a league's fetches call a second provider.
+    """
+
+    def __init__(self):
+        # league -> hedges it may still fire
+        self.tokens: dict[str, float] = {}
+
+    def earn(self, league: str) -> None:
+        tokens = self.tokens.get(league, 1.0) + settings.API_HEDGE_BUDGET_PERCENT / 100
+        self.tokens[league] = min(_MAX_HEDGE_TOKENS, tokens)
+
+    def spend(self, league: str) -> bool:
+        tokens = self.tokens.get(league, 1.0)
+        if tokens < 1:
+            return False
+        self.tokens[league] = tokens - 1
+        return True
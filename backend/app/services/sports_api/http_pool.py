@@ -0,0 +1,189 @@
+"""Process-wide HTTP client shared by the sports API clients.
+
+Like ``app.db.redis`` for Redis, one ``httpx.AsyncClient`` serves every
+provider client in the process, so DNS lookups, TCP/TLS handshakes and
+keep-alive connections are reused across providers and client instances
+instead of each client keeping its own default-sized pool.
+
+- API_HTTP_MAX_CONNECTIONS / API_HTTP_MAX_KEEPALIVE bound the whole pool,
+  and idle connections are kept API_HTTP_KEEPALIVE_SECONDS.
+- API_HTTP_MAX_CONNECTIONS_PER_HOST caps concurrent requests per host.
+  httpx pools have no per-host limit, so requests queue for a host slot
+  here; the time spent waiting shows up as pool saturation.
+- API_HTTP2 negotiates HTTP/2 where a server offers it. It needs the
+  optional ``h2`` package; without it the client stays on HTTP/1.1.
+
+Per provider, ``ProviderHTTPStats`` keeps request latency and connect time
+histograms and host-slot usage for the health endpoint. The client is
+closed once, by ``close_http_client``, when the app or worker shuts down.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import time
+from bisect import bisect_left
+from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_client: httpx.AsyncClient | None = None
+# host -> semaphore capping concurrent requests to it
+_host_slots: dict[str, asyncio.Semaphore] = {}
+# provider -> its stats, shared by every client instance for that provider
+_stats: dict[str, "ProviderHTTPStats"] = {}
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it on first use (no network I/O)."""
+    global _client
+    if _client is None:
+        http2 = settings.API_HTTP2 and importlib.util.find_spec("h2") is not None
+        if settings.API_HTTP2 and not http2:
+            logger.warning("API_HTTP2 is set but the h2 package is missing; using HTTP/1.1")
+        _client = httpx.AsyncClient(
+            timeout=settings.API_TIMEOUT_SECONDS,
+            follow_redirects=True,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=settings.API_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.API_HTTP_MAX_KEEPALIVE,
+                keepalive_expiry=settings.API_HTTP_KEEPALIVE_SECONDS,
+            ),
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client and its connections (on shutdown)."""
+    global _client
+    if _client is not None:
+        client, _client = _client, None
+        await client.aclose()
+
+
+def _host_slot(url: str) -> asyncio.Semaphore:
+    host = urlsplit(url).netloc
+    slot = _host_slots.get(host)
+    if slot is None:
+        slot = _host_slots[host] = asyncio.Semaphore(settings.API_HTTP_MAX_CONNECTIONS_PER_HOST)
+    return slot
+
+
+def stats_for(provider: str) -> "ProviderHTTPStats":
+    if provider not in _stats:
+        _stats[provider] = ProviderHTTPStats()
+    return _stats[provider]
+
+
+class Histogram:
+    """Counts of millisecond observations per bucket, keyed by upper bound."""
+
+    BOUNDS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+
+    def observe(self, ms: float) -> None:
+        self.counts[bisect_left(self.BOUNDS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+
+    def snapshot(self) -> dict:
+        labels = [str(bound) for bound in self.BOUNDS_MS] + ["inf"]
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 1) if self.count else None,
+            "buckets": dict(zip(labels, self.counts, strict=True)),
+        }
+
+
+class _ConnectTrace:
+    """httpx trace hook timing a new connection (TCP connect plus TLS)."""
+
+    def __init__(self):
+        self._started: float | None = None
+        self.connect_ms: float | None = None
+
+    async def __call__(self, event_name: str, info: dict) -> None:
+        if event_name == "connection.connect_tcp.started":
+            self._started = time.perf_counter()
+        elif self._started is not None and event_name in (
+            "connection.connect_tcp.complete",
+            "connection.start_tls.complete",
+        ):
+            self.connect_ms = (time.perf_counter() - self._started) * 1000
+
+
+class ProviderHTTPStats:
+    def __init__(self):
+        self.latency = Histogram()
+        self.connect = Histogram()
+        self.slot_wait = Histogram()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.queued = 0
+        self.new_connections = 0
+        self.reused_connections = 0
+
+    @asynccontextmanager
+    async def track(self, url: str):
+        """Hold a slot for ``url``'s host around one request, recording its timings.
+
+        Yields the trace hook to pass as the request's ``trace`` extension.
+        """
+        slot = _host_slot(url)
+        waited = slot.locked()
+        if waited:
+            self.queued += 1
+        wait_started = time.perf_counter()
+        try:
+            await slot.acquire()
+        finally:
+            if waited:
+                self.queued -= 1
+        if waited:
+            self.slot_wait.observe((time.perf_counter() - wait_started) * 1000)
+
+        trace = _ConnectTrace()
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        started = time.perf_counter()
+        try:
+            yield trace
+        finally:
+            self.latency.observe((time.perf_counter() - started) * 1000)
+            self.in_flight -= 1
+            slot.release()
+            if trace.connect_ms is not None:
+                self.new_connections += 1
+                self.connect.observe(trace.connect_ms)
+            else:
+                self.reused_connections += 1
+
+    def snapshot(self) -> dict:
+        return {
+            "requests": self.latency.count,
+            "latency_ms": self.latency.snapshot(),
+            "connect_ms": self.connect.snapshot(),
+            "connections": {"new": self.new_connections, "reused": self.reused_connections},
+            "pool": {
+                "in_flight": self.in_flight,
+                "max_in_flight": self.max_in_flight,
+                "limit_per_host": settings.API_HTTP_MAX_CONNECTIONS_PER_HOST,
+                "queued": self.queued,
+                "slot_wait_ms": self.slot_wait.snapshot(),
+            },
+        }
+
+
+def get_http_stats() -> dict:
+    """Per-provider HTTP stats for the health endpoint."""
+    return {provider: stats.snapshot() for provider, stats in _stats.items()}
@@ -0,0 +1,72 @@
+"""Bounded in-process LRU/TTL cache, the first tier in front of Redis.
+
+Holds already-deserialized values so a process re-reading a key it saw a
+few seconds ago skips both the Redis round trip and the JSON parse. Entries
+expire after their own TTL and the least recently used entry is evicted
+once ``max_entries`` is reached. Sizes are supplied by the caller and only
+feed the memory estimate in ``stats``.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+class LocalCache:
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        # key -> (expires_at, size, value), least recently used first
+        self._entries: OrderedDict[str, tuple[float, int, Any]] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, _, value = entry
+        if expires_at <= time.monotonic():
+            self.delete(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl: float, size: int = 0) -> None:
+        """Store ``value`` for ``ttl`` seconds; a non-positive TTL stores nothing."""
+        self.delete(key)
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, size, value)
+        self._bytes += size
+        while len(self._entries) > self.max_entries:
+            _, (_, evicted_size, _) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+            self.evictions += 1
+
+    def delete(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry[1]
+        return True
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "evictions": self.evictions,
+            "approx_bytes": self._bytes,
+        }
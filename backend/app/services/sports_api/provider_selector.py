@@ -0,0 +1,111 @@
+"""Per-call provider ordering from observed latency and success rate.
+
+``SportsDataService`` lists its clients in a fixed priority order (ESPN,
+The Odds API, RapidAPI). ``ProviderSelector`` keeps an exponentially
+weighted moving average (weight API_PROVIDER_EWMA_ALPHA on the newest call)
+of latency and success rate per (provider, league, operation), and ranks
+providers by expected milliseconds per successful answer: latency divided
+by success rate. Providers with too few calls for a league and operation
+rank after the measured ones, in the fixed order, so a fresh process
+behaves as before.
+
+A provider that stops being first is only measured again when it is
+needed as a fallback, so with probability API_PROVIDER_EXPLORATION_RATE a
+call moves a random other provider to the front. Metered providers still
+go through their quota check when explored.
+"""
+
+import random
+
+from app.core.config import settings
+
+# Calls needed before a provider's statistics are used for ranking
+_MIN_SAMPLES = 3
+# Floor on the success rate, so a failing provider ranks last but finite
+_MIN_SUCCESS_RATE = 0.01
+
+
+def _name(provider) -> str:
+    return getattr(provider, "value", provider)
+
+
+class ProviderStats:
+    """EWMA latency and success rate of one provider for one league and operation."""
+
+    def __init__(self):
+        self.latency_ms = 0.0
+        self.success_rate = 1.0
+        self.calls = 0
+
+    def record(self, latency_ms: float, ok: bool) -> None:
+        if self.calls == 0:
+            self.latency_ms, self.success_rate = latency_ms, float(ok)
+        else:
+            alpha = settings.API_PROVIDER_EWMA_ALPHA
+            self.latency_ms += alpha * (latency_ms - self.latency_ms)
+            self.success_rate += alpha * (float(ok) - self.success_rate)
+        self.calls += 1
+
+    def score(self) -> float:
+        """Expected milliseconds per successful answer; lower ranks first."""
+        if self.calls < _MIN_SAMPLES:
+            return float("inf")
+        return self.latency_ms / max(self.success_rate, _MIN_SUCCESS_RATE)
+
+
+class ProviderSelector:
+    def __init__(self):
+        # (provider, league, operation) -> its statistics
+        self.stats: dict[tuple[str, str, str], ProviderStats] = {}
+        self.explorations = 0
+
+    def record(self, provider, league: str, operation: str, latency_ms: float, ok: bool) -> None:
+        key = (_name(provider), league, operation)
+        if key not in self.stats:
+            self.stats[key] = ProviderStats()
+        self.stats[key].record(latency_ms, ok)
+
+    def rank(self, clients: list, league: str, operation: str) -> list:
+        """``clients`` best first; unmeasured ones keep their relative order."""
+        none = ProviderStats()
+        return [
+            client
+            for _, _, client in sorted(
+                (
+                    self.stats.get((_name(client.provider), league, operation), none).score(),
+                    index,
+                    client,
+                )
+                for index, client in enumerate(clients)
+            )
+        ]
+
+    def order(self, clients: list, league: str, operation: str) -> list:
+        """The order to try ``clients`` in for this call, occasionally exploring."""
+        ranked = self.rank(clients, league, operation)
+        explore = random.random() < settings.API_PROVIDER_EXPLORATION_RATE  # noqa: S311
+        if explore and len(ranked) > 1:
+            ranked.insert(0, ranked.pop(random.randrange(1, len(ranked))))  # noqa: S311
+            self.explorations += 1
+        return ranked
+
+    def snapshot(self, clients: list) -> dict:
+        """Statistics and current ranking per league and operation, for the health endpoint."""
+        stats: dict[str, dict] = {}
+        for (provider, league, operation), entry in sorted(self.stats.items()):
+            stats.setdefault(f"{league}:{operation}", {})[provider] = {
+                "latency_ms": round(entry.latency_ms, 1),
+                "success_rate": round(entry.success_rate, 3),
+                "calls": entry.calls,
+            }
+        order = {}
+        for key in stats:
+            league, operation = key.rsplit(":", 1)
+            ranked = self.rank(clients, league, operation)
+            order[key] = [_name(client.provider) for client in ranked]
+        return {
+            "exploration_rate": settings.API_PROVIDER_EXPLORATION_RATE,
+            "explorations": self.explorations,
+            "order": order,
+            "stats": stats,
+        }
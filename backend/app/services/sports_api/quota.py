@@ -0,0 +1,247 @@
+"""Request budgets for metered sports data providers.
+
+The Odds API and RapidAPI bill each request against a monthly quota and
+report what is left in response headers. ``QuotaManager`` records those
+headers in Redis, so every process sees the same budget, and before each
+call to a metered provider takes a token from a bucket also kept in Redis.
+
+The bucket holds at most API_QUOTA_BURST tokens and refills at the pace
+that spreads the remaining budget, less API_QUOTA_RESERVE_REQUESTS, over
+what is left of the billing period (which resets on API_QUOTA_RESET_DAY,
+UTC). As the budget runs down the provider is therefore polled less often,
+and once only the reserve is left it is skipped until the period resets.
+Until a provider has reported its remaining quota, the configured monthly
+budget is assumed; a provider with neither is not paced.
+
+Redis errors fail open: a provider is never skipped because the budget
+could not be read.
+"""
+
+import logging
+import time
+from datetime import UTC, datetime
+
+from app.core.config import settings
+from app.db.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Provider -> setting holding its monthly request budget
+METERED_PROVIDERS = {
+    "the_odds_api": "THE_ODDS_API_MONTHLY_QUOTA",
+    "rapidapi": "RAPIDAPI_MONTHLY_QUOTA",
+}
+_REMAINING_HEADERS = ("x-requests-remaining", "x-ratelimit-requests-remaining")
+_USED_HEADERS = ("x-requests-used",)
+_LIMIT_HEADERS = ("x-ratelimit-requests-limit",)
+
+# Remaining-quota observations kept per provider for the burn rate
+_MAX_SAMPLES = 500
+
+# Take a token if one has accrued. KEYS: budget hash, bucket hash. ARGV: now,
+# assumed remaining ("" if unknown), reserve, seconds until the period resets,
+# burst. Returns 1 (allowed), 0 (paced) or -1 (only the reserve is left).
+_ACQUIRE_SCRIPT = """
+local remaining = tonumber(redis.call("hget", KEYS[1], "remaining") or ARGV[2])
+if remaining == nil then
+    return 1
+end
+local spendable = remaining - tonumber(ARGV[3])
+if spendable <= 0 then
+    return -1
+end
+local now = tonumber(ARGV[1])
+local period = tonumber(ARGV[4])
+local burst = tonumber(ARGV[5])
+local rate = spendable / period
+local tokens = tonumber(redis.call("hget", KEYS[2], "tokens"))
+local updated = tonumber(redis.call("hget", KEYS[2], "updated"))
+if tokens == nil then
+    tokens = burst
+else
+    tokens = math.min(burst, tokens + math.max(0, now - updated) * rate)
+end
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call("hset", KEYS[2], "tokens", tostring(tokens), "updated", ARGV[1])
+redis.call("expire", KEYS[2], math.ceil(period))
+return allowed
+"""
+
+
+def _name(provider) -> str:
+    """Plain name of a provider, which clients hold as an APIProvider member."""
+    return getattr(provider, "value", provider)
+
+
+def _budget_key(provider: str) -> str:
+    return f"api_quota:{provider}"
+
+
+def _bucket_key(provider: str) -> str:
+    return f"api_quota_bucket:{provider}"
+
+
+def _samples_key(provider: str) -> str:
+    return f"api_quota_samples:{provider}"
+
+
+def _header_int(headers, names: tuple[str, ...]) -> int | None:
+    for name in names:
+        value = headers.get(name)
+        if isinstance(value, str):
+            try:
+                return int(float(value))
+            except ValueError:
+                return None
+    return None
+
+
+def period_reset(now: datetime) -> datetime:
+    """Start of the next billing period after ``now`` (UTC)."""
+    day = min(max(settings.API_QUOTA_RESET_DAY, 1), 28)
+    reset = now.replace(day=day, hour=0, minute=0, second=0, microsecond=0)
+    if reset <= now:
+        if reset.month == 12:
+            reset = reset.replace(year=reset.year + 1, month=1)
+        else:
+            reset = reset.replace(month=reset.month + 1)
+    return reset
+
+
+def burn_rate(samples: list[tuple[float, int]], now: float) -> float | None:
+    """Requests used per hour over the burn window, from (time, remaining) samples.
+
+    None until the samples span at least a minute. Samples from before a
+    quota reset (remaining went up) are ignored.
+    """
+    window = [
+        (observed, remaining)
+        for observed, remaining in samples
+        if now - observed <= settings.API_QUOTA_BURN_WINDOW_SECONDS
+    ]
+    window.sort()
+    for i in range(len(window) - 1, 0, -1):
+        if window[i][1] > window[i - 1][1]:
+            window = window[i:]
+            break
+    if len(window) < 2 or window[-1][0] - window[0][0] < 60:
+        return None
+    (first_at, first), (last_at, last) = window[0], window[-1]
+    return (first - last) / (last_at - first_at) * 3600
+
+
+class QuotaManager:
+    """Monthly request budgets of metered providers, shared through Redis."""
+
+    def __init__(self):
+        # Calls skipped in this process, by provider and reason
+        self.skipped: dict[str, dict[str, int]] = {}
+
+    def monthly_quota(self, provider: str) -> int | None:
+        setting = METERED_PROVIDERS.get(provider)
+        quota = getattr(settings, setting) if setting else 0
+        return quota or None
+
+    async def record(self, provider: str, headers) -> None:
+        """Store the remaining quota a provider reported in ``headers``, if any."""
+        remaining = _header_int(headers, _REMAINING_HEADERS)
+        if remaining is None:
+            return
+        provider = _name(provider)
+        used = _header_int(headers, _USED_HEADERS)
+        limit = _header_int(headers, _LIMIT_HEADERS)
+        if limit is None and used is not None:
+            limit = used + remaining
+        now = time.time()
+        budget = {"remaining": remaining, "observed_at": now}
+        if limit is not None:
+            budget["limit"] = limit
+        # Reported figures only hold until the period resets
+        expires = int(period_reset(datetime.now(UTC)).timestamp())
+        try:
+            async with get_redis().pipeline(transaction=False) as pipe:
+                pipe.hset(_budget_key(provider), mapping=budget)
+                pipe.expireat(_budget_key(provider), expires)
+                pipe.lpush(_samples_key(provider), f"{now}:{remaining}")
+                pipe.ltrim(_samples_key(provider), 0, _MAX_SAMPLES - 1)
+                pipe.expire(_samples_key(provider), settings.API_QUOTA_BURN_WINDOW_SECONDS)
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Quota record error for {provider}: {e}")
+
+    async def try_acquire(self, provider: str) -> bool:
+        """Whether ``provider`` may be called now; takes a token from its bucket if so."""
+        provider = _name(provider)
+        if provider not in METERED_PROVIDERS:
+            return True
+        now = datetime.now(UTC)
+        assumed = self.monthly_quota(provider)
+        try:
+            result = await get_redis().eval(
+                _ACQUIRE_SCRIPT,
+                2,
+                _budget_key(provider),
+                _bucket_key(provider),
+                now.timestamp(),
+                "" if assumed is None else assumed,
+                settings.API_QUOTA_RESERVE_REQUESTS,
+                (period_reset(now) - now).total_seconds(),
+                settings.API_QUOTA_BURST,
+            )
+        except Exception as e:
+            logger.error(f"Quota check error for {provider}: {e}")
+            return True
+        if result == 1:
+            return True
+        reason = "reserve" if result == -1 else "paced"
+        counts = self.skipped.setdefault(provider, {"paced": 0, "reserve": 0})
+        counts[reason] += 1
+        return False
+
+    async def get_status(self) -> dict:
+        """Budget, burn rate and projected exhaustion of each metered provider."""
+        now = datetime.now(UTC)
+        reset = period_reset(now)
+        status = {}
+        for provider in METERED_PROVIDERS:
+            try:
+                redis = get_redis()
+                budget = await redis.hgetall(_budget_key(provider))
+                raw_samples = await redis.lrange(_samples_key(provider), 0, -1)
+            except Exception as e:
+                logger.error(f"Quota status error for {provider}: {e}")
+                budget, raw_samples = {}, []
+            remaining = int(budget["remaining"]) if "remaining" in budget else None
+            samples = []
+            for sample in raw_samples:
+                observed, _, value = sample.partition(":")
+                samples.append((float(observed), int(value)))
+            per_hour = burn_rate(samples, now.timestamp())
+            exhaustion = None
+            if remaining is not None and per_hour:
+                exhaustion = datetime.fromtimestamp(
+                    now.timestamp() + remaining / per_hour * 3600, UTC
+                )
+            status[provider] = {
+                "monthly_quota": self.monthly_quota(provider),
+                "limit": int(budget["limit"]) if "limit" in budget else None,
+                "remaining": remaining,
+                "reserve": settings.API_QUOTA_RESERVE_REQUESTS,
+                "observed_at": datetime.fromtimestamp(float(budget["observed_at"]), UTC).isoformat()
+                if "observed_at" in budget
+                else None,
+                "burn_per_hour": round(per_hour, 2) if per_hour is not None else None,
+                "projected_exhaustion": exhaustion.isoformat() if exhaustion else None,
+                "exhausts_before_reset": exhaustion < reset if exhaustion else False,
+                "period_resets_at": reset.isoformat(),
+                "skipped": dict(self.skipped.get(provider, {"paced": 0, "reserve": 0})),
+            }
+        return status
+
+
+# Global quota manager
+quota_manager = QuotaManager()
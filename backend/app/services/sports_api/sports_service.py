@@ -1,27 +1,52 @@
 import asyncio
+import contextlib
+import functools
 import json
 import logging
+import sys
+import time
+import uuid
 from datetime import datetime
 
-import redis
-
 from app.core.config import settings
+from app.db.redis import get_redis
 from app.services.circuit_breaker import (
+    CallSkippedError,
     CircuitBreakerOpenError,
+    SlidingWindowCircuitBreaker,
     circuit_breaker_manager,
 )
+from app.services.sports_api import game_codec
 from app.services.sports_api.base import (
     APIUnavailableError,
     BaseSportsAPIClient,
     GameData,
+    GameList,
     RateLimitExceededError,
 )
 from app.services.sports_api.espn_client import ESPNAPIClient
+from app.services.sports_api.hedging import HedgeBudget, LatencyWindow
+from app.services.sports_api.http_pool import get_http_stats
+from app.services.sports_api.local_cache import LocalCache
+from app.services.sports_api.provider_selector import ProviderSelector
+from app.services.sports_api.quota import quota_manager
 from app.services.sports_api.rapidapi_client import RapidAPIClient
 from app.services.sports_api.theodds_client import TheOddsAPIClient
 
 logger = logging.getLogger(__name__)
 
+# Delete a fetch lock only if this process still holds it
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+_LOCK_POLL_SECONDS = 0.1
+
+# Processes announce freshly cached keys here so others drop their local copies
+CACHE_CHANNEL = "sports_cache_invalidate"
+
 
 class SportsDataService:
     """
@@ -30,8 +55,12 @@ class SportsDataService:
     Features:
     - Circuit breaker pattern for each API
     - Automatic fallback to alternative APIs
-    - Redis caching for API responses
+    - Two-tier caching: a bounded in-process LRU/TTL tier of deserialized
+      games in front of Redis, kept coherent across processes over pub/sub
+    - Stale-while-revalidate and stale-if-error for schedules and live scores
     - Rate limit handling
+    - Single-flight fetches: concurrent requests for the same cache key share
+      one upstream call, in-process and (via a Redis lock) across processes
     """
 
     def __init__(self):
@@ -57,55 +86,74 @@ class SportsDataService:
         if not self.clients:
             logger.warning("SportsDataService: No API clients configured!")
 
-        # Initialize Redis for caching
+        # Cache through the process-wide async Redis pool
         try:
-            self.redis_client = redis.from_url(
-                settings.REDIS_URL,
-                decode_responses=True,
-            )
+            self.redis_client = get_redis()
             logger.info("SportsDataService: Redis cache connected")
         except Exception as e:
             logger.error(f"SportsDataService: Redis connection failed: {e}")
             self.redis_client = None
 
+        self.local_cache = LocalCache(settings.SPORTS_LOCAL_CACHE_MAX_ENTRIES)
+        self.redis_hits = 0
+        self.redis_misses = 0
+        # Tags this instance's invalidation messages so it ignores its own
+        self._instance_id = uuid.uuid4().hex
+        self._listener_task: asyncio.Task | None = None
+
+        # cache key -> task fetching it, shared by every concurrent caller
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.coalesced_requests = 0
+        # Stale entries served, by reason
+        self.stale_served = {"revalidating": 0, "provider_error": 0}
+        # Monthly budgets of metered providers (The Odds API, RapidAPI)
+        self.quotas = quota_manager
+        # Hedged live-score fetches (API_HEDGE_LIVE_SCORES): provider -> recent
+        # successful call latencies, per-league budgets, and outcomes
+        self.live_latency: dict[str, LatencyWindow] = {}
+        self.hedge_budget = HedgeBudget()
+        self.hedging = {"fired": 0, "won": 0, "denied": 0}
+        # Orders self.clients per call from each provider's latency and success rate
+        self.selector = ProviderSelector()
+
     async def get_schedule(
         self,
         league: str,
         start_date: datetime,
         end_date: datetime,
         use_cache: bool = True,
-    ) -> list[GameData]:
+    ) -> GameList:
         """
         Fetch game schedule with automatic failover.
 
         Tries each API in order until one succeeds.
         """
         cache_key = f"schedule:{league}:{start_date.date()}:{end_date.date()}"
+        return await self._get_games(
+            cache_key,
+            lambda: self._fetch_schedule(league, start_date, end_date, cache_key),
+            settings.CACHE_SCHEDULE_SECONDS,
+            use_cache,
+        )
 
-        # Try cache first
-        if use_cache:
-            cached = await self._get_from_cache(cache_key)
-            if cached:
-                logger.info(f"SportsDataService: Cache hit for {cache_key}")
-                return self._deserialize_games(cached)
-
+    async def _fetch_schedule(
+        self, league: str, start_date: datetime, end_date: datetime, cache_key: str
+    ) -> list[GameData]:
         # Try each API in priority order
         last_exception = None
 
-        for client in self.clients:
+        for client in self.selector.order(self.clients, league, "schedule"):
             try:
-                breaker = circuit_breaker_manager.get_breaker(
-                    name=f"{client.provider}_schedule",
-                    failure_threshold=settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
-                    timeout_seconds=settings.CIRCUIT_BREAKER_TIMEOUT_SECONDS,
-                )
+                breaker = self._breaker(client, "schedule")
 
                 logger.info(
                     f"SportsDataService: Attempting {client.provider} for schedule ({league})"
                 )
 
                 # Execute with circuit breaker protection
-                games = await breaker.async_call(client.get_schedule, league, start_date, end_date)
+                games = await self._timed_call(
+                    breaker, client, league, "schedule", client.get_schedule, start_date, end_date
+                )
 
                 if games:
                     logger.info(
@@ -113,10 +161,11 @@ class SportsDataService:
                     )
 
                     # Cache the result
-                    await self._set_cache(
+                    await self._cache_games(
                         cache_key,
-                        self._serialize_games(games),
+                        games,
                         ttl=settings.CACHE_SCHEDULE_SECONDS,
+                        stale_ttl=settings.CACHE_SCHEDULE_STALE_SECONDS,
                     )
 
                     return games
@@ -128,6 +177,9 @@ class SportsDataService:
                 last_exception = e
                 continue
 
+            except CallSkippedError:
+                continue
+
             except RateLimitExceededError as e:
                 logger.warning(
                     f"SportsDataService: {client.provider} rate limit exceeded, trying next API"
@@ -152,76 +204,162 @@ class SportsDataService:
         self,
         league: str,
         use_cache: bool = True,
-    ) -> list[GameData]:
+        revalidate: bool = False,
+    ) -> GameList:
         """
         Fetch live scores with automatic failover.
+
+        With ``revalidate`` a stale cache entry is refreshed before returning
+        rather than in the background; it is only returned if every provider
+        fails. The score job uses this, since it polls about as often as the
+        scores expire and would otherwise always score the previous fetch.
         """
         cache_key = f"live_scores:{league}"
+        return await self._get_games(
+            cache_key,
+            lambda: self._fetch_live_scores(league, cache_key),
+            settings.CACHE_SCORES_SECONDS,
+            use_cache,
+            revalidate,
+        )
 
-        # Try cache first (short TTL for live data)
-        if use_cache:
-            cached = await self._get_from_cache(cache_key)
-            if cached:
-                logger.debug(f"SportsDataService: Cache hit for {cache_key}")
-                return self._deserialize_games(cached)
+    async def _fetch_live_scores(self, league: str, cache_key: str) -> list[GameData]:
+        clients = self.selector.order(self.clients, league, "live_scores")
+        if settings.API_HEDGE_LIVE_SCORES and len(clients) > 1:
+            games = await self._hedged_live_scores(clients, league)
+        else:
+            # Try each API in order
+            games = None
+            for client in clients:
+                games = await self._live_scores_from(client, league)
+                if games is not None:
+                    break
+
+        if games is None:
+            # All APIs failed (each failure is logged by _live_scores_from)
+            logger.error(f"SportsDataService: All APIs failed for live scores ({league})")
+            raise APIUnavailableError(
+                f"Failed to fetch live scores for {league} from all API providers"
+            )
 
-        # Try each API in priority order
-        last_exception = None
+        # Cache with short TTL for live data
+        await self._cache_games(
+            cache_key,
+            games,
+            ttl=settings.CACHE_SCORES_SECONDS,
+            stale_ttl=settings.CACHE_SCORES_STALE_SECONDS,
+        )
+        return games
 
-        for client in self.clients:
-            try:
-                breaker = circuit_breaker_manager.get_breaker(
-                    name=f"{client.provider}_live_scores",
-                    failure_threshold=settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
-                    timeout_seconds=settings.CIRCUIT_BREAKER_TIMEOUT_SECONDS,
-                )
+    async def _live_scores_from(
+        self, client: BaseSportsAPIClient, league: str
+    ) -> list[GameData] | None:
+        """Live scores from one provider, or None if it is skipped or fails."""
+        try:
+            breaker = self._breaker(client, "live_scores")
 
-                logger.debug(
-                    f"SportsDataService: Attempting {client.provider} for live scores ({league})"
-                )
+            logger.debug(
+                f"SportsDataService: Attempting {client.provider} for live scores ({league})"
+            )
 
-                games = await breaker.async_call(client.get_live_scores, league)
+            started = time.perf_counter()
+            games = await self._timed_call(
+                breaker, client, league, "live_scores", client.get_live_scores
+            )
 
-                if games is not None:  # Allow empty list
-                    logger.info(
-                        f"SportsDataService: Success with {client.provider} - {len(games)} live games"
-                    )
+            if games is not None:  # Allow empty list
+                latency = self.live_latency.setdefault(client.provider, LatencyWindow())
+                latency.add((time.perf_counter() - started) * 1000)
+                logger.info(
+                    f"SportsDataService: Success with {client.provider} - {len(games)} live games"
+                )
+            return games
 
-                    # Cache with short TTL for live data
-                    await self._set_cache(
-                        cache_key,
-                        self._serialize_games(games),
-                        ttl=settings.CACHE_SCORES_SECONDS,
-                    )
+        except CircuitBreakerOpenError:
+            logger.warning(
+                f"SportsDataService: {client.provider} circuit breaker is open, skipping"
+            )
 
-                    return games
+        except CallSkippedError:
+            pass
 
-            except CircuitBreakerOpenError:
-                logger.warning(
-                    f"SportsDataService: {client.provider} circuit breaker is open, skipping"
-                )
-                continue
+        except RateLimitExceededError:
+            logger.warning(
+                f"SportsDataService: {client.provider} rate limit exceeded, trying next API"
+            )
 
-            except RateLimitExceededError:
-                logger.warning(
-                    f"SportsDataService: {client.provider} rate limit exceeded, trying next API"
-                )
-                continue
+        except Exception as e:
+            logger.error(f"SportsDataService: {client.provider} failed: {e!s}")
 
-            except Exception as e:
-                logger.error(f"SportsDataService: {client.provider} failed: {e!s}")
-                last_exception = e
-                continue
+        return None
 
-        # All APIs failed
-        logger.error(
-            f"SportsDataService: All APIs failed for live scores ({league}). "
-            f"Last error: {last_exception!s}"
-        )
+    async def _hedged_live_scores(
+        self, clients: list[BaseSportsAPIClient], league: str
+    ) -> list[GameData] | None:
+        """Live scores from the first provider to answer, starting the next one early.
 
-        raise APIUnavailableError(
-            f"Failed to fetch live scores for {league} from all API providers"
-        )
+        The next provider starts when the one in flight fails, or -- while the
+        league's hedge budget lasts -- when it has not answered within its p95
+        latency. The first good answer wins and the others are cancelled.
+        """
+        self.hedge_budget.earn(league)
+        pending: dict[asyncio.Task, BaseSportsAPIClient] = {}
+        hedges: set[BaseSportsAPIClient] = set()
+        next_index = 0
+        can_hedge = True
+
+        def start_next() -> None:
+            nonlocal next_index
+            if next_index < len(clients):
+                client = clients[next_index]
+                next_index += 1
+                pending[asyncio.create_task(self._live_scores_from(client, league))] = client
+
+        start_next()
+        newest = clients[0]
+        try:
+            while pending:
+                delay = None
+                if can_hedge and next_index < len(clients):
+                    delay = self._hedge_delay(newest)
+                done, _ = await asyncio.wait(
+                    pending, timeout=delay, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    if not self.hedge_budget.spend(league):
+                        self.hedging["denied"] += 1
+                        can_hedge = False
+                        continue
+                    self.hedging["fired"] += 1
+                    newest = clients[next_index]
+                    hedges.add(newest)
+                    logger.info(
+                        f"SportsDataService: No live scores ({league}) within {delay:.3f}s, "
+                        f"hedging with {newest.provider}"
+                    )
+                    start_next()
+                    continue
+                for task in done:
+                    client = pending.pop(task)
+                    games = task.result()
+                    if games is not None:
+                        if client in hedges:
+                            self.hedging["won"] += 1
+                        return games
+                    # Failed: fall back to the next provider at once
+                    start_next()
+                    newest = clients[next_index - 1]
+            return None
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def _hedge_delay(self, client: BaseSportsAPIClient) -> float:
+        """Seconds to wait on ``client`` before hedging: its p95 live-score latency."""
+        latency = self.live_latency.get(client.provider)
+        p95 = latency.percentile(0.95) if latency else None
+        return (p95 if p95 is not None else settings.API_HEDGE_DEFAULT_DELAY_MS) / 1000
 
     async def get_game_details(
         self,
@@ -236,22 +374,28 @@ class SportsDataService:
 
         # Try cache first
         if use_cache:
-            cached = await self._get_from_cache(cache_key)
-            if cached:
+            cached = await self._get_cached_games(cache_key, settings.CACHE_SCORES_SECONDS)
+            if cached is not None and not cached.stale:
                 logger.debug(f"SportsDataService: Cache hit for {cache_key}")
-                games = self._deserialize_games(cached)
-                return games[0] if games else None
+                return cached[0] if cached else None
+
+        return await self._single_flight(
+            cache_key,
+            lambda: self._fetch_game_details(league, game_id, cache_key),
+            self._first_cached_game if use_cache else None,
+        )
 
+    async def _fetch_game_details(
+        self, league: str, game_id: str, cache_key: str
+    ) -> GameData | None:
         # Try each API
-        for client in self.clients:
+        for client in self.selector.order(self.clients, league, "game_details"):
             try:
-                breaker = circuit_breaker_manager.get_breaker(
-                    name=f"{client.provider}_game_details",
-                    failure_threshold=settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
-                    timeout_seconds=settings.CIRCUIT_BREAKER_TIMEOUT_SECONDS,
-                )
+                breaker = self._breaker(client, "game_details")
 
-                game = await breaker.async_call(client.get_game_details, league, game_id)
+                game = await self._timed_call(
+                    breaker, client, league, "game_details", client.get_game_details, game_id
+                )
 
                 if game:
                     logger.info(
@@ -259,15 +403,11 @@ class SportsDataService:
                     )
 
                     # Cache the result
-                    await self._set_cache(
-                        cache_key,
-                        self._serialize_games([game]),
-                        ttl=settings.CACHE_SCORES_SECONDS,
-                    )
+                    await self._cache_games(cache_key, [game], ttl=settings.CACHE_SCORES_SECONDS)
 
                     return game
 
-            except (CircuitBreakerOpenError, RateLimitExceededError):
+            except (CircuitBreakerOpenError, CallSkippedError, RateLimitExceededError):
                 continue
             except Exception as e:
                 logger.error(f"SportsDataService: {client.provider} failed: {e!s}")
@@ -276,121 +416,407 @@ class SportsDataService:
         logger.error(f"SportsDataService: All APIs failed for game {game_id}")
         return None
 
+    def _breaker(self, client: BaseSportsAPIClient, operation: str):
+        """The circuit breaker guarding ``operation`` calls to ``client``.
+
+        Sliding-window breakers are probed with a live-score request for
+        CIRCUIT_BREAKER_PROBE_LEAGUE, the provider's cheapest call, which
+        goes through the request budget like any other.
+        """
+        breaker = circuit_breaker_manager.get_breaker(
+            name=f"{client.provider}_{operation}",
+            failure_threshold=settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+            timeout_seconds=settings.CIRCUIT_BREAKER_TIMEOUT_SECONDS,
+        )
+        if isinstance(breaker, SlidingWindowCircuitBreaker) and breaker.probe_call is None:
+            breaker.probe_call = functools.partial(
+                self._metered_call,
+                client,
+                client.get_live_scores,
+                settings.CIRCUIT_BREAKER_PROBE_LEAGUE,
+            )
+        return breaker
+
+    async def _timed_call(
+        self, breaker, client: BaseSportsAPIClient, league: str, operation: str, call, *args
+    ):
+        """``call(league, *args)`` through ``breaker``, recording the outcome for ordering.
+
+        The provider's request budget is only checked once the breaker has
+        admitted the call, so calls an open breaker rejects spend nothing.
+        """
+        started = time.perf_counter()
+        try:
+            result = await breaker.async_call(self._metered_call, client, call, league, *args)
+        except (CircuitBreakerOpenError, CallSkippedError):
+            raise
+        except Exception:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self.selector.record(client.provider, league, operation, elapsed_ms, ok=False)
+            raise
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.selector.record(client.provider, league, operation, elapsed_ms, ok=True)
+        return result
+
+    async def _within_quota(self, client: BaseSportsAPIClient) -> bool:
+        """Whether a metered provider's request budget allows calling it now."""
+        if await self.quotas.try_acquire(client.provider):
+            return True
+        logger.info(f"SportsDataService: {client.provider} request budget is low, skipping")
+        return False
+
+    async def _metered_call(self, client: BaseSportsAPIClient, call, *args):
+        """``call(*args)`` if the provider's request budget allows; CallSkippedError if not."""
+        if not await self._within_quota(client):
+            raise CallSkippedError(f"{client.provider} request budget is low")
+        return await call(*args)
+
+    def _first_cached_game(self, cached: str) -> GameData | None:
+        games = self._fresh_games(cached, settings.CACHE_SCORES_SECONDS)
+        return games[0] if games else None
+
+    async def _get_games(
+        self, key: str, fetch, ttl: int, use_cache: bool, revalidate: bool = False
+    ) -> GameList:
+        """Games for ``key``, from the cache while younger than ``ttl``, else ``fetch()``.
+
+        Redis keeps each entry for a further *_STALE_SECONDS. A stale entry
+        is returned at once, marked stale, while one background fetch
+        refreshes it (with ``revalidate``, the caller waits for that fetch
+        instead); and if a fetch fails on every provider, the stale entry is
+        returned in place of the error (even when bypassing the cache).
+        """
+        if use_cache:
+            cached = await self._get_cached_games(key, ttl)
+            if cached is not None and not cached.stale:
+                logger.debug(f"SportsDataService: Cache hit for {key}")
+                return cached
+            if cached is not None and not revalidate:
+                self.stale_served["revalidating"] += 1
+                logger.info(
+                    f"SportsDataService: Serving {key} ({cached.age_seconds:.0f}s old) "
+                    "while refreshing"
+                )
+                self._refresh_in_background(key, fetch, lambda data: self._fresh_games(data, ttl))
+                return cached
+
+        try:
+            games = await self._single_flight(
+                key, fetch, (lambda data: self._fresh_games(data, ttl)) if use_cache else None
+            )
+        except APIUnavailableError:
+            stale = await self._get_cached_games(key, ttl)
+            if stale is None:
+                raise
+            self.stale_served["provider_error"] += 1
+            logger.warning(
+                f"SportsDataService: All APIs failed, serving {key} "
+                f"({stale.age_seconds:.0f}s old) from cache"
+            )
+            return stale
+        return GameList(games, getattr(games, "age_seconds", 0.0))
+
+    def _start_fetch(self, key: str, fetch, from_cache) -> asyncio.Task:
+        task = asyncio.ensure_future(self._fetch_once(key, fetch, from_cache))
+        self._inflight[key] = task
+        task.add_done_callback(
+            lambda done: self._inflight.pop(key) if self._inflight.get(key) is done else None
+        )
+        return task
+
+    async def _single_flight(self, key: str, fetch, from_cache):
+        """Await one shared ``fetch()`` for every concurrent caller of ``key``.
+
+        The first caller starts the fetch; later callers await the same task
+        (shielded, so one caller being cancelled never cancels it for the
+        rest). Failures propagate to every waiter and the next call retries.
+        ``from_cache`` decodes a cached value, returning None if it is not
+        fresh; without one (callers bypassing the cache) the result is never
+        taken from another process's fetch.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._start_fetch(key, fetch, from_cache)
+        else:
+            self.coalesced_requests += 1
+            logger.debug(f"SportsDataService: Joined in-flight fetch for {key}")
+        return await asyncio.shield(task)
+
+    def _refresh_in_background(self, key: str, fetch, from_cache) -> None:
+        """Start a fetch of ``key`` nobody awaits, unless one is already running."""
+        if key in self._inflight:
+            return
+
+        def _log_failure(task: asyncio.Task) -> None:
+            if not task.cancelled() and task.exception() is not None:
+                logger.warning(
+                    f"SportsDataService: Background refresh of {key} failed: {task.exception()}"
+                )
+
+        self._start_fetch(key, fetch, from_cache).add_done_callback(_log_failure)
+
+    async def _fetch_once(self, key: str, fetch, from_cache):
+        """Run ``fetch()`` unless another process already holds the fetch lock for ``key``.
+
+        With SPORTS_FETCH_LOCK_SECONDS set, the fetching process takes
+        ``fetch_lock:{key}`` in Redis; other processes wait for it to fill the
+        cache and read the result from there. If the holder finishes without
+        caching anything, or the lock expires, the waiter fetches itself.
+        """
+        lock_seconds = settings.SPORTS_FETCH_LOCK_SECONDS
+        if not lock_seconds or not self.redis_client or from_cache is None:
+            return await fetch()
+
+        lock_key = f"fetch_lock:{key}"
+        token = uuid.uuid4().hex
+        try:
+            acquired = await self.redis_client.set(lock_key, token, nx=True, ex=lock_seconds)
+        except Exception as e:
+            logger.error(f"Redis fetch lock error: {e}")
+            return await fetch()
+
+        if acquired:
+            try:
+                return await fetch()
+            finally:
+                try:
+                    await self.redis_client.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+                except Exception as e:
+                    logger.error(f"Redis fetch lock release error: {e}")
+
+        deadline = time.monotonic() + lock_seconds
+        while time.monotonic() < deadline:
+            # One round trip per poll. The holder caches before releasing,
+            # so the lock is read first.
+            try:
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    pipe.exists(lock_key)
+                    pipe.get(key)
+                    held, cached = await pipe.execute()
+            except Exception as e:
+                logger.error(f"Redis fetch lock poll error: {e}")
+                break
+            # Until the holder caches a fresh value, the key may hold a stale one
+            result = from_cache(cached) if cached else None
+            if result is not None:
+                self.coalesced_requests += 1
+                logger.debug(f"SportsDataService: Used another process's fetch for {key}")
+                return result
+            if not held:
+                break
+            await asyncio.sleep(_LOCK_POLL_SECONDS)
+        return await fetch()
+
     def get_api_health_status(self) -> dict:
         """Get health status of all API providers and circuit breakers"""
+        redis_lookups = self.redis_hits + self.redis_misses
         return {
             "configured_apis": [client.provider for client in self.clients],
+            # Provider responses reused without decoding (304 or identical body)
+            "skipped_parses": {client.provider: client.skipped_parses for client in self.clients},
+            # Shared HTTP pool: latency / connect histograms and host-slot usage
+            "http": get_http_stats(),
             "circuit_breakers": circuit_breaker_manager.get_all_status(),
             "cache_status": "connected" if self.redis_client else "disconnected",
+            "cache_tiers": {
+                "local": self.local_cache.stats(),
+                "redis": {
+                    "hits": self.redis_hits,
+                    "misses": self.redis_misses,
+                    "hit_ratio": round(self.redis_hits / redis_lookups, 4)
+                    if redis_lookups
+                    else None,
+                },
+            },
+            "single_flight": {
+                "in_flight": len(self._inflight),
+                "coalesced_requests": self.coalesced_requests,
+            },
+            "stale_served": dict(self.stale_served),
+            # Per-call provider ordering (ProviderSelector)
+            "provider_selection": self.selector.snapshot(self.clients),
+            "hedging": {
+                "enabled": settings.API_HEDGE_LIVE_SCORES,
+                **self.hedging,
+                "delay_ms": {
+                    provider: latency.percentile(0.95)
+                    for provider, latency in self.live_latency.items()
+                },
+            },
         }
 
-    async def _get_from_cache(self, key: str) -> str | None:
-        """Get value from Redis cache (runs sync client in executor to avoid blocking)"""
+    async def _get_cached_games(self, key: str, ttl: int) -> GameList | None:
+        """Cached games for ``key`` from the local tier, else Redis; None on a miss.
+
+        The result is marked stale once it is older than ``ttl``. A Redis
+        hit is deserialized once and, while fresh, kept locally for
+        SPORTS_LOCAL_CACHE_SECONDS, capped by the time it has left to be
+        fresh. When any process caches a fresh value it broadcasts an
+        invalidation, so local copies never outlive the Redis entry they
+        came from by more than that. Callers get their own list; the
+        GameData objects are shared and must not be mutated.
+        """
+        entry = self.local_cache.get(key)
+        if entry is not None:
+            return _game_list(*entry, ttl)
         if not self.redis_client:
             return None
         try:
-            loop = asyncio.get_running_loop()
-            value = await loop.run_in_executor(None, self.redis_client.get, key)
-            return value
+            cached = await self.redis_client.get(key)
         except Exception as e:
             logger.error(f"Redis get error: {e}")
             return None
+        decoded = self._decode_entry(cached) if cached else None
+        if decoded is None:
+            self.redis_misses += 1
+            return None
+        self.redis_hits += 1
+        games, cached_at = decoded
+        self._store_local(key, games, cached_at, ttl)
+        return _game_list(games, cached_at, ttl)
+
+    def _fresh_games(self, data: str, ttl: int) -> GameList | None:
+        """Decode a Redis entry, or None if it is unreadable or older than ``ttl``."""
+        decoded = self._decode_entry(data)
+        if decoded is None:
+            return None
+        games = _game_list(*decoded, ttl)
+        return None if games.stale else games
+
+    async def _cache_games(
+        self, key: str, games: list[GameData], ttl: int, stale_ttl: int = 0
+    ) -> None:
+        """Write freshly fetched games to both tiers and tell other processes.
+
+        Redis keeps the entry ``stale_ttl`` seconds past ``ttl`` so it can
+        still be served, marked stale, while refreshing or if providers fail.
+        """
+        cached_at = time.time()
+        serialized = self._encode_entry(games, cached_at)
+        await self._set_cache(key, serialized, ttl=ttl + stale_ttl)
+        # Keep what a Redis hit would produce (no raw_data), not the provider objects
+        self._store_local(key, self._decode_entry(serialized)[0], cached_at, ttl)
+        await self._publish_invalidation(key)
+
+    def _store_local(
+        self, key: str, games: list[GameData], cached_at: float | None, ttl: int
+    ) -> None:
+        fresh_for = ttl - _age(cached_at)
+        local_ttl = min(settings.SPORTS_LOCAL_CACHE_SECONDS, fresh_for)
+        if local_ttl > 0:
+            self.local_cache.set(key, (games, cached_at), local_ttl, size=_approx_size(games))
+
+    async def _publish_invalidation(self, key: str) -> None:
+        if not self.redis_client or settings.SPORTS_LOCAL_CACHE_SECONDS <= 0:
+            return
+        message = json.dumps({"origin": self._instance_id, "keys": [key]})
+        try:
+            await self.redis_client.publish(CACHE_CHANNEL, message)
+        except Exception as e:
+            logger.error(f"Redis cache invalidation publish error: {e}")
+
+    def invalidate_local(self, keys) -> None:
+        """Drop ``keys`` from this process's local tier."""
+        for key in keys:
+            self.local_cache.delete(key)
+
+    async def start_cache_listener(self):
+        """Drop local entries when another process caches a fresh value.
+
+        Runs as a background task in each process that serves from the local
+        tier (the API and the worker).
+        """
+        if self._listener_task is None and settings.SPORTS_LOCAL_CACHE_SECONDS > 0:
+            self._listener_task = asyncio.create_task(self._listen_loop())
+            logger.info("SportsDataService: cache invalidation listener started")
+
+    async def stop_cache_listener(self):
+        if self._listener_task:
+            self._listener_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener_task
+            self._listener_task = None
+            logger.info("SportsDataService: cache invalidation listener stopped")
+
+    async def _listen_loop(self):
+        """Apply invalidation messages, reconnecting with backoff on errors.
+
+        While disconnected the local tier may serve a superseded value for up
+        to SPORTS_LOCAL_CACHE_SECONDS, so it is cleared after reconnecting.
+        """
+        retry_delay = 1
+        while True:
+            try:
+                pubsub = self.redis_client.pubsub()
+                try:
+                    await pubsub.subscribe(CACHE_CHANNEL)
+                    self.local_cache.clear()
+                    retry_delay = 1
+                    async for message in pubsub.listen():
+                        if message["type"] != "message":
+                            continue
+                        try:
+                            data = json.loads(message["data"])
+                            if data["origin"] != self._instance_id:
+                                self.invalidate_local(data["keys"])
+                        except (json.JSONDecodeError, KeyError, TypeError) as e:
+                            logger.warning(f"Malformed message on cache channel: {e}")
+                finally:
+                    await pubsub.aclose()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Cache invalidation listener error: {e}, retrying in {retry_delay}s")
+                await asyncio.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, 30)
 
     async def _set_cache(self, key: str, value: str, ttl: int):
-        """Set value in Redis cache with TTL (runs sync client in executor to avoid blocking)"""
+        """Set value in Redis cache with TTL"""
         if not self.redis_client:
             return
         try:
-            loop = asyncio.get_running_loop()
-            await loop.run_in_executor(None, self.redis_client.setex, key, ttl, value)
+            await self.redis_client.setex(key, ttl, value)
         except Exception as e:
             logger.error(f"Redis set error: {e}")
 
     def _serialize_games(self, games: list[GameData]) -> str:
-        """Serialize GameData objects to JSON for Redis cache.
+        """Serialize GameData objects for the Redis cache (fetch time unknown)."""
+        return game_codec.encode(games)
 
-        Only stores fields relevant to competition rules -- no raw API bloat.
-        raw_data is intentionally excluded: ESPN event payloads are 50-200KB
-        each and would inflate the cache by 10-100x with no benefit.
+    def _encode_entry(self, games: list[GameData], cached_at: float) -> str:
+        """Serialize a cache entry: the games plus when they were fetched."""
+        return game_codec.encode(games, cached_at)
+
+    def _decode_entry(self, data: str) -> tuple[list[GameData], float | None] | None:
+        """Games and fetch time of a cache entry, in the current or an older format.
+
+        None if the entry cannot be read.
         """
-        data = []
-        for game in games:
-            game_dict = {
-                "external_id": game.external_id,
-                "home_team": game.home_team,
-                "away_team": game.away_team,
-                "scheduled_start_time": game.scheduled_start_time.isoformat(),
-                "status": game.status,
-                "home_score": game.home_score,
-                "away_score": game.away_score,
-                "venue": game.venue,
-                "home_team_external_id": game.home_team_external_id,
-                "away_team_external_id": game.away_team_external_id,
-                "home_team_abbreviation": game.home_team_abbreviation,
-                "away_team_abbreviation": game.away_team_abbreviation,
-                "home_team_wins": game.home_team_wins,
-                "home_team_losses": game.home_team_losses,
-                "home_team_ties": game.home_team_ties,
-                "away_team_wins": game.away_team_wins,
-                "away_team_losses": game.away_team_losses,
-                "away_team_ties": game.away_team_ties,
-                "spread": game.spread,
-                "over_under": game.over_under,
-            }
-            data.append(game_dict)
-        return json.dumps(data)
+        return game_codec.decode(data)
 
     def _deserialize_games(self, data: str) -> list[GameData]:
-        """Deserialize JSON to GameData objects.
+        """Deserialize a cache entry to GameData objects (none if unreadable)."""
+        decoded = self._decode_entry(data)
+        return decoded[0] if decoded else []
 
-        Failures are isolated per-game so a single bad cache entry does not
-        silently drop the entire league's game list.
-        """
-        try:
-            games_data = json.loads(data)
-        except Exception as e:
-            logger.error(f"Error parsing cached game JSON: {e}")
-            return []
 
-        games = []
-        for i, game_dict in enumerate(games_data):
-            try:
-                game = GameData(
-                    external_id=game_dict["external_id"],
-                    home_team=game_dict["home_team"],
-                    away_team=game_dict["away_team"],
-                    scheduled_start_time=datetime.fromisoformat(game_dict["scheduled_start_time"]),
-                    status=game_dict["status"],
-                    home_score=game_dict.get("home_score"),
-                    away_score=game_dict.get("away_score"),
-                    venue=game_dict.get("venue"),
-                    home_team_external_id=game_dict.get("home_team_external_id"),
-                    away_team_external_id=game_dict.get("away_team_external_id"),
-                    home_team_abbreviation=game_dict.get("home_team_abbreviation"),
-                    away_team_abbreviation=game_dict.get("away_team_abbreviation"),
-                    home_team_wins=game_dict.get("home_team_wins"),
-                    home_team_losses=game_dict.get("home_team_losses"),
-                    home_team_ties=game_dict.get("home_team_ties"),
-                    away_team_wins=game_dict.get("away_team_wins"),
-                    away_team_losses=game_dict.get("away_team_losses"),
-                    away_team_ties=game_dict.get("away_team_ties"),
-                    spread=game_dict.get("spread"),
-                    over_under=game_dict.get("over_under"),
-                )
-                games.append(game)
-            except Exception as e:
-                external_id = game_dict.get("external_id", f"index={i}")
-                logger.error(f"Error deserializing game {external_id}: {e}")
-                continue
-        return games
+def _age(cached_at: float | None) -> float:
+    """Seconds since ``cached_at``; 0 when unknown."""
+    return max(0.0, time.time() - cached_at) if cached_at else 0.0
+
+
+def _game_list(games: list[GameData], cached_at: float | None, ttl: int) -> GameList:
+    age = _age(cached_at)
+    return GameList(games, age_seconds=age, stale=age >= ttl)
 
-    async def close(self):
-        """Close all API clients and connections"""
-        for client in self.clients:
-            await client.close()
 
-        if self.redis_client:
-            self.redis_client.close()
+def _approx_size(games: list[GameData]) -> int:
+    """Rough in-memory size of a cached game list: the objects and their field values."""
+    size = sys.getsizeof(games)
+    for game in games:
+        size += sys.getsizeof(game) + sys.getsizeof(game.raw_data)
+        size += sum(sys.getsizeof(value) for value in game.to_cache())
+    return size
 
 
 # Global instance
@@ -50,14 +50,8 @@ class TheOddsAPIClient(BaseSportsAPIClient):
                 "dateFormat": "iso",
             }
 
-            response = await self._make_request("GET", url, params=params)
-
-            games = []
-            if isinstance(response, list):
-                for event in response:
-                    game_data = self._parse_event(event)
-                    if game_data and start_date <= game_data.scheduled_start_time <= end_date:
-                        games.append(game_data)
+            events = await self._get_parsed(url, self._parse_odds_events, params=params)
+            games = [g for g in events if start_date <= g.scheduled_start_time <= end_date]
 
             logger.info(f"TheOddsAPI: Fetched {len(games)} games for {league}")
             return games
@@ -80,19 +74,10 @@ class TheOddsAPIClient(BaseSportsAPIClient):
                 "dateFormat": "iso",
             }
 
-            response = await self._make_request("GET", url, params=params)
-
-            games = []
-            if isinstance(response, list):
-                for event in response:
-                    # Filter for completed or live games
-                    if not event.get("completed", False):
-                        game_data = self._parse_score_event(event)
-                        if game_data:
-                            games.append(game_data)
+            games = await self._get_parsed(url, self._parse_live_score_events, params=params)
 
             logger.info(f"TheOddsAPI: Fetched {len(games)} live games for {league}")
-            return games
+            return list(games)
 
         except RateLimitExceededError:
             raise
@@ -130,6 +115,22 @@ class TheOddsAPIClient(BaseSportsAPIClient):
             logger.error(f"TheOddsAPI: Error fetching game {game_id}: {e!s}")
             return None
 
+    def _parse_odds_events(self, response) -> list[GameData]:
+        if not isinstance(response, list):
+            return []
+        return [game for game in map(self._parse_event, response) if game]
+
+    def _parse_live_score_events(self, response) -> list[GameData]:
+        games = []
+        if isinstance(response, list):
+            for event in response:
+                # Filter for completed or live games
+                if not event.get("completed", False):
+                    game_data = self._parse_score_event(event)
+                    if game_data:
+                        games.append(game_data)
+        return games
+
     def _extract_odds(self, event: dict) -> tuple[float | None, float | None]:
         """Extract spread and over/under from bookmaker data.
 
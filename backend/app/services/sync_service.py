@@ -1,8 +1,10 @@
+import asyncio
 import logging
 from datetime import UTC, datetime, timedelta
 
 from sqlalchemy import and_, select
 
+from app.core.config import settings
 from app.models.competition import Competition
 from app.models.game import Game, GameStatus
 from app.models.league import Team
@@ -12,6 +14,33 @@ from app.services.sports_api.sports_service import sports_service
 logger = logging.getLogger(__name__)
 
 
+async def fetch_schedule_range(league_key: str, start: datetime, end: datetime) -> list[GameData]:
+    """Fetch every day from ``start`` through ``end`` and merge the results.
+
+    Days are requested concurrently, at most SCHEDULE_FETCH_CONCURRENCY at a
+    time, and each keeps its own per-day schedule cache entry. Games that
+    appear on more than one day's scoreboard are kept once, by external_id,
+    in day order. If any day fails the error is raised, as a serial fetch
+    would.
+    """
+    days = [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+    semaphore = asyncio.Semaphore(settings.SCHEDULE_FETCH_CONCURRENCY)
+
+    async def _fetch_day(day: datetime) -> list[GameData]:
+        async with semaphore:
+            return await sports_service.get_schedule(league_key, day, day)
+
+    results = await asyncio.gather(*(_fetch_day(day) for day in days), return_exceptions=True)
+
+    games: dict[str, GameData] = {}
+    for day_games in results:
+        if isinstance(day_games, BaseException):
+            raise day_games
+        for game_data in day_games:
+            games.setdefault(game_data.external_id, game_data)
+    return list(games.values())
+
+
 async def _find_or_create_team(
     db,
     league_id,
@@ -110,8 +139,11 @@ async def _sync_game_for_competition(
 
         # Score picks when game just completed.
         if was_not_final and new_status == GameStatus.FINAL:
+            if existing_game.end_time is None:
+                existing_game.end_time = datetime.utcnow()
             try:
                 await score_picks_for_game(db, existing_game)
+                existing_game.scoring_completed = True
             except Exception as score_err:
                 logger.critical(
                     f"Pick scoring failed for game {existing_game.id} after marking FINAL. "
@@ -167,12 +199,7 @@ async def sync_games_for_competition(db, competition_id: str) -> dict:
     comp_end = competition.end_date.replace(hour=0, minute=0, second=0, microsecond=0)
     fetch_through = min(comp_end, today + timedelta(days=14))
 
-    api_games: list = []
-    current = today
-    while current <= fetch_through:
-        day_games = await sports_service.get_schedule(league_key, current, current)
-        api_games.extend(day_games)
-        current += timedelta(days=1)
+    api_games = await fetch_schedule_range(league_key, today, fetch_through)
 
     if not api_games:
         return {
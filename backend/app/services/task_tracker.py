@@ -0,0 +1,91 @@
+"""Status tracking for long-running admin background tasks.
+
+A task record is a small JSON document stored in Redis under
+``admin_task:{task_id}`` with a TTL, through the shared async client
+(``app.db.redis.get_redis``), so the API process that accepted the request
+and any worker that runs it see the same progress. Admin endpoints poll it
+to report status and progress.
+
+Falls back to an in-memory dict when Redis is unavailable (development).
+The in-memory store is process-local: a task recorded there is only visible
+to the process that wrote it, and does NOT survive restarts. That is enough
+for a single-process deployment, where the API runs its own background
+tasks; with a separate worker, production deployments MUST have Redis.
+"""
+
+import json
+import logging
+import uuid
+from datetime import datetime
+from typing import Any
+
+from app.db.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Keep finished task records around long enough for admins to check results
+TASK_TTL_SECONDS = 24 * 3600
+
+# Single-process fallback for when Redis is unavailable
+_memory_tasks: dict[str, dict[str, Any]] = {}
+
+
+def _key(task_id: str) -> str:
+    return f"admin_task:{task_id}"
+
+
+async def _save(task: dict[str, Any]) -> None:
+    try:
+        await get_redis().setex(_key(task["id"]), TASK_TTL_SECONDS, json.dumps(task))
+        return
+    except Exception as e:
+        logger.warning(f"Redis task save failed, using memory fallback: {e}")
+
+    _memory_tasks[task["id"]] = task
+
+
+async def get_task(task_id: str) -> dict[str, Any] | None:
+    """Return the task record, or None if unknown or expired."""
+    try:
+        raw = await get_redis().get(_key(task_id))
+        if raw:
+            return json.loads(raw)
+    except Exception as e:
+        logger.warning(f"Redis task lookup failed, using memory fallback: {e}")
+
+    return _memory_tasks.get(task_id)
+
+
+async def create_task(kind: str, **details: Any) -> dict[str, Any]:
+    """Register a new pending task and return its record."""
+    task = {
+        "id": str(uuid.uuid4()),
+        "kind": kind,
+        "status": "pending",
+        "stage": None,
+        "progress": 0,
+        "details": details,
+        "result": None,
+        "error": None,
+        "created_at": datetime.utcnow().isoformat(),
+        "finished_at": None,
+    }
+    await _save(task)
+    return task
+
+
+async def update_task(task_id: str, **fields: Any) -> dict[str, Any] | None:
+    """Merge ``fields`` into an existing task record.
+
+    Setting ``status`` to ``completed`` or ``failed`` stamps ``finished_at``.
+    """
+    task = await get_task(task_id)
+    if task is None:
+        logger.warning(f"Cannot update unknown task {task_id}")
+        return None
+
+    task.update(fields)
+    if fields.get("status") in ("completed", "failed"):
+        task["finished_at"] = datetime.utcnow().isoformat()
+    await _save(task)
+    return task
@@ -15,6 +15,7 @@ from typing import Any
 from fastapi import WebSocket
 
 from app.core.config import settings
+from app.db.redis import get_redis
 
 logger = logging.getLogger(__name__)
 
@@ -80,12 +81,8 @@ class ScoreManager:
         When Redis is unavailable, falls back to direct broadcast.
         """
         try:
-            import redis.asyncio as aioredis
-
-            r = aioredis.from_url(settings.REDIS_URL)
             message = json.dumps({"type": "score_update", "games": games})
-            await r.publish(SCORE_CHANNEL, message)
-            await r.aclose()
+            await get_redis().publish(SCORE_CHANNEL, message)
             logger.debug(f"Published {len(games)} score updates to Redis channel")
         except Exception as e:
             logger.warning(f"Redis publish failed, falling back to direct broadcast: {e}")
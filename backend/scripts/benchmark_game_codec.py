@@ -0,0 +1,152 @@
+"""
+Cached GameData encoding benchmark.
+
+Builds a full NCAA men's basketball slate (a busy Saturday: --games games
+between 362 teams, tip-offs on the hour and half hour, most with odds) and
+compares, per cache entry:
+
+- json-v1:    the previous format, {"cached_at", "games": [one dict per game]}
+- compact-v2: app.services.sports_api.game_codec (string table + keyless rows)
+
+reporting bytes stored and median encode/decode time, then the cost of the
+GameData objects a decode produces: bytes per game against the same
+constructor on an unslotted class, and ``GameData.from_cache`` against
+keyword construction. Needs no services.
+
+Run with: python -m scripts.benchmark_game_codec [--games 180] [--runs 200]
+"""
+
+import argparse
+import json
+import random
+import statistics
+import time
+import tracemalloc
+from datetime import UTC, datetime, timedelta
+
+from app.services.sports_api import game_codec
+from app.services.sports_api.base import GameData
+
+_TEAMS = 362
+
+
+def _slate(count: int) -> list[GameData]:
+    rng = random.Random(17)
+    first_tip = datetime(2026, 2, 21, 16, tzinfo=UTC)
+    games = []
+    for i in range(count):
+        home, away = rng.sample(range(_TEAMS), 2)
+        status = rng.choice(("scheduled", "scheduled", "in_progress", "final"))
+        started = status != "scheduled"
+        odds = rng.random() < 0.8
+        games.append(
+            GameData(
+                external_id=str(401_700_000 + i),
+                home_team=f"University {home} Wildcats",
+                away_team=f"State College {away} Bulldogs",
+                scheduled_start_time=first_tip + timedelta(minutes=30 * rng.randrange(20)),
+                status=status,
+                home_score=rng.randrange(40, 95) if started else None,
+                away_score=rng.randrange(40, 95) if started else None,
+                venue=f"Arena {home}",
+                home_team_external_id=str(2000 + home),
+                away_team_external_id=str(2000 + away),
+                home_team_abbreviation=f"H{home}",
+                away_team_abbreviation=f"A{away}",
+                home_team_wins=rng.randrange(25),
+                home_team_losses=rng.randrange(25),
+                away_team_wins=rng.randrange(25),
+                away_team_losses=rng.randrange(25),
+                spread=rng.randrange(-30, 30) / 2 if odds else None,
+                over_under=rng.randrange(250, 320) / 2 if odds else None,
+            )
+        )
+    return games
+
+
+def _encode_v1(games: list[GameData], cached_at: float) -> str:
+    return json.dumps(
+        {
+            "cached_at": cached_at,
+            "games": [
+                {
+                    field: game.scheduled_start_time.isoformat()
+                    if field == "scheduled_start_time"
+                    else getattr(game, field)
+                    for field in game_codec.FIELDS
+                }
+                for game in games
+            ],
+        }
+    )
+
+
+def _median_us(fn, runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1_000_000)
+    return statistics.median(timings)
+
+
+def _bytes_per_game(cls, games: list[GameData]) -> float:
+    tracemalloc.start()
+    built = [
+        cls(**{field: getattr(game, field) for field in GameData.CACHE_FIELDS}) for game in games
+    ]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(built) == len(games)
+    return size / len(games)
+
+
+def _game_objects(games: list[GameData], runs: int) -> None:
+    class PlainGameData:
+        __init__ = GameData.__init__
+
+    rows = [game.to_cache() for game in games]
+    keywords = [
+        {
+            **dict(zip(GameData.CACHE_FIELDS, row, strict=True)),
+            "scheduled_start_time": game.scheduled_start_time,
+        }
+        for game, row in zip(games, rows, strict=True)
+    ]
+    print()
+    print(f"{'GameData':<12} {'bytes/game':>11}")
+    print(f"{'slotted':<12} {_bytes_per_game(GameData, games):>11.0f}")
+    print(f"{'unslotted':<12} {_bytes_per_game(PlainGameData, games):>11.0f}")
+    print()
+    print(f"{'built by':<12} {'all games':>12}")
+    from_cache_us = _median_us(lambda: [GameData.from_cache(row) for row in rows], runs)
+    print(f"{'from_cache':<12} {from_cache_us:>9.0f} µs")
+    keyword_us = _median_us(lambda: [GameData(**kwargs) for kwargs in keywords], runs)
+    print(f"{'keywords':<12} {keyword_us:>9.0f} µs")
+
+
+def main(count: int, runs: int) -> None:
+    games = _slate(count)
+    cached_at = time.time()
+    formats = {
+        "json-v1": lambda: _encode_v1(games, cached_at),
+        "compact-v2": lambda: game_codec.encode(games, cached_at),
+    }
+    print(f"{count} games; median of {runs} runs")
+    print(f"{'format':<12} {'bytes':>9} {'encode':>12} {'decode':>12}")
+    for name, encode in formats.items():
+        data = encode()
+        decoded, _ = game_codec.decode(data)
+        assert len(decoded) == count
+        encode_us = _median_us(encode, runs)
+        decode_us = _median_us(lambda data=data: game_codec.decode(data), runs)
+        print(f"{name:<12} {len(data):>9} {encode_us:>9.0f} µs {decode_us:>9.0f} µs")
+    _game_objects(games, runs)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--games", type=int, default=180)
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+    main(args.games, args.runs)
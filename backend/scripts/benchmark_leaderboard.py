@@ -0,0 +1,168 @@
+"""
+Leaderboard endpoint benchmark.
+
+Seeds a throwaway public competition with N participants for each requested
+size, then times GET /api/leaderboards/{id} through the ASGI app for:
+
+- cold:      first request, which rebuilds the sorted-set index from the DB
+- full:      every participant (the pre-pagination behaviour)
+- top:       first page (limit=50)
+- cursor:    second page via X-Next-Cursor
+- around_me: caller's neighbourhood (around_me=10) from the middle of the table
+
+Uses the configured DATABASE_URL and REDIS_URL and removes everything it
+created afterwards.
+
+Run with: python -m scripts.benchmark_leaderboard [--sizes 1000 10000 100000]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete, insert, select
+
+from app.core.security import create_access_token
+from app.db.session import async_session
+from app.main import app
+from app.models.competition import (
+    Competition,
+    CompetitionMode,
+    CompetitionStatus,
+    JoinType,
+    Visibility,
+)
+from app.models.league import League, LeagueName
+from app.models.participant import Participant
+from app.models.user import User
+from app.services import leaderboard_index
+
+BATCH_SIZE = 5000
+
+
+async def _seed(size: int) -> tuple[str, str, list, League | None]:
+    """Create ``size`` participants; returns (competition_id, caller_id, user_ids, new_league)."""
+    async with async_session() as db:
+        league = (await db.execute(select(League).limit(1))).scalar_one_or_none()
+        created_league = None
+        if league is None:
+            league = League(name=LeagueName.NFL, display_name="NFL")
+            db.add(league)
+            await db.flush()
+            created_league = league
+
+        tag = uuid.uuid4().hex[:8]
+        user_ids = []
+        for start in range(0, size, BATCH_SIZE):
+            rows = [
+                {
+                    "email": f"bench_{tag}_{i}@example.com",
+                    "username": f"bench_{tag}_{i}",
+                    "hashed_password": "x",
+                }
+                for i in range(start, min(start + BATCH_SIZE, size))
+            ]
+            user_ids += (await db.execute(insert(User).returning(User.id), rows)).scalars().all()
+
+        competition = Competition(
+            name=f"Leaderboard benchmark {tag}",
+            mode=CompetitionMode.DAILY_PICKS,
+            status=CompetitionStatus.ACTIVE,
+            league_id=league.id,
+            start_date=datetime.utcnow() - timedelta(days=30),
+            end_date=datetime.utcnow() + timedelta(days=30),
+            visibility=Visibility.PUBLIC,
+            join_type=JoinType.OPEN,
+            creator_id=user_ids[0],
+            league_admin_ids=[user_ids[0]],
+        )
+        db.add(competition)
+        await db.flush()
+
+        rng = random.Random(size)
+        for start in range(0, size, BATCH_SIZE):
+            rows = []
+            for user_id in user_ids[start : start + BATCH_SIZE]:
+                wins, losses = rng.randint(0, 120), rng.randint(0, 120)
+                rows.append(
+                    {
+                        "user_id": user_id,
+                        "competition_id": competition.id,
+                        "total_points": wins,
+                        "total_wins": wins,
+                        "total_losses": losses,
+                        "accuracy_percentage": wins / (wins + losses) * 100 if wins else 0.0,
+                        "current_streak": rng.randint(0, 10),
+                        "longest_streak": rng.randint(10, 20),
+                    }
+                )
+            await db.execute(insert(Participant), rows)
+        await db.commit()
+        return str(competition.id), str(user_ids[size // 2]), user_ids, created_league
+
+
+async def _cleanup(competition_id: str, user_ids: list, league: League | None) -> None:
+    await leaderboard_index.invalidate(competition_id)
+    async with async_session() as db:
+        await db.execute(delete(Participant).where(Participant.competition_id == competition_id))
+        await db.execute(delete(Competition).where(Competition.id == competition_id))
+        for start in range(0, len(user_ids), BATCH_SIZE):
+            await db.execute(delete(User).where(User.id.in_(user_ids[start : start + BATCH_SIZE])))
+        if league is not None:
+            await db.execute(delete(League).where(League.id == league.id))
+        await db.commit()
+
+
+async def _time(client: AsyncClient, url: str, headers: dict, params: dict, runs: int):
+    """Median latency in ms and payload size of ``runs`` requests."""
+    timings, size, response = [], 0, None
+    for _ in range(runs):
+        started = time.perf_counter()
+        response = await client.get(url, params=params, headers=headers)
+        timings.append((time.perf_counter() - started) * 1000)
+        response.raise_for_status()
+        size = len(response.content)
+    return statistics.median(timings), size, response
+
+
+async def _benchmark(size: int, runs: int) -> dict:
+    competition_id, caller_id, user_ids, league = await _seed(size)
+    try:
+        await leaderboard_index.invalidate(competition_id)
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': caller_id})}"}
+        url = f"/api/leaderboards/{competition_id}"
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://bench") as client:
+            results = {"cold": await _time(client, url, headers, {"limit": 50}, 1)}
+            results["full"] = await _time(client, url, headers, {}, runs)
+            results["top"] = await _time(client, url, headers, {"limit": 50}, runs)
+            cursor = results["top"][2].headers["X-Next-Cursor"]
+            results["cursor"] = await _time(
+                client, url, headers, {"limit": 50, "cursor": cursor}, runs
+            )
+            results["around_me"] = await _time(client, url, headers, {"around_me": 10}, runs)
+        return results
+    finally:
+        await _cleanup(competition_id, user_ids, league)
+
+
+async def main(sizes: list[int], runs: int) -> None:
+    modes = ("cold", "full", "top", "cursor", "around_me")
+    print(f"{'participants':>12} " + " ".join(f"{mode:>22}" for mode in modes))
+    for size in sizes:
+        results = await _benchmark(size, runs)
+        cells = [f"{results[m][0]:9.1f} ms {results[m][1]:>8} B" for m in modes]
+        print(f"{size:>12} " + " ".join(f"{cell:>22}" for cell in cells))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes, args.runs))
@@ -0,0 +1,141 @@
+"""
+Sports data cache-hit benchmark.
+
+Fills ``live_scores:{league}`` in Redis with a realistic slate of games,
+then times SportsDataService.get_live_scores cache hits through:
+
+- executor: the previous sync client, each GET run in the default thread pool
+- async:    the shared pooled redis.asyncio client (app.db.redis), local tier off
+- two-tier: the in-process tier of deserialized games in front of Redis
+
+Each path is timed sequentially (per-hit latency) and with ``--concurrency``
+hits in flight at once, the way several score pipelines and API requests hit
+the cache together. Concurrent hits on the executor path queue behind
+the default executor's threads.
+
+Uses the configured REDIS_URL and removes the key it created afterwards.
+
+Run with: python -m scripts.benchmark_sports_cache [--games 15] [--runs 2000]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import redis
+
+from app.core.config import settings
+from app.db.redis import close_redis
+from app.services.sports_api.base import GameData, GameList
+from app.services.sports_api.sports_service import SportsDataService, _game_list
+
+
+class _ExecutorCacheService(SportsDataService):
+    """The pre-pool cache path: a sync client driven through run_in_executor."""
+
+    def __init__(self):
+        super().__init__()
+        self.sync_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+
+    async def _get_cached_games(self, key: str, ttl: int) -> GameList | None:
+        loop = asyncio.get_running_loop()
+        cached = await loop.run_in_executor(None, self.sync_client.get, key)
+        return _game_list(*self._decode_entry(cached), ttl) if cached else None
+
+
+def _games(count: int) -> list[GameData]:
+    start = datetime(2026, 3, 1, 18)
+    return [
+        GameData(
+            external_id=f"bench_{i}",
+            home_team=f"Home {i}",
+            away_team=f"Away {i}",
+            scheduled_start_time=start + timedelta(minutes=30 * i),
+            status="in_progress",
+            home_score=i,
+            away_score=i + 3,
+            venue="Stadium",
+            home_team_external_id=f"h{i}",
+            away_team_external_id=f"a{i}",
+            home_team_abbreviation="HOM",
+            away_team_abbreviation="AWY",
+            spread=-3.5,
+            over_under=47.5,
+        )
+        for i in range(count)
+    ]
+
+
+async def _sequential(service: SportsDataService, league: str, runs: int) -> list[float]:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        await service.get_live_scores(league)
+        timings.append((time.perf_counter() - started) * 1_000_000)
+    return timings
+
+
+async def _concurrent(
+    service: SportsDataService, league: str, runs: int, concurrency: int
+) -> tuple[list[float], float]:
+    """Per-hit latencies (µs) and total hits/second with ``concurrency`` in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+    timings = []
+
+    async def _hit():
+        async with semaphore:
+            started = time.perf_counter()
+            await service.get_live_scores(league)
+            timings.append((time.perf_counter() - started) * 1_000_000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(_hit() for _ in range(runs)))
+    return timings, runs / (time.perf_counter() - started)
+
+
+def _row(name: str, timings: list[float], rate: float | None = None) -> str:
+    p50 = statistics.median(timings)
+    p95 = statistics.quantiles(timings, n=20)[-1]
+    throughput = f"{rate:10.0f}/s" if rate is not None else ""
+    return f"{name:<22} {p50:9.0f} µs {p95:9.0f} µs {throughput}"
+
+
+async def main(games: int, runs: int, concurrency: int) -> None:
+    league = f"BENCH_{uuid.uuid4().hex[:8]}"
+    # name -> (service, SPORTS_LOCAL_CACHE_SECONDS while it runs)
+    services = {
+        "executor": (_ExecutorCacheService(), 0),
+        "async": (SportsDataService(), 0),
+        "two-tier": (SportsDataService(), 600),
+    }
+    local_seconds = settings.SPORTS_LOCAL_CACHE_SECONDS
+    key = f"live_scores:{league}"
+    redis_client = services["async"][0].redis_client
+    payload = services["async"][0]._encode_entry(_games(games), time.time())
+    await redis_client.set(key, payload, ex=600)
+    print(f"{games} games, {len(payload)} B cached; {runs} hits per row")
+    print(f"{'path':<22} {'p50':>12} {'p95':>12} {'throughput':>12}")
+    try:
+        for name, (service, seconds) in services.items():
+            settings.SPORTS_LOCAL_CACHE_SECONDS = seconds
+            await _sequential(service, league, min(runs, 100))  # warm up
+            print(_row(f"{name} sequential", await _sequential(service, league, runs)))
+            timings, rate = await _concurrent(service, league, runs, concurrency)
+            print(_row(f"{name} x{concurrency}", timings, rate))
+    finally:
+        settings.SPORTS_LOCAL_CACHE_SECONDS = local_seconds
+        await redis_client.delete(key)
+        services["executor"][0].sync_client.close()
+        await close_redis()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--games", type=int, default=15)
+    parser.add_argument("--runs", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.games, args.runs, args.concurrency))
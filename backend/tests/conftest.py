@@ -21,6 +21,7 @@ from app.models.invite_link import InviteLink
 from app.models.league import League, LeagueName, Team
 from app.models.participant import Participant
 from app.models.user import AccountStatus, User, UserRole
+from app.services import leaderboard_cache, leaderboard_index
 
 
 @pytest.fixture(scope="session")
@@ -36,6 +37,24 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def leaderboard_index_backend():
+    """Serve the leaderboard index from a fresh in-memory backend per test."""
+    backend = leaderboard_index.InMemoryLeaderboardBackend()
+    leaderboard_index.set_backend(backend)
+    yield backend
+    leaderboard_index.set_backend(None)
+
+
+@pytest.fixture(autouse=True)
+def leaderboard_cache_backend():
+    """Serve the leaderboard response cache from a fresh in-memory backend per test."""
+    backend = leaderboard_cache.InMemoryLeaderboardCache()
+    leaderboard_cache.set_backend(backend)
+    yield backend
+    leaderboard_cache.set_backend(None)
+
+
 @pytest.fixture(scope="function")
 async def db_session():
     """Provide a database session with per-test table cleanup.
@@ -46,7 +65,7 @@ async def db_session():
         await conn.execute(
             text(
                 "TRUNCATE TABLE picks, fixed_team_selections, join_requests, "
-                "invite_links, participants, games, competitions, golfers, teams, "
+                "invite_links, leaderboard_snapshots, participants, games, competitions, golfers, teams, "
                 "leagues, audit_logs, bug_reports, users CASCADE"
             )
         )
@@ -4,6 +4,8 @@ Tests for admin endpoints that lack coverage:
 - PATCH /admin/users/{id}/role
 - POST /admin/games/{id}/correct-score
 - POST /admin/games/{id}/rescore
+- POST /admin/competitions/{id}/rescore
+- GET /admin/tasks/{task_id}
 - POST /admin/competitions/{id}/winner
 - DELETE /admin/competitions/{id}/participants/{user_id}
 - POST /admin/competitions/{id}/admins
@@ -14,6 +16,7 @@ Tests for admin endpoints that lack coverage:
 """
 
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
 import pytest
 from httpx import AsyncClient
@@ -24,6 +27,7 @@ from app.models.audit_log import AuditAction, AuditLog
 from app.models.competition import Competition
 from app.models.game import Game, GameStatus
 from app.models.participant import Participant
+from app.models.pick import Pick
 from app.models.user import User, UserRole
 from tests.conftest import _login, _make_global_admin
 
@@ -500,6 +504,134 @@ async def test_rescore_game_not_found(
     assert resp.status_code == 404
 
 
+# ---------------------------------------------------------------------------
+# POST /admin/competitions/{id}/rescore
+# ---------------------------------------------------------------------------
+
+
+async def test_rescore_competition(
+    client: AsyncClient,
+    test_user: User,
+    active_competition: Competition,
+    test_teams: list,
+    db_session: AsyncSession,
+):
+    """Global admin can regrade a whole competition as a tracked task."""
+    await _make_global_admin(db_session, test_user)
+
+    participant = Participant(
+        user_id=test_user.id,
+        competition_id=active_competition.id,
+        total_points=99,
+        total_wins=99,
+    )
+    games = [
+        Game(
+            competition_id=active_competition.id,
+            external_id=f"comp_rescore_{i}",
+            home_team_id=test_teams[0].id,
+            away_team_id=test_teams[1].id,
+            scheduled_start_time=datetime.utcnow() - timedelta(hours=5 - i),
+            status=GameStatus.FINAL,
+            home_team_score=10,
+            away_team_score=7,
+            winner_team_id=test_teams[0].id,
+        )
+        for i in range(3)
+    ]
+    db_session.add(participant)
+    db_session.add_all(games)
+    await db_session.commit()
+    db_session.add_all(
+        [
+            Pick(
+                user_id=test_user.id,
+                competition_id=active_competition.id,
+                game_id=game.id,
+                predicted_winner_team_id=test_teams[0].id if i else test_teams[1].id,
+            )
+            for i, game in enumerate(games)
+        ]
+    )
+    await db_session.commit()
+
+    token = await _login(client)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    resp = await client.post(
+        f"/api/admin/competitions/{active_competition.id}/rescore",
+        headers=headers,
+        json={"reason": "Provider outage"},
+    )
+    assert resp.status_code == 202
+    task_id = resp.json()["task_id"]
+
+    task_resp = await client.get(f"/api/admin/tasks/{task_id}", headers=headers)
+    assert task_resp.status_code == 200
+    task = task_resp.json()
+    assert task["status"] == "completed"
+    assert task["progress"] == 100
+    assert task["result"] == {"games": 3, "picks": 3, "participants": 1}
+
+    await db_session.refresh(participant)
+    assert participant.total_points == 2
+    assert participant.total_wins == 2
+    assert participant.total_losses == 1
+    assert participant.current_streak == 2
+
+    log_result = await db_session.execute(
+        select(AuditLog).where(AuditLog.action == AuditAction.COMPETITION_RESCORED)
+    )
+    log = log_result.scalar_one()
+    assert log.target_id == active_competition.id
+    assert log.details["reason"] == "Provider outage"
+
+
+async def test_rescore_competition_not_found(
+    client: AsyncClient,
+    test_user: User,
+    db_session: AsyncSession,
+):
+    """404 for unknown competition id."""
+    await _make_global_admin(db_session, test_user)
+    token = await _login(client)
+
+    resp = await client.post(
+        "/api/admin/competitions/00000000-0000-0000-0000-000000000000/rescore",
+        headers={"Authorization": f"Bearer {token}"},
+        json={"reason": "test"},
+    )
+    assert resp.status_code == 404
+
+
+async def test_get_admin_task_not_found(
+    client: AsyncClient,
+    test_user: User,
+    db_session: AsyncSession,
+):
+    await _make_global_admin(db_session, test_user)
+    token = await _login(client)
+
+    resp = await client.get(
+        "/api/admin/tasks/does-not-exist",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert resp.status_code == 404
+
+
+async def test_task_tracker_falls_back_to_process_memory():
+    """Without Redis, task records still work within the process that wrote them."""
+    from app.services import task_tracker
+
+    with patch.object(task_tracker, "get_redis", side_effect=ConnectionError("down")):
+        task = await task_tracker.create_task("competition_rescore", competition_id="c1")
+        await task_tracker.update_task(task["id"], status="completed", progress=100)
+        stored = await task_tracker.get_task(task["id"])
+    assert stored["status"] == "completed" and stored["finished_at"]
+    assert task["id"] in task_tracker._memory_tasks
+    task_tracker._memory_tasks.pop(task["id"])
+
+
 # ---------------------------------------------------------------------------
 # POST /admin/competitions/{id}/winner
 # ---------------------------------------------------------------------------
@@ -6,8 +6,9 @@ import pytest
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.competition import Competition, CompetitionStatus
+from app.models.competition import Competition, CompetitionMode, CompetitionStatus
 from app.models.game import Game, GameStatus
+from app.models.league import LeagueName, Team
 from app.models.participant import Participant
 from app.models.pick import FixedTeamSelection, Pick
 from app.models.user import AccountStatus, User
@@ -28,6 +29,7 @@ from app.services.score_service import (
 from app.services.score_service import (
     score_picks_for_game as _score_picks_for_game,
 )
+from app.services.score_service import score_picks_for_games
 from app.services.sync_service import (
     _find_or_create_team,
     _sync_game_for_competition,
@@ -535,6 +537,44 @@ async def test_update_game_scores_updates_in_progress_game(
     assert test_game.away_team_score == 7
 
 
+@pytest.mark.asyncio
+async def test_update_game_scores_skips_unchanged_games(
+    db_session: AsyncSession, test_game: Game, caplog
+):
+    """A game whose status, scores and odds match the row is not written or published."""
+    import logging
+    from unittest.mock import AsyncMock
+
+    test_game.status = GameStatus.IN_PROGRESS
+    test_game.spread = -3.5
+    await db_session.commit()
+    live = _live(test_game.external_id)  # spread omitted: keeps the stored one
+
+    session_patcher = _make_session_patcher(db_session)
+    publisher = AsyncMock()
+    with (
+        patch("app.services.background_jobs.async_session", session_patcher),
+        patch(
+            "app.services.background_jobs.sports_service.get_live_scores",
+            new=AsyncMock(return_value=[live]),
+        ),
+        patch("app.services.background_jobs.ScoreManager.publish_score_update", new=publisher),
+        caplog.at_level(logging.INFO, logger="app.services.background_jobs"),
+    ):
+        await update_game_scores()
+        await db_session.refresh(test_game)
+        first_update = test_game.updated_at
+        await update_game_scores()
+
+    publisher.assert_awaited_once()
+    await db_session.refresh(test_game)
+    assert test_game.updated_at == first_update
+    assert (test_game.home_team_score, test_game.spread) == (1, -3.5)
+    lines = [r.getMessage() for r in caplog.records if "Score pipeline" in r.getMessage()]
+    assert "1 changed, 0 unchanged" in lines[0]
+    assert "0 changed, 1 unchanged" in lines[1]
+
+
 @pytest.mark.asyncio
 async def test_update_game_scores_scores_picks_on_final(
     db_session: AsyncSession, test_user: User, active_competition, test_game: Game, test_teams: list
@@ -582,6 +622,137 @@ async def test_update_game_scores_scores_picks_on_final(
     assert pick.is_correct is True
 
 
+@pytest.mark.asyncio
+async def test_update_game_scores_batches_final_games_and_retries(
+    db_session: AsyncSession, test_user: User, active_competition, test_game: Game, test_teams: list
+):
+    """All newly-final games plus unscored FINAL leftovers are graded in one pass."""
+    from unittest.mock import AsyncMock
+
+    from app.services.sports_api.base import GameData
+
+    second_game = Game(
+        competition_id=active_competition.id,
+        external_id="batch_game_2",
+        home_team_id=test_teams[0].id,
+        away_team_id=test_teams[1].id,
+        scheduled_start_time=datetime.utcnow() - timedelta(hours=3),
+        status=GameStatus.IN_PROGRESS,
+    )
+    leftover_game = Game(
+        competition_id=active_competition.id,
+        external_id="batch_leftover",
+        home_team_id=test_teams[0].id,
+        away_team_id=test_teams[1].id,
+        scheduled_start_time=datetime.utcnow() - timedelta(days=1),
+        status=GameStatus.FINAL,
+        winner_team_id=test_teams[1].id,
+        scoring_completed=False,
+    )
+    test_game.status = GameStatus.IN_PROGRESS
+    db_session.add_all([second_game, leftover_game])
+    db_session.add(Participant(user_id=test_user.id, competition_id=active_competition.id))
+    await db_session.commit()
+    db_session.add_all(
+        [
+            Pick(
+                user_id=test_user.id,
+                competition_id=active_competition.id,
+                game_id=game.id,
+                predicted_winner_team_id=test_teams[0].id,
+            )
+            for game in (test_game, second_game, leftover_game)
+        ]
+    )
+    await db_session.commit()
+
+    live = [
+        GameData(
+            external_id=ext,
+            home_team="Home",
+            away_team="Away",
+            scheduled_start_time=datetime.utcnow(),
+            status="final",
+            home_score=21,
+            away_score=14,
+        )
+        for ext in (test_game.external_id, second_game.external_id)
+    ]
+
+    session_patcher = _make_session_patcher(db_session)
+    with patch("app.services.background_jobs.async_session", session_patcher):
+        with patch(
+            "app.services.background_jobs.sports_service.get_live_scores",
+            new=AsyncMock(return_value=live),
+        ):
+            with patch(
+                "app.services.background_jobs.ScoreManager.publish_score_update", new=AsyncMock()
+            ):
+                with patch("app.services.background_jobs.sports_service.redis_client", None):
+                    with patch(
+                        "app.services.background_jobs.score_picks_for_games",
+                        wraps=score_picks_for_games,
+                    ) as scorer:
+                        await update_game_scores()
+
+    assert scorer.await_count == 1
+    batch = scorer.await_args.args[1]
+    assert {g.id for g in batch} == {test_game.id, second_game.id, leftover_game.id}
+
+    participant = (
+        await db_session.execute(select(Participant).where(Participant.user_id == test_user.id))
+    ).scalar_one()
+    await db_session.refresh(participant)
+    assert participant.total_wins == 2
+    assert participant.total_losses == 1
+    for game in (test_game, second_game, leftover_game):
+        await db_session.refresh(game)
+        assert game.scoring_completed is True
+
+
+@pytest.mark.asyncio
+async def test_update_game_scores_scoring_failure_keeps_game_final(
+    db_session: AsyncSession, active_competition, test_game: Game
+):
+    """A scoring failure leaves the game FINAL with scoring_completed=False for retry."""
+    from unittest.mock import AsyncMock
+
+    from app.services.sports_api.base import GameData
+
+    test_game.status = GameStatus.IN_PROGRESS
+    await db_session.commit()
+
+    score_data = GameData(
+        external_id=test_game.external_id,
+        home_team="Home",
+        away_team="Away",
+        scheduled_start_time=datetime.utcnow(),
+        status="final",
+        home_score=3,
+        away_score=0,
+    )
+
+    session_patcher = _make_session_patcher(db_session)
+    with patch("app.services.background_jobs.async_session", session_patcher):
+        with patch(
+            "app.services.background_jobs.sports_service.get_live_scores",
+            new=AsyncMock(return_value=[score_data]),
+        ):
+            with patch(
+                "app.services.background_jobs.ScoreManager.publish_score_update", new=AsyncMock()
+            ):
+                with patch("app.services.background_jobs.sports_service.redis_client", None):
+                    with patch(
+                        "app.services.background_jobs.score_picks_for_games",
+                        new=AsyncMock(side_effect=RuntimeError("boom")),
+                    ):
+                        await update_game_scores()
+
+    await db_session.refresh(test_game)
+    assert test_game.status == GameStatus.FINAL
+    assert test_game.scoring_completed is False
+
+
 @pytest.mark.asyncio
 async def test_sync_games_from_api_no_active_competitions(db_session: AsyncSession):
     """sync_games_from_api does nothing when there are no active competitions."""
@@ -854,6 +1025,133 @@ async def test_update_game_scores_game_not_in_api_response(
     assert test_game.status == GameStatus.IN_PROGRESS  # unchanged
 
 
+async def _second_league_game(db_session: AsyncSession, test_user: User, league) -> Game:
+    """An in-progress game in a competition of ``league``."""
+    teams = [
+        Team(league_id=league.id, name=f"Team {c}", city="C", abbreviation=c, external_id=c)
+        for c in ("NA", "NB")
+    ]
+    db_session.add_all(teams)
+    competition = Competition(
+        name="Second league comp",
+        mode=CompetitionMode.DAILY_PICKS,
+        status=CompetitionStatus.ACTIVE,
+        league_id=league.id,
+        start_date=datetime.utcnow() - timedelta(days=1),
+        end_date=datetime.utcnow() + timedelta(days=7),
+        creator_id=test_user.id,
+        league_admin_ids=[test_user.id],
+    )
+    db_session.add(competition)
+    await db_session.flush()
+    game = Game(
+        competition_id=competition.id,
+        external_id="nba_game",
+        home_team_id=teams[0].id,
+        away_team_id=teams[1].id,
+        scheduled_start_time=datetime.utcnow() - timedelta(hours=1),
+        status=GameStatus.IN_PROGRESS,
+    )
+    db_session.add(game)
+    await db_session.commit()
+    return game
+
+
+def _live(external_id: str):
+    from app.services.sports_api.base import GameData
+
+    return GameData(
+        external_id=external_id,
+        home_team="Home",
+        away_team="Away",
+        scheduled_start_time=datetime.utcnow(),
+        status="in_progress",
+        home_score=1,
+        away_score=0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_update_game_scores_runs_leagues_as_independent_pipelines(
+    db_session: AsyncSession, test_user: User, test_game: Game, test_league_2, caplog
+):
+    """A slow league does not hold back another league's commit and publish."""
+    import asyncio
+    import logging
+    from unittest.mock import AsyncMock
+
+    nba_game = await _second_league_game(db_session, test_user, test_league_2)
+    test_game.status = GameStatus.IN_PROGRESS
+    await db_session.commit()
+    nfl_published = asyncio.Event()
+
+    async def live_scores(league_name, revalidate=False):
+        if league_name == LeagueName.NBA:
+            # Only answers once the NFL pipeline has finished on its own
+            await nfl_published.wait()
+            return [_live(nba_game.external_id)]
+        return [_live(test_game.external_id)]
+
+    async def publish(payload):
+        if payload[0]["game_id"] == str(test_game.id):
+            nfl_published.set()
+
+    publisher = AsyncMock(side_effect=publish)
+    with (
+        patch(
+            "app.services.background_jobs.sports_service.get_live_scores",
+            new=AsyncMock(side_effect=live_scores),
+        ),
+        patch("app.services.background_jobs.ScoreManager.publish_score_update", new=publisher),
+        caplog.at_level(logging.INFO, logger="app.services.background_jobs"),
+    ):
+        await asyncio.wait_for(update_game_scores(), timeout=10)
+
+    assert [call.args[0][0]["game_id"] for call in publisher.await_args_list] == [
+        str(test_game.id),
+        str(nba_game.id),
+    ]
+    for game in (test_game, nba_game):
+        await db_session.refresh(game)
+        assert game.home_team_score == 1
+    timings = [r.getMessage() for r in caplog.records if "Score pipeline" in r.getMessage()]
+    assert len(timings) == 2
+    assert all("1 changed, 0 unchanged" in line and "fetch " in line for line in timings)
+
+
+@pytest.mark.asyncio
+async def test_update_game_scores_respects_concurrency_limit(
+    db_session: AsyncSession, test_user: User, test_game: Game, test_league_2, monkeypatch
+):
+    import asyncio
+    from unittest.mock import AsyncMock
+
+    from app.core.config import settings
+
+    await _second_league_game(db_session, test_user, test_league_2)
+    test_game.status = GameStatus.IN_PROGRESS
+    await db_session.commit()
+    in_flight, peak = 0, 0
+
+    async def live_scores(league_name, revalidate=False):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return []
+
+    for limit, expected_peak in ((1, 1), (4, 2)):
+        monkeypatch.setattr(settings, "SCORE_UPDATE_CONCURRENCY", limit)
+        peak = 0
+        with patch(
+            "app.services.background_jobs.sports_service.get_live_scores",
+            new=AsyncMock(side_effect=live_scores),
+        ):
+            await update_game_scores()
+        assert peak == expected_peak
+
+
 @pytest.mark.asyncio
 async def test_sync_game_for_competition_away_wins(
     db_session: AsyncSession, active_competition, test_teams: list, test_game: Game
@@ -1051,7 +1349,8 @@ async def test_sync_games_for_competition_creates_games(
         result = await sync_games_for_competition(db_session, str(active_competition.id))
         await db_session.commit()
 
-    assert result["created"] >= 1
+    # The same game on every day's scoreboard is only created once
+    assert result["created"] == 1
     # Verify a game landed in the DB for this competition
     stmt = select(Game).where(
         Game.competition_id == active_competition.id,
@@ -1059,3 +1358,62 @@ async def test_sync_games_for_competition_creates_games(
     )
     db_result = await db_session.execute(stmt)
     assert db_result.scalar_one_or_none() is not None
+
+
+@pytest.mark.asyncio
+async def test_fetch_schedule_range_is_concurrent_and_deduplicated(monkeypatch):
+    """Days are fetched concurrently under the limit and merged by external_id."""
+    import asyncio
+    from unittest.mock import AsyncMock
+
+    from app.core.config import settings
+    from app.services.sports_api.base import GameData
+    from app.services.sync_service import fetch_schedule_range
+
+    start = datetime(2026, 3, 1)
+    in_flight, peak = 0, 0
+
+    async def get_schedule(league, day, end):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+        # Each day's scoreboard also lists the previous night's late game
+        ids = [f"g{day.day}", f"g{day.day - 1}"]
+        return [
+            GameData(
+                external_id=i,
+                home_team="H",
+                away_team="A",
+                scheduled_start_time=day,
+                status="final",
+            )
+            for i in ids
+        ]
+
+    monkeypatch.setattr(settings, "SCHEDULE_FETCH_CONCURRENCY", 3)
+    mock = AsyncMock(side_effect=get_schedule)
+    with patch("app.services.sync_service.sports_service.get_schedule", new=mock):
+        games = await fetch_schedule_range("NFL", start, start + timedelta(days=6))
+
+    assert [g.external_id for g in games] == ["g1", "g0", *(f"g{d}" for d in range(2, 8))]
+    assert mock.await_count == 7
+    assert [c.args[1] for c in mock.await_args_list] == [
+        start + timedelta(days=d) for d in range(7)
+    ]
+    assert peak == 3
+
+    # A failed day fails the whole range, as a serial fetch would
+    from app.services.sports_api.base import APIUnavailableError
+
+    mock = AsyncMock(side_effect=[[], APIUnavailableError("down"), []])
+    with patch("app.services.sync_service.sports_service.get_schedule", new=mock):
+        with pytest.raises(APIUnavailableError):
+            await fetch_schedule_range("NFL", start, start + timedelta(days=2))
+
+    # An empty range (competition already over) makes no requests
+    mock = AsyncMock(return_value=[])
+    with patch("app.services.sync_service.sports_service.get_schedule", new=mock):
+        assert await fetch_schedule_range("NFL", start, start - timedelta(days=1)) == []
+    mock.assert_not_awaited()
@@ -0,0 +1,80 @@
+"""Tests for the cached GameData encoding in app.services.sports_api.game_codec."""
+
+import json
+from datetime import UTC, datetime
+
+from app.services.sports_api import game_codec
+from app.services.sports_api.base import GameData
+
+
+def _games() -> list[GameData]:
+    tip = datetime(2026, 2, 21, 19, tzinfo=UTC)
+    return [
+        GameData(
+            external_id=str(i),
+            home_team="Duke Blue Devils",
+            away_team=f"Team {i}",
+            scheduled_start_time=tip,
+            status="in_progress",
+            home_score=40 + i,
+            away_score=None,
+            venue="Cameron Indoor Stadium",
+            raw_data={"huge": "payload"},
+            home_team_external_id="150",
+            away_team_abbreviation=f"T{i}",
+            home_team_wins=20,
+            away_team_ties=0,
+            spread=-6.5,
+            over_under=None,
+        )
+        for i in range(3)
+    ]
+
+
+def _legacy_dict(game: GameData) -> dict:
+    return {
+        field: game.scheduled_start_time.isoformat()
+        if field == "scheduled_start_time"
+        else getattr(game, field)
+        for field in game_codec.FIELDS
+    }
+
+
+def test_round_trip_keeps_every_cached_field():
+    games = _games()
+    data = game_codec.encode(games, 1700000000.5)
+
+    decoded, cached_at = game_codec.decode(data)
+
+    assert cached_at == 1700000000.5
+    for original, restored in zip(games, decoded, strict=True):
+        for field in game_codec.FIELDS:
+            assert getattr(restored, field) == getattr(original, field)
+        assert restored.raw_data == {}
+    assert decoded[0].scheduled_start_time.tzinfo is not None
+    # Repeated strings are stored once
+    strings = json.loads(data)[2]
+    assert strings.count("Duke Blue Devils") == 1
+    assert len(data) < len(json.dumps([_legacy_dict(g) for g in games])) / 2
+
+
+def test_decodes_earlier_json_formats():
+    games = _games()
+    legacy = [_legacy_dict(g) for g in games]
+
+    bare, cached_at = game_codec.decode(json.dumps(legacy))
+    assert [g.external_id for g in bare] == ["0", "1", "2"] and cached_at is None
+
+    envelope, cached_at = game_codec.decode(json.dumps({"cached_at": 12.0, "games": legacy}))
+    assert [g.home_score for g in envelope] == [40, 41, 42] and cached_at == 12.0
+
+
+def test_bad_rows_are_skipped_and_unreadable_entries_rejected():
+    version, cached_at, strings, rows = json.loads(game_codec.encode(_games(), 5.0))
+    rows[1] = rows[1][:-1]
+
+    decoded, _ = game_codec.decode(json.dumps([version, cached_at, strings, rows]))
+    assert [g.external_id for g in decoded] == ["0", "2"]
+
+    assert game_codec.decode(json.dumps([version + 1, cached_at, strings, rows])) is None
+    assert game_codec.decode("not json") is None
@@ -0,0 +1,79 @@
+"""Tests for the shared sports API HTTP client in app.services.sports_api.http_pool."""
+
+import asyncio
+
+import pytest
+
+from app.core.config import settings
+from app.services.sports_api import http_pool
+from app.services.sports_api.http_pool import ProviderHTTPStats
+
+
+@pytest.mark.asyncio
+async def test_one_pooled_client_per_process(monkeypatch):
+    # Leave the client other modules already hold untouched
+    monkeypatch.setattr(http_pool, "_client", None)
+    monkeypatch.setattr(settings, "API_HTTP_MAX_CONNECTIONS", 7)
+    monkeypatch.setattr(settings, "API_HTTP_MAX_KEEPALIVE", 3)
+    monkeypatch.setattr(settings, "API_HTTP2", True)
+    monkeypatch.setattr(http_pool.importlib.util, "find_spec", lambda name: None)
+
+    client = http_pool.get_http_client()
+    assert http_pool.get_http_client() is client
+    pool = client._transport._pool
+    assert pool._max_connections == 7
+    assert pool._max_keepalive_connections == 3
+    # No h2 installed: HTTP/2 is requested but the client stays on HTTP/1.1
+    assert pool._http2 is False
+
+    await http_pool.close_http_client()
+    assert client.is_closed
+    other = http_pool.get_http_client()
+    assert other is not client
+    await http_pool.close_http_client()
+
+
+@pytest.mark.asyncio
+async def test_requests_wait_for_a_host_slot(monkeypatch):
+    monkeypatch.setattr(http_pool, "_host_slots", {})
+    monkeypatch.setattr(settings, "API_HTTP_MAX_CONNECTIONS_PER_HOST", 1)
+    stats = ProviderHTTPStats()
+
+    async def request(url):
+        async with stats.track(url):
+            await asyncio.sleep(0.02)
+
+    await asyncio.gather(
+        request("https://a.example/one"),
+        request("https://a.example/two"),
+        request("https://b.example/one"),
+    )
+
+    snapshot = stats.snapshot()
+    assert snapshot["requests"] == 3
+    # Per-host limit: the second a.example request queued, b.example did not
+    assert snapshot["pool"]["max_in_flight"] == 2
+    assert snapshot["pool"]["slot_wait_ms"]["count"] == 1
+    assert snapshot["pool"]["in_flight"] == 0
+    assert snapshot["pool"]["queued"] == 0
+    assert snapshot["connections"] == {"new": 0, "reused": 3}
+
+
+@pytest.mark.asyncio
+async def test_trace_records_new_connections(monkeypatch):
+    monkeypatch.setattr(http_pool, "_host_slots", {})
+    stats = ProviderHTTPStats()
+
+    async with stats.track("https://a.example/") as trace:
+        await trace("connection.connect_tcp.started", {})
+        await trace("connection.connect_tcp.complete", {})
+        await trace("connection.start_tls.started", {})
+        await trace("connection.start_tls.complete", {})
+    async with stats.track("https://a.example/") as trace:
+        await trace("http11.send_request_headers.started", {})
+
+    snapshot = stats.snapshot()
+    assert snapshot["connections"] == {"new": 1, "reused": 1}
+    assert snapshot["connect_ms"]["count"] == 1
+    assert snapshot["latency_ms"]["count"] == 2
+    assert sum(snapshot["latency_ms"]["buckets"].values()) == 2
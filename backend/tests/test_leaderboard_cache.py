@@ -0,0 +1,251 @@
+"""Tests for the leaderboard response cache in app.services.leaderboard_cache."""
+
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.competition import Competition
+from app.models.participant import Participant
+from app.models.user import User
+from app.services import leaderboard_cache, leaderboard_index
+from tests.conftest import _login
+
+
+async def _get(client: AsyncClient, competition: Competition, token: str, etag=None, **params):
+    headers = {"Authorization": f"Bearer {token}"}
+    if etag:
+        headers["If-None-Match"] = etag
+    return await client.get(f"/api/leaderboards/{competition.id}", params=params, headers=headers)
+
+
+async def _join(db: AsyncSession, competition: Competition, user: User, points: int):
+    db.add(Participant(user_id=user.id, competition_id=competition.id, total_points=points))
+    await db.commit()
+
+
+@pytest.mark.asyncio
+async def test_second_request_is_served_from_cache(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    active_competition: Competition,
+    leaderboard_cache_backend,
+):
+    await _join(db_session, active_competition, test_user, 4)
+    token = await _login(client)
+
+    first = await _get(client, active_competition, token)
+    assert first.status_code == 200
+    assert first.headers["ETag"].startswith('"')
+    assert first.headers["Cache-Control"] == "private, no-cache"
+
+    # The cached body is served even though the database has moved on
+    await db_session.execute(update(Participant).values(total_points=40))
+    await db_session.commit()
+    second = await _get(client, active_competition, token)
+    assert second.json() == first.json()
+    assert second.json()[0]["total_points"] == 4
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert second.headers["X-Total-Count"] == "1"
+
+    counters = await leaderboard_cache_backend.counters()
+    assert counters == {"misses": 1, "hits": 1}
+
+
+@pytest.mark.asyncio
+async def test_if_none_match_returns_304_without_body(
+    client: AsyncClient, db_session: AsyncSession, test_user: User, active_competition: Competition
+):
+    await _join(db_session, active_competition, test_user, 4)
+    token = await _login(client)
+    etag = (await _get(client, active_competition, token)).headers["ETag"]
+
+    response = await _get(client, active_competition, token, etag=etag)
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+    # Weak and list forms match too; a stale tag gets the full body
+    assert (await _get(client, active_competition, token, etag=f'"x", W/{etag}')).status_code == 304
+    assert (await _get(client, active_competition, token, etag='"stale"')).status_code == 200
+
+    stats = await leaderboard_cache.get_stats()
+    assert stats["not_modified"] == 2
+    assert stats["hit_ratio"] == 0.75
+
+
+@pytest.mark.asyncio
+async def test_cached_body_is_personalised_per_user(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    second_user: User,
+    active_competition: Competition,
+):
+    await _join(db_session, active_competition, test_user, 4)
+    await _join(db_session, active_competition, second_user, 9)
+
+    first = await _get(client, active_competition, await _login(client))
+    second = await _get(client, active_competition, await _login(client, email=second_user.email))
+
+    assert [e["is_current_user"] for e in first.json()] == [False, True]
+    assert [e["is_current_user"] for e in second.json()] == [True, False]
+    assert first.headers["ETag"] != second.headers["ETag"]
+
+    # One user's ETag never validates another user's view
+    response = await _get(
+        client, active_competition, await _login(client), etag=second.headers["ETag"]
+    )
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_windows_are_cached_separately(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    second_user: User,
+    active_competition: Competition,
+):
+    await _join(db_session, active_competition, test_user, 4)
+    await _join(db_session, active_competition, second_user, 9)
+    token = await _login(client)
+
+    top = await _get(client, active_competition, token, limit=1)
+    rest = await _get(client, active_competition, token, limit=1, offset=1)
+    by_wins = await _get(client, active_competition, token, sort_by="wins", limit=1)
+
+    assert top.json()[0]["username"] == "seconduser"
+    assert rest.json()[0]["username"] == "testuser"
+    assert "X-Next-Cursor" in top.headers
+    assert "X-Next-Cursor" not in rest.headers
+    assert len({top.headers["ETag"], rest.headers["ETag"], by_wins.headers["ETag"]}) == 3
+
+
+@pytest.mark.asyncio
+async def test_index_updates_invalidate_cached_responses(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    active_competition: Competition,
+    leaderboard_cache_backend,
+):
+    await _join(db_session, active_competition, test_user, 4)
+    token = await _login(client)
+    etag = (await _get(client, active_competition, token)).headers["ETag"]
+
+    await db_session.execute(update(Participant).values(total_points=40))
+    await db_session.commit()
+    await leaderboard_index.refresh_participants(
+        db_session, Participant.competition_id == active_competition.id
+    )
+
+    response = await _get(client, active_competition, token, etag=etag)
+    assert response.status_code == 200
+    assert response.json()[0]["total_points"] == 40
+    assert response.headers["ETag"] != etag
+    assert (await leaderboard_cache_backend.counters())["invalidations"] == 1
+
+    # An invalidation that leaves the content unchanged still validates
+    etag = response.headers["ETag"]
+    await leaderboard_index.invalidate(active_competition.id)
+    assert (await _get(client, active_competition, token, etag=etag)).status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_cache_outage_bypasses_cache(
+    client: AsyncClient, db_session: AsyncSession, test_user: User, active_competition: Competition
+):
+    class _Down(leaderboard_cache.InMemoryLeaderboardCache):
+        async def get(self, key, *fields):
+            raise ConnectionError("redis down")
+
+    leaderboard_cache.set_backend(_Down())
+    await _join(db_session, active_competition, test_user, 4)
+
+    response = await _get(client, active_competition, await _login(client))
+    assert response.status_code == 200
+    assert response.json()[0]["total_points"] == 4
+    assert "ETag" in response.headers
+
+
+@pytest.mark.asyncio
+async def test_stats_endpoint(client: AsyncClient, test_user: User, leaderboard_cache_backend):
+    await leaderboard_cache.record("hits")
+    await leaderboard_cache.record("misses")
+
+    response = await client.get(
+        "/api/health/leaderboard-cache",
+        headers={"Authorization": f"Bearer {await _login(client)}"},
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "hits": 1,
+        "misses": 1,
+        "not_modified": 0,
+        "invalidations": 0,
+        "hit_ratio": 0.5,
+        "ttl_seconds": settings.CACHE_LEADERBOARD_SECONDS,
+    }
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_round_trip():
+    backend = leaderboard_cache.RedisLeaderboardCache()
+    competition_id = f"test-{uuid.uuid4()}"
+    key = leaderboard_cache.cache_key(competition_id)
+    gen_key = leaderboard_cache.generation_key(competition_id)
+    try:
+        await backend._client.delete(key, gen_key)
+    except Exception:
+        pytest.skip("Redis not available")
+
+    try:
+        assert await backend.get(key, "a:etag", "a:body") == [None, None]
+        assert await backend.generation(gen_key) == 0
+        assert await backend.put(key, gen_key, 0, {"a:etag": "e1", "a:body": "[]"}, 30)
+        assert await backend.put(key, gen_key, 0, {"b:etag": "e2"}, 30)
+        assert await backend.get(key, "a:etag", "a:body", "b:etag") == ["e1", "[]", "e2"]
+        assert 0 < await backend._client.ttl(key) <= 30
+        await backend.delete(key, gen_key)
+        assert await backend.get(key, "a:etag") == [None]
+        # A window rendered before the invalidation is not written back
+        assert await backend.generation(gen_key) == 1
+        assert not await backend.put(key, gen_key, 0, {"a:etag": "old"}, 30)
+        assert await backend.get(key, "a:etag") == [None]
+    finally:
+        await backend._client.delete(key, gen_key)
+
+
+@pytest.mark.asyncio
+async def test_render_racing_an_invalidation_is_not_cached(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    active_competition: Competition,
+    leaderboard_cache_backend,
+    monkeypatch,
+):
+    from app.api import leaderboards
+
+    await _join(db_session, active_competition, test_user, 4)
+    token = await _login(client)
+    render = leaderboards._render_window
+
+    async def render_then_score(*args):
+        body = await render(*args)
+        # Scoring commits and invalidates while the window is being rendered
+        await leaderboard_index.invalidate(active_competition.id)
+        return body
+
+    monkeypatch.setattr(leaderboards, "_render_window", render_then_score)
+    assert (await _get(client, active_competition, token)).status_code == 200
+    assert await leaderboard_cache.get_body(active_competition.id, "points:0:-1") is None
+
+    monkeypatch.setattr(leaderboards, "_render_window", render)
+    await _get(client, active_competition, token)
+    assert await leaderboard_cache.get_body(active_competition.id, "points:0:-1") is not None
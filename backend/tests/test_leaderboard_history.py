@@ -0,0 +1,301 @@
+"""Tests for daily leaderboard snapshots in app.services.leaderboard_history."""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import insert, select, text, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import engine
+from app.models.competition import Competition, Visibility
+from app.models.game import Game, GameStatus
+from app.models.leaderboard_snapshot import LeaderboardSnapshot
+from app.models.league import Team
+from app.models.participant import Participant
+from app.models.pick import Pick
+from app.models.user import User
+from app.services import background_jobs, leaderboard_history
+from tests.conftest import _login
+
+DAY = date(2026, 3, 10)
+
+
+async def _add(db: AsyncSession, competition: Competition, name: str, points: int) -> User:
+    user = User(email=f"{name}@example.com", username=name, hashed_password="x")
+    db.add(user)
+    await db.flush()
+    db.add(Participant(user_id=user.id, competition_id=competition.id, total_points=points))
+    await db.commit()
+    return user
+
+
+async def _scored_game(db: AsyncSession, competition: Competition, teams: list[Team], day: date):
+    db.add(
+        Game(
+            competition_id=competition.id,
+            external_id=f"hist_{day}",
+            home_team_id=teams[0].id,
+            away_team_id=teams[1].id,
+            scheduled_start_time=datetime.combine(day, datetime.min.time()) + timedelta(hours=20),
+            status=GameStatus.FINAL,
+            scoring_completed=True,
+        )
+    )
+    await db.commit()
+
+
+async def _snapshots(db: AsyncSession):
+    result = await db.execute(
+        select(LeaderboardSnapshot).order_by(LeaderboardSnapshot.day, LeaderboardSnapshot.rank)
+    )
+    return result.scalars().all()
+
+
+async def _get(client: AsyncClient, url: str, email="test@example.com", **params):
+    token = await _login(client, email=email)
+    return await client.get(url, params=params, headers={"Authorization": f"Bearer {token}"})
+
+
+@pytest.mark.asyncio
+async def test_snapshot_records_points_and_tied_ranks(
+    db_session: AsyncSession, active_competition: Competition, test_teams: list[Team]
+):
+    alice = await _add(db_session, active_competition, "alice", 7)
+    bob = await _add(db_session, active_competition, "bob", 7)
+    carol = await _add(db_session, active_competition, "carol", 3)
+    await _scored_game(db_session, active_competition, test_teams, DAY)
+
+    assert await leaderboard_history.take_snapshots(db_session, DAY) == 3
+    await db_session.commit()
+    rows = await _snapshots(db_session)
+    assert {(r.user_id, r.total_points, r.rank) for r in rows} == {
+        (alice.id, 7, 1),
+        (bob.id, 7, 1),
+        (carol.id, 3, 3),
+    }
+
+    # Re-running a day overwrites it rather than duplicating
+    await db_session.execute(
+        update(Participant).where(Participant.user_id == carol.id).values(total_points=9)
+    )
+    await leaderboard_history.take_snapshots(db_session, DAY)
+    await db_session.commit()
+    carol_id = carol.id
+    db_session.expire_all()
+    rows = await _snapshots(db_session)
+    assert (rows[0].user_id, rows[0].rank, rows[0].total_points) == (carol_id, 1, 9)
+    assert len(rows) == 3
+
+
+@pytest.mark.asyncio
+async def test_snapshot_leaves_out_games_scheduled_after_the_day(
+    db_session: AsyncSession, active_competition: Competition, test_teams: list[Team]
+):
+    alice = await _add(db_session, active_competition, "alice", 7)
+    bob = await _add(db_session, active_competition, "bob", 5)
+    await _scored_game(db_session, active_competition, test_teams, DAY)
+    # Bob's pick on an early game the next morning was graded before the job ran
+    early = Game(
+        competition_id=active_competition.id,
+        external_id="hist_next_morning",
+        home_team_id=test_teams[0].id,
+        away_team_id=test_teams[1].id,
+        scheduled_start_time=datetime.combine(DAY + timedelta(days=1), datetime.min.time())
+        + timedelta(hours=1),
+        status=GameStatus.FINAL,
+        scoring_completed=True,
+    )
+    db_session.add(early)
+    await db_session.flush()
+    db_session.add(
+        Pick(
+            user_id=bob.id,
+            competition_id=active_competition.id,
+            game_id=early.id,
+            predicted_winner_team_id=test_teams[0].id,
+            is_correct=True,
+            points_earned=4,
+        )
+    )
+    await db_session.execute(
+        update(Participant)
+        .where(Participant.user_id == bob.id)
+        .values(total_points=9, total_wins=1, accuracy_percentage=100.0)
+    )
+    await db_session.commit()
+
+    await leaderboard_history.take_snapshots(db_session, DAY)
+    await db_session.commit()
+    rows = await _snapshots(db_session)
+    assert [(r.user_id, r.total_points, r.rank) for r in rows] == [(alice.id, 7, 1), (bob.id, 5, 2)]
+
+
+@pytest.mark.asyncio
+async def test_snapshot_skips_days_without_scored_games(
+    db_session: AsyncSession, active_competition: Competition, test_teams: list[Team]
+):
+    await _add(db_session, active_competition, "alice", 7)
+    await _scored_game(db_session, active_competition, test_teams, DAY)
+
+    assert await leaderboard_history.take_snapshots(db_session, DAY + timedelta(days=1)) == 0
+    assert await leaderboard_history.take_snapshots(db_session, DAY - timedelta(days=1)) == 0
+
+
+@pytest.mark.asyncio
+async def test_snapshot_job_records_yesterday(
+    db_session: AsyncSession, active_competition: Competition, test_teams: list[Team]
+):
+    yesterday = leaderboard_history.scoring_day()
+    await _add(db_session, active_competition, "alice", 7)
+    await _scored_game(db_session, active_competition, test_teams, yesterday)
+
+    await background_jobs.wrap_take_leaderboard_snapshots()
+
+    assert [(r.day, r.total_points) for r in await _snapshots(db_session)] == [(yesterday, 7)]
+
+
+@pytest.mark.asyncio
+async def test_participant_history_endpoint(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    second_user: User,
+    active_competition: Competition,
+):
+    rows = [
+        {"user_id": test_user.id, "day": DAY + timedelta(days=i), "total_points": p, "rank": r}
+        for i, (p, r) in enumerate(((1, 2), (4, 1), (4, 2)))
+    ]
+    rows.append({"user_id": second_user.id, "day": DAY, "total_points": 2, "rank": 1})
+    await db_session.execute(
+        insert(LeaderboardSnapshot),
+        [{"competition_id": active_competition.id, **row} for row in rows],
+    )
+    await db_session.commit()
+    url = f"/api/leaderboards/{active_competition.id}/history"
+
+    response = await _get(client, url, start=str(DAY), end=str(DAY + timedelta(days=5)))
+    assert response.status_code == 200
+    assert response.json() == [
+        {"day": "2026-03-10", "total_points": 1, "rank": 2, "rank_change": None},
+        {"day": "2026-03-11", "total_points": 4, "rank": 1, "rank_change": 1},
+        {"day": "2026-03-12", "total_points": 4, "rank": 2, "rank_change": -1},
+    ]
+
+    response = await _get(client, url, start=str(DAY + timedelta(days=1)), end=str(DAY))
+    assert response.status_code == 400
+
+    # Another participant's series, and the default window ending today
+    other = await _get(client, url, user_id=str(second_user.id), start=str(DAY), end=str(DAY))
+    assert [p["total_points"] for p in other.json()] == [2]
+    assert (await _get(client, url)).json() == []
+    assert (await _get(client, url, user_id="not-a-uuid")).status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_competition_history_endpoint(
+    client: AsyncClient, db_session: AsyncSession, test_user: User, active_competition: Competition
+):
+    players = [test_user] + [await _add(db_session, active_competition, f"p{i}", 0) for i in (1, 2)]
+    await db_session.execute(
+        insert(LeaderboardSnapshot),
+        [
+            {
+                "competition_id": active_competition.id,
+                "user_id": user.id,
+                "day": DAY + timedelta(days=day),
+                "total_points": 10 - rank,
+                "rank": rank,
+            }
+            for day in (0, 1)
+            for rank, user in enumerate(players[day:] + players[:day], start=1)
+        ],
+    )
+    await db_session.commit()
+
+    response = await _get(
+        client,
+        f"/api/leaderboards/{active_competition.id}/history/top",
+        top=2,
+        start=str(DAY),
+        end=str(DAY + timedelta(days=1)),
+    )
+    assert response.status_code == 200
+    assert [
+        (d["day"], [(e["username"], e["rank"]) for e in d["entries"]]) for d in response.json()
+    ] == [
+        ("2026-03-10", [("testuser", 1), ("p1", 2)]),
+        ("2026-03-11", [("p1", 1), ("p2", 2)]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_private_competition_history_requires_participation(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    second_user: User,
+    active_competition: Competition,
+):
+    active_competition.visibility = Visibility.PRIVATE
+    await db_session.commit()
+
+    for path in ("history", "history/top"):
+        response = await _get(
+            client, f"/api/leaderboards/{active_competition.id}/{path}", email=second_user.email
+        )
+        assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_history_reads_are_index_range_scans(
+    db_session: AsyncSession, test_user: User, active_competition: Competition
+):
+    users = await db_session.execute(
+        insert(User).returning(User.id),
+        [
+            {"email": f"h{i}@example.com", "username": f"h{i}", "hashed_password": "x"}
+            for i in range(40)
+        ],
+    )
+    await db_session.execute(
+        insert(LeaderboardSnapshot),
+        [
+            {
+                "competition_id": active_competition.id,
+                "user_id": user_id,
+                "day": DAY + timedelta(days=day),
+                "total_points": rank,
+                "rank": rank,
+            }
+            for rank, user_id in enumerate([test_user.id, *users.scalars()], start=1)
+            for day in range(60)
+        ],
+    )
+    await db_session.commit()
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("VACUUM ANALYZE leaderboard_snapshots"))
+
+    end = DAY + timedelta(days=30)
+    queries = {
+        "leaderboard_snapshots_pkey": leaderboard_history.participant_series_query(
+            active_competition.id, test_user.id, DAY, end
+        ),
+        "ix_leaderboard_snapshots_competition_day_rank": (
+            leaderboard_history.competition_series_query(active_competition.id, DAY, end, 10)
+        ),
+    }
+
+    async with engine.begin() as conn:
+        # Tables this small would otherwise be read whole or via a bitmap
+        await conn.execute(text("SET LOCAL enable_seqscan = off"))
+        await conn.execute(text("SET LOCAL enable_bitmapscan = off"))
+        for index, statement in queries.items():
+            query = statement.compile(
+                dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+            )
+            plan = "\n".join((await conn.execute(text(f"EXPLAIN {query}"))).scalars())
+            assert f"Scan using {index}" in plan
+            assert "Sort" not in plan
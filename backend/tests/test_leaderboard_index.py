@@ -0,0 +1,367 @@
+"""Tests for the sorted-set leaderboard index in app.services.leaderboard_index."""
+
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.competition import Competition
+from app.models.game import Game, GameStatus
+from app.models.league import Team
+from app.models.participant import Participant
+from app.models.pick import Pick
+from app.models.user import User
+from app.services import leaderboard_index
+from app.services.score_service import score_picks_for_games
+from tests.conftest import _login
+
+
+def _stats(points=0, wins=0, losses=0, accuracy=0.0, streak=0, longest=0):
+    return {
+        "total_points": points,
+        "total_wins": wins,
+        "total_losses": losses,
+        "accuracy_percentage": accuracy,
+        "current_streak": streak,
+        "longest_streak": longest,
+    }
+
+
+async def _add_player(db: AsyncSession, competition: Competition, name: str, **stats) -> User:
+    user = User(email=f"{name}@example.com", username=name, hashed_password="x")
+    db.add(user)
+    await db.flush()
+    db.add(Participant(user_id=user.id, competition_id=competition.id, **stats))
+    await db.commit()
+    return user
+
+
+async def _get(client: AsyncClient, competition: Competition, **params):
+    token = await _login(client)
+    return await client.get(
+        f"/api/leaderboards/{competition.id}",
+        params=params,
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+
+async def _leaderboard(client: AsyncClient, competition: Competition, sort_by="points"):
+    response = await _get(client, competition, sort_by=sort_by)
+    assert response.status_code == 200
+    return response.json()
+
+
+async def _seed_ladder(db: AsyncSession, competition: Competition, count: int) -> list[str]:
+    """Participants p0..p{count-1} on 100, 98, 96, ... points; returns usernames."""
+    names = [f"p{i}" for i in range(count)]
+    for i, name in enumerate(names):
+        await _add_player(db, competition, name, total_points=100 - 2 * i)
+    return names
+
+
+@pytest.mark.asyncio
+async def test_index_orders_each_sort_key():
+    backend = leaderboard_index.InMemoryLeaderboardBackend()
+    await backend.replace(
+        "c1",
+        {
+            "a": _stats(points=5, wins=5, accuracy=50.0, streak=1, longest=4),
+            "b": _stats(points=9, wins=3, accuracy=75.0, streak=1, longest=2),
+            "c": _stats(points=1, wins=9, accuracy=90.0, streak=3, longest=3),
+        },
+    )
+
+    async def order(sort_by):
+        rows, total = await backend.read_window("c1", sort_by, 0, -1)
+        assert total == 3
+        return [uid for _, uid, _ in rows]
+
+    assert await order("points") == ["b", "a", "c"]
+    assert await order("wins") == ["c", "a", "b"]
+    assert await order("accuracy") == ["c", "b", "a"]
+    # Equal current streaks fall back to the longest streak
+    assert await order("streak") == ["c", "a", "b"]
+    assert await backend.read_window("unbuilt", "points", 0, -1) is None
+    assert await backend.rank("c1", "points", "a") == (True, 1)
+    assert await backend.rank("c1", "points", "zz") == (True, None)
+    assert await backend.rank("unbuilt", "points", "a") == (False, None)
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_matches_in_memory_backend():
+    backend = leaderboard_index.RedisLeaderboardBackend()
+    competition_id = f"test-{uuid.uuid4()}"
+    try:
+        await backend.invalidate(competition_id)
+    except Exception:
+        pytest.skip("Redis not available")
+
+    memory = leaderboard_index.InMemoryLeaderboardBackend()
+    entries = {
+        str(uuid.uuid4()): _stats(points=p, wins=p % 3, accuracy=p * 1.5, streak=p % 2, longest=p)
+        for p in (0, 3, 3, 7, 12)
+    }
+    try:
+        assert await backend.read_window(competition_id, "points", 0, -1) is None
+        assert await backend.rank(competition_id, "points", "late") == (False, None)
+        assert await backend.seek(competition_id, "points", "0:late") == (False, None)
+        for index in (backend, memory):
+            await index.replace(competition_id, entries)
+            await index.upsert(competition_id, {"late": _stats(points=4)})
+            # Moving an existing entry must not leave its old member behind
+            await index.upsert(competition_id, {next(iter(entries)): _stats(points=8, wins=1)})
+
+        for sort_by in leaderboard_index.SORT_KEYS:
+            for start, stop in ((0, -1), (1, 3), (4, 10)):
+                assert await backend.read_window(
+                    competition_id, sort_by, start, stop
+                ) == await memory.read_window(competition_id, sort_by, start, stop)
+            assert await backend.rank(competition_id, sort_by, "late") == await memory.rank(
+                competition_id, sort_by, "late"
+            )
+            for points, user_id in ((4, "late"), (3, "late"), (3, "missing"), (100, "x")):
+                member = leaderboard_index.sort_member(sort_by, user_id, _stats(points=points))
+                assert await backend.seek(competition_id, sort_by, member) == await memory.seek(
+                    competition_id, sort_by, member
+                )
+    finally:
+        await backend.invalidate(competition_id)
+
+
+@pytest.mark.asyncio
+async def test_leaderboard_rebuilds_index_then_serves_from_it(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    active_competition: Competition,
+    leaderboard_index_backend,
+):
+    db_session.add(
+        Participant(user_id=test_user.id, competition_id=active_competition.id, total_points=3)
+    )
+    await db_session.commit()
+    await _add_player(db_session, active_competition, "leader", total_points=8)
+
+    data = await _leaderboard(client, active_competition)
+    assert [(e["username"], e["rank"]) for e in data] == [("leader", 1), ("testuser", 2)]
+    assert await leaderboard_index_backend.read_window(str(active_competition.id), "points", 0, -1)
+
+    # Writes that bypass the scoring path are not visible until the index refreshes
+    await db_session.execute(
+        update(Participant).where(Participant.user_id == test_user.id).values(total_points=20)
+    )
+    await db_session.commit()
+    data = await _leaderboard(client, active_competition)
+    assert data[0]["username"] == "leader"
+
+    await leaderboard_index.rebuild(db_session, active_competition.id)
+    data = await _leaderboard(client, active_competition)
+    assert data[0]["username"] == "testuser"
+    assert data[0]["is_current_user"] is True
+
+
+@pytest.mark.asyncio
+async def test_scoring_path_updates_index(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    active_competition: Competition,
+    test_teams: list[Team],
+):
+    rival = await _add_player(db_session, active_competition, "rival", total_points=1)
+    db_session.add(Participant(user_id=test_user.id, competition_id=active_competition.id))
+    await db_session.commit()
+    assert [e["username"] for e in await _leaderboard(client, active_competition)] == [
+        "rival",
+        "testuser",
+    ]
+
+    game = Game(
+        competition_id=active_competition.id,
+        external_id="idx_game",
+        home_team_id=test_teams[0].id,
+        away_team_id=test_teams[1].id,
+        scheduled_start_time=datetime.utcnow() - timedelta(hours=3),
+        status=GameStatus.FINAL,
+        home_team_score=3,
+        away_team_score=1,
+        winner_team_id=test_teams[0].id,
+    )
+    db_session.add(game)
+    await db_session.flush()
+    for user, team in ((test_user, test_teams[0]), (rival, test_teams[1])):
+        db_session.add(
+            Pick(
+                user_id=user.id,
+                competition_id=active_competition.id,
+                game_id=game.id,
+                predicted_winner_team_id=team.id,
+                is_locked=True,
+            )
+        )
+    await db_session.commit()
+
+    await score_picks_for_games(db_session, [game])
+    await db_session.commit()
+    assert await leaderboard_index.refresh_pending(db_session) == 2
+
+    data = await _leaderboard(client, active_competition, sort_by="wins")
+    assert [(e["username"], e["total_points"], e["total_wins"]) for e in data] == [
+        ("testuser", 1, 1),
+        ("rival", 1, 0),
+    ]
+    assert await leaderboard_index.refresh_pending(db_session) == 0
+
+
+@pytest.mark.asyncio
+async def test_joining_invalidates_index(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    active_competition: Competition,
+    second_user: User,
+):
+    await _add_player(db_session, active_competition, "first", total_points=2)
+    assert len(await _leaderboard(client, active_competition)) == 1
+
+    token = await _login(client, email=second_user.email)
+    response = await client.post(
+        f"/api/competitions/{active_competition.id}/join",
+        json={},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 200
+
+    usernames = [e["username"] for e in await _leaderboard(client, active_competition)]
+    assert usernames == ["first", second_user.username]
+
+
+class _BrokenBackend(leaderboard_index.InMemoryLeaderboardBackend):
+    async def read(self, competition_id, sort_by):
+        raise ConnectionError("redis down")
+
+    async def replace(self, competition_id, entries):
+        raise ConnectionError("redis down")
+
+
+@pytest.mark.asyncio
+async def test_redis_failure_falls_back_to_database(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    active_competition: Competition,
+):
+    leaderboard_index.set_backend(_BrokenBackend())
+    await _add_player(db_session, active_competition, "low", total_wins=1)
+    await _add_player(db_session, active_competition, "high", total_wins=4)
+
+    data = await _leaderboard(client, active_competition, sort_by="wins")
+    assert [e["username"] for e in data] == ["high", "low"]
+    assert not leaderboard_index._available()
+
+
+@pytest.mark.asyncio
+async def test_limit_offset_returns_absolute_ranks(
+    client: AsyncClient, db_session: AsyncSession, test_user: User, active_competition: Competition
+):
+    names = await _seed_ladder(db_session, active_competition, 6)
+
+    response = await _get(client, active_competition, limit=2, offset=3)
+    assert response.status_code == 200
+    assert [(e["username"], e["rank"]) for e in response.json()] == [("p3", 4), ("p4", 5)]
+    assert response.headers["X-Total-Count"] == "6"
+    assert "X-Next-Cursor" in response.headers
+
+    response = await _get(client, active_competition, limit=10, offset=4)
+    assert [e["username"] for e in response.json()] == names[4:]
+    assert "X-Next-Cursor" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_cursor_pagination_walks_every_entry(
+    client: AsyncClient, db_session: AsyncSession, test_user: User, active_competition: Competition
+):
+    names = await _seed_ladder(db_session, active_competition, 5)
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        response = await _get(client, active_competition, **params)
+        assert response.status_code == 200
+        seen += [(e["username"], e["rank"]) for e in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    assert seen == [(name, i + 1) for i, name in enumerate(names)]
+
+
+@pytest.mark.asyncio
+async def test_cursor_never_skips_when_entries_move(db_session: AsyncSession, active_competition):
+    await _seed_ladder(db_session, active_competition, 4)
+    comp_id = active_competition.id
+    rows, _ = await leaderboard_index.read_window(db_session, comp_id, "points", 0, 1)
+    _, last_user_id, last_stats = rows[-1]
+    cursor = leaderboard_index.encode_cursor("points", last_user_id, last_stats)
+    assert await leaderboard_index.resolve_cursor(db_session, comp_id, "points", cursor) == 2
+
+    # p1 (98) drops to the bottom between pages: the next page still starts at p2
+    await db_session.execute(
+        update(Participant).where(Participant.user_id == last_user_id).values(total_points=1)
+    )
+    await db_session.commit()
+    await leaderboard_index.refresh_participants(db_session, Participant.user_id == last_user_id)
+    assert await leaderboard_index.resolve_cursor(db_session, comp_id, "points", cursor) == 1
+    rows, _ = await leaderboard_index.read_window(db_session, comp_id, "points", 1, -1)
+    assert [row[2]["total_points"] for row in rows] == [96, 94, 1]
+
+
+@pytest.mark.asyncio
+async def test_invalid_pagination_arguments(
+    client: AsyncClient, test_user: User, active_competition: Competition
+):
+    assert (await _get(client, active_competition, cursor="not-a-cursor")).status_code == 400
+    cursor = leaderboard_index.encode_cursor("points", str(uuid.uuid4()), _stats())
+    assert (await _get(client, active_competition, cursor=cursor, offset=2)).status_code == 400
+    assert (await _get(client, active_competition, around_me=2, offset=2)).status_code == 400
+    assert (await _get(client, active_competition, limit=0)).status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_around_me_window(
+    client: AsyncClient, db_session: AsyncSession, test_user: User, active_competition: Competition
+):
+    await _seed_ladder(db_session, active_competition, 6)
+    db_session.add(
+        Participant(user_id=test_user.id, competition_id=active_competition.id, total_points=95)
+    )
+    await db_session.commit()
+
+    response = await _get(client, active_competition, around_me=2)
+    assert response.status_code == 200
+    data = response.json()
+    # Ladder is 100, 98, ..., 90 and the caller has 95, so they rank 4th
+    assert [(e["username"], e["rank"]) for e in data] == [
+        ("p1", 2),
+        ("p2", 3),
+        ("testuser", 4),
+        ("p3", 5),
+        ("p4", 6),
+    ]
+    assert data[2]["is_current_user"] is True
+    assert "X-Next-Cursor" not in response.headers
+
+    # The window is clipped at the top of the table
+    response = await _get(client, active_competition, around_me=10)
+    assert len(response.json()) == 7
+
+
+@pytest.mark.asyncio
+async def test_around_me_requires_participation(
+    client: AsyncClient, db_session: AsyncSession, test_user: User, active_competition: Competition
+):
+    await _seed_ladder(db_session, active_competition, 2)
+    response = await _get(client, active_competition, around_me=1)
+    assert response.status_code == 404
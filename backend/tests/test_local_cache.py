@@ -0,0 +1,49 @@
+"""Tests for the in-process LRU/TTL tier in app.services.sports_api.local_cache."""
+
+from app.services.sports_api import local_cache
+from app.services.sports_api.local_cache import LocalCache
+
+
+def test_entries_expire_after_their_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(local_cache.time, "monotonic", lambda: now[0])
+    cache = LocalCache(max_entries=10)
+
+    cache.set("short", "a", ttl=1, size=10)
+    cache.set("long", "b", ttl=5, size=20)
+    cache.set("disabled", "c", ttl=0, size=30)
+    assert cache.get("short") == "a"
+    assert cache.get("disabled") is None
+
+    now[0] += 2
+    assert cache.get("short") is None
+    assert cache.get("long") == "b"
+    assert cache.stats() | {"hit_ratio": None} == {
+        "hits": 2,
+        "misses": 2,
+        "hit_ratio": None,
+        "entries": 1,
+        "max_entries": 10,
+        "evictions": 0,
+        "approx_bytes": 20,
+    }
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = LocalCache(max_entries=2)
+    cache.set("a", 1, ttl=60, size=1)
+    cache.set("b", 2, ttl=60, size=2)
+    cache.get("a")  # "b" is now the least recently used
+    cache.set("c", 3, ttl=60, size=4)
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    stats = cache.stats()
+    assert (stats["entries"], stats["evictions"], stats["approx_bytes"]) == (2, 1, 5)
+
+    # Replacing and deleting keep the size accounting straight
+    cache.set("a", 1, ttl=60, size=8)
+    assert cache.delete("c") and not cache.delete("c")
+    assert cache.stats()["approx_bytes"] == 8
+    cache.clear()
+    assert cache.stats()["entries"] == cache.stats()["approx_bytes"] == 0
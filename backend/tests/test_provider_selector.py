@@ -0,0 +1,63 @@
+"""Tests for per-call provider ordering in app.services.sports_api.provider_selector."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config import settings
+from app.services.sports_api.provider_selector import ProviderSelector
+
+ESPN, ODDS, RAPID = (SimpleNamespace(provider=name) for name in ("espn", "odds", "rapid"))
+CLIENTS = [ESPN, ODDS, RAPID]
+
+
+@pytest.fixture(autouse=True)
+def no_exploration(monkeypatch):
+    monkeypatch.setattr(settings, "API_PROVIDER_EXPLORATION_RATE", 0)
+    monkeypatch.setattr(settings, "API_PROVIDER_EWMA_ALPHA", 0.5)
+
+
+def test_unmeasured_providers_keep_configured_order():
+    selector = ProviderSelector()
+    assert selector.order(CLIENTS, "NFL", "live_scores") == CLIENTS
+
+    # Two calls are not enough to rank a provider
+    for _ in range(2):
+        selector.record("rapid", "NFL", "live_scores", 10, ok=True)
+    assert selector.order(CLIENTS, "NFL", "live_scores") == CLIENTS
+    selector.record("rapid", "NFL", "live_scores", 10, ok=True)
+    assert selector.order(CLIENTS, "NFL", "live_scores") == [RAPID, ESPN, ODDS]
+
+
+def test_ranks_by_latency_over_success_rate():
+    selector = ProviderSelector()
+    for _ in range(3):
+        selector.record("espn", "NBA", "schedule", 100, ok=True)
+        selector.record("odds", "NBA", "schedule", 300, ok=True)
+    assert selector.rank(CLIENTS, "NBA", "schedule") == [ESPN, ODDS, RAPID]
+
+    # One failure halves ESPN's success rate (alpha 0.5): 100ms / 0.5 > 300ms / 1
+    selector.record("espn", "NBA", "schedule", 500, ok=False)
+    stats = selector.stats[("espn", "NBA", "schedule")]
+    assert (stats.latency_ms, stats.success_rate) == (300.0, 0.5)
+    assert selector.rank(CLIENTS, "NBA", "schedule") == [ODDS, ESPN, RAPID]
+    # Other operations and leagues are ranked separately
+    assert selector.rank(CLIENTS, "NBA", "live_scores") == CLIENTS
+
+    snapshot = selector.snapshot(CLIENTS)
+    assert snapshot["order"] == {"NBA:schedule": ["odds", "espn", "rapid"]}
+    assert snapshot["stats"]["NBA:schedule"]["espn"] == {
+        "latency_ms": 300.0,
+        "success_rate": 0.5,
+        "calls": 4,
+    }
+
+
+def test_exploration_moves_another_provider_first(monkeypatch):
+    monkeypatch.setattr(settings, "API_PROVIDER_EXPLORATION_RATE", 1)
+    selector = ProviderSelector()
+    for _ in range(20):
+        order = selector.order(CLIENTS, "NFL", "live_scores")
+        assert order[0] is not ESPN
+        assert sorted(c.provider for c in order) == ["espn", "odds", "rapid"]
+    assert selector.explorations == 20
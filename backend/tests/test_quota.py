@@ -0,0 +1,99 @@
+"""Tests for provider request budgets in app.services.sports_api.quota."""
+
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.db.redis import get_redis
+from app.services.sports_api import quota
+from app.services.sports_api.base import APIProvider
+from app.services.sports_api.quota import QuotaManager, burn_rate, period_reset
+
+
+@pytest.fixture
+async def redis():
+    client = get_redis()
+    try:
+        await client.ping()
+    except Exception:
+        pytest.skip("Redis not available")
+    keys = [
+        key(provider)
+        for provider in quota.METERED_PROVIDERS
+        for key in (quota._budget_key, quota._bucket_key, quota._samples_key)
+    ]
+    await client.delete(*keys)
+    yield client
+    await client.delete(*keys)
+
+
+@pytest.mark.asyncio
+async def test_calls_are_paced_then_held_at_the_reserve(redis, monkeypatch):
+    monkeypatch.setattr(settings, "API_QUOTA_BURST", 2)
+    monkeypatch.setattr(settings, "API_QUOTA_RESERVE_REQUESTS", 25)
+    manager = QuotaManager()
+
+    # Unmetered providers never touch the budget
+    assert await manager.try_acquire(APIProvider.ESPN)
+    # The configured monthly budget applies until the provider reports one
+    results = [await manager.try_acquire(APIProvider.THE_ODDS_API) for _ in range(3)]
+    assert results == [True, True, False]
+    assert manager.skipped["the_odds_api"] == {"paced": 1, "reserve": 0}
+
+    await manager.record(
+        APIProvider.THE_ODDS_API,
+        httpx.Headers({"x-requests-remaining": "25", "x-requests-used": "475"}),
+    )
+    assert not await manager.try_acquire(APIProvider.THE_ODDS_API)
+    assert manager.skipped["the_odds_api"] == {"paced": 1, "reserve": 1}
+
+    # No monthly budget and nothing reported yet: not paced
+    assert all([await manager.try_acquire(APIProvider.RAPIDAPI) for _ in range(3)])
+
+
+@pytest.mark.asyncio
+async def test_status_reports_budget_and_burn_rate(redis):
+    manager = QuotaManager()
+    now = datetime.now(UTC).timestamp()
+    for minutes_ago, remaining in ((120, 300), (60, 290), (0, 280)):
+        with patch.object(quota.time, "time", return_value=now - minutes_ago * 60):
+            await manager.record(
+                APIProvider.RAPIDAPI,
+                {
+                    "x-ratelimit-requests-remaining": str(remaining),
+                    "x-ratelimit-requests-limit": "1000",
+                },
+            )
+
+    status = (await manager.get_status())["rapidapi"]
+    assert status["remaining"] == 280
+    assert status["limit"] == 1000
+    assert status["burn_per_hour"] == 10.0
+    exhaustion = datetime.fromisoformat(status["projected_exhaustion"])
+    assert abs(exhaustion.timestamp() - (now + 28 * 3600)) < 5
+    assert (await manager.get_status())["the_odds_api"]["remaining"] is None
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_fail_open():
+    manager = QuotaManager()
+    with patch.object(quota, "get_redis", side_effect=ConnectionError("down")):
+        assert await manager.try_acquire(APIProvider.THE_ODDS_API)
+        await manager.record(APIProvider.THE_ODDS_API, {"x-requests-remaining": "3"})
+        assert (await manager.get_status())["the_odds_api"]["remaining"] is None
+
+
+def test_burn_rate_ignores_samples_before_a_reset():
+    now = 100_000.0
+    samples = [(now - 7200, 5), (now - 3600, 500), (now, 490)]
+    assert burn_rate(samples, now) == 10.0
+    assert burn_rate([(now, 490)], now) is None
+
+
+def test_period_reset(monkeypatch):
+    monkeypatch.setattr(settings, "API_QUOTA_RESET_DAY", 15)
+    assert period_reset(datetime(2025, 12, 20, tzinfo=UTC)) == datetime(2026, 1, 15, tzinfo=UTC)
+    assert period_reset(datetime(2025, 3, 2, tzinfo=UTC)) == datetime(2025, 3, 15, tzinfo=UTC)
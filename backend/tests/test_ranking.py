@@ -0,0 +1,184 @@
+"""Tests for SQL leaderboard ranking in app.services.ranking."""
+
+import random
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.session import engine
+from app.models.competition import Competition
+from app.models.participant import Participant
+from app.models.user import User
+from app.services import leaderboard_index, ranking
+from tests.conftest import _login
+
+EARLY = datetime(2026, 3, 1, 12, 0)
+
+
+async def _add(db: AsyncSession, competition: Competition, name: str, **stats) -> User:
+    user = User(email=f"{name}@example.com", username=name, hashed_password="x")
+    db.add(user)
+    await db.flush()
+    db.add(Participant(user_id=user.id, competition_id=competition.id, **stats))
+    await db.commit()
+    return user
+
+
+async def _get(client: AsyncClient, url: str, **params):
+    token = await _login(client)
+    response = await client.get(url, params=params, headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+    return response.json()
+
+
+async def _seed_ties(db: AsyncSession, competition: Competition) -> None:
+    # tie_a and tie_b match on every rank key; "slow" loses only on pick time
+    same = {"total_points": 10, "accuracy_percentage": 50.0, "total_wins": 5, "last_pick_at": EARLY}
+    await _add(db, competition, "tie_a", **same)
+    await _add(db, competition, "tie_b", **same)
+    await _add(db, competition, "slow", **{**same, "last_pick_at": EARLY + timedelta(hours=1)})
+    await _add(db, competition, "never", **{**same, "last_pick_at": None})
+    await _add(db, competition, "sharp", total_points=10, accuracy_percentage=60.0, total_wins=1)
+    await _add(db, competition, "winner", total_points=10, accuracy_percentage=50.0, total_wins=6)
+    await _add(db, competition, "low", total_points=2)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "mode,expected",
+    [
+        ("rank", [1, 2, 3, 3, 5, 6, 7]),
+        ("dense", [1, 2, 3, 3, 4, 5, 6]),
+    ],
+)
+async def test_ties_share_a_rank(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    active_competition: Competition,
+    monkeypatch,
+    mode,
+    expected,
+):
+    monkeypatch.setattr(settings, "LEADERBOARD_RANK_MODE", mode)
+    await _seed_ties(db_session, active_competition)
+
+    entries = await _get(client, f"/api/leaderboards/{active_competition.id}")
+
+    names = [e["username"] for e in entries]
+    # accuracy, then wins, then earliest pick (never picked last); tie by user id
+    assert names[:2] == ["sharp", "winner"]
+    assert sorted(names[2:4]) == ["tie_a", "tie_b"]
+    assert names[4:] == ["slow", "never", "low"]
+    assert [e["rank"] for e in entries] == expected
+
+
+@pytest.mark.asyncio
+async def test_admin_list_matches_leaderboard(
+    client: AsyncClient, db_session: AsyncSession, test_user: User, active_competition: Competition
+):
+    await _seed_ties(db_session, active_competition)
+
+    for sort_by in ranking.SORT_KEYS:
+        public = await _get(client, f"/api/leaderboards/{active_competition.id}", sort_by=sort_by)
+        admin = await _get(
+            client,
+            f"/api/admin/competitions/{active_competition.id}/participants",
+            sort_by=sort_by,
+        )
+        assert [(e["user_id"], e["rank"]) for e in admin] == [
+            (e["user_id"], e["rank"]) for e in public
+        ]
+
+
+@pytest.mark.asyncio
+async def test_index_order_matches_sql_order(db_session: AsyncSession, active_competition):
+    rng = random.Random(9)
+    for i in range(40):
+        wins = rng.randint(0, 3)
+        await _add(
+            db_session,
+            active_competition,
+            f"r{i}",
+            total_points=rng.randint(0, 3),
+            total_wins=wins,
+            accuracy_percentage=rng.choice([0.0, 33.3, 50.0, 100.0]),
+            current_streak=rng.randint(0, 2),
+            longest_streak=rng.randint(2, 3),
+            last_pick_at=rng.choice([None, EARLY, EARLY + timedelta(minutes=1)]),
+        )
+
+    for sort_by in ranking.SORT_KEYS:
+        rows = await ranking.fetch_ranked(db_session, active_competition.id, sort_by)
+        window, total = await leaderboard_index.read_window(
+            db_session, active_competition.id, sort_by
+        )
+        assert total == 40
+        assert [uid for _, uid, _ in window] == [str(p.user_id) for p, *_ in rows]
+
+        # Every position agrees with the rank SQL assigns
+        ranks = await ranking.ranks_for(
+            db_session, active_competition.id, sort_by, [uid for _, uid, _ in window]
+        )
+        assert [ranks[str(p.user_id)] for p, *_ in rows] == [row.rank for row in rows]
+
+        # The index gives the same ranks for any window, even one starting mid-tie
+        for start, stop in ((0, -1), (7, 19), (23, 23)):
+            window, _ = await leaderboard_index.read_window(
+                db_session, active_competition.id, sort_by, start, stop
+            )
+            with patch.object(ranking, "ranks_for", side_effect=AssertionError("used SQL")):
+                ranks = await leaderboard_index.window_ranks(
+                    db_session, active_competition.id, sort_by, window
+                )
+            assert [ranks[uid] for _, uid, _ in window] == [
+                row.rank for row in rows[start:][: len(window)]
+            ]
+
+
+@pytest.mark.asyncio
+async def test_tie_breakers_are_configurable(
+    db_session: AsyncSession, active_competition: Competition, monkeypatch
+):
+    await _seed_ties(db_session, active_competition)
+
+    monkeypatch.setattr(settings, "LEADERBOARD_TIE_BREAKERS", "last_pick_at")
+    rows = await ranking.fetch_ranked(db_session, active_competition.id, "points")
+    names = [row.username for row in rows]
+    assert sorted(names[:2]) == ["tie_a", "tie_b"]
+    assert names[2] == "slow"
+    assert sorted(names[3:6]) == ["never", "sharp", "winner"]  # none of them has picked
+    assert [row.rank for row in rows] == [1, 1, 3, 4, 4, 4, 7]
+
+    monkeypatch.setattr(settings, "LEADERBOARD_TIE_BREAKERS", "accuracy,bogus")
+    with pytest.raises(ValueError):
+        ranking.rank_keys("points")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sort_by", ranking.SORT_KEYS)
+async def test_ranking_is_an_index_only_scan(
+    db_session: AsyncSession, active_competition: Competition, sort_by
+):
+    for i in range(50):
+        await _add(db_session, active_competition, f"q{i}", total_points=i % 7)
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("VACUUM ANALYZE participants"))
+
+    query = ranking.ranked_user_ids(active_competition.id, sort_by).compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    async with engine.begin() as conn:
+        # Small tables would otherwise always be read sequentially
+        await conn.execute(text("SET LOCAL enable_seqscan = off"))
+        plan = "\n".join((await conn.execute(text(f"EXPLAIN {query}"))).scalars())
+
+    assert f"Index Only Scan using ix_participants_rank_{sort_by}" in plan
+    assert "Sort" not in plan
@@ -0,0 +1,33 @@
+"""Tests for the shared async Redis client in app.db.redis."""
+
+import pytest
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+from app.db import redis as redis_pool
+
+
+@pytest.mark.asyncio
+async def test_one_pooled_client_per_process(monkeypatch):
+    await redis_pool.close_redis()
+    monkeypatch.setattr(settings, "REDIS_MAX_CONNECTIONS", 3)
+
+    client = redis_pool.get_redis()
+    assert redis_pool.get_redis() is client
+    pool = client.connection_pool
+    assert type(pool) is aioredis.ConnectionPool
+    assert pool.max_connections == 3
+
+    try:
+        await client.ping()
+    except Exception:
+        pytest.skip("Redis not available")
+    # Commands are decoded and reuse pooled connections
+    await client.set("redis_pool_test", "v", ex=5)
+    assert await client.get("redis_pool_test") == "v"
+    assert len(pool._available_connections) + len(pool._in_use_connections) == 1
+    await client.delete("redis_pool_test")
+
+    await redis_pool.close_redis()
+    assert redis_pool.get_redis() is not client
+    await redis_pool.close_redis()
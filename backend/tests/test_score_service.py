@@ -0,0 +1,471 @@
+"""Tests for set-based pick scoring in app.services.score_service."""
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import engine
+from app.models.competition import Competition
+from app.models.game import Game, GameStatus
+from app.models.league import Team
+from app.models.participant import Participant
+from app.models.pick import Pick
+from app.models.user import User
+from app.services.score_service import (
+    rebuild_competition_streaks,
+    reconcile_participant_stats,
+    rescore_competition,
+    score_picks_for_game,
+    score_picks_for_games,
+)
+
+
+@contextmanager
+def _count_queries():
+    """Count SQL statements sent to the database inside the block."""
+    counter = {"count": 0}
+
+    def _on_execute(conn, cursor, statement, parameters, context, executemany):
+        counter["count"] += 1
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _on_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _on_execute)
+
+
+async def _final_game(db: AsyncSession, competition: Competition, teams: list[Team], ext: str):
+    game = Game(
+        competition_id=competition.id,
+        external_id=ext,
+        home_team_id=teams[0].id,
+        away_team_id=teams[1].id,
+        scheduled_start_time=datetime.utcnow() - timedelta(hours=3),
+        status=GameStatus.FINAL,
+        home_team_score=21,
+        away_team_score=14,
+        winner_team_id=teams[0].id,
+    )
+    db.add(game)
+    await db.commit()
+    await db.refresh(game)
+    return game
+
+
+async def _seed_pickers(
+    db: AsyncSession, competition: Competition, game: Game, teams: list[Team], count: int
+):
+    """Bulk-insert ``count`` users who each join and pick ``game``; evens pick home."""
+    users = [
+        {
+            "email": f"{game.external_id}_{i}@example.com",
+            "username": f"{game.external_id}_{i}",
+            "hashed_password": "x",
+        }
+        for i in range(count)
+    ]
+    user_ids = (await db.execute(insert(User).returning(User.id), users)).scalars().all()
+    await db.execute(
+        insert(Participant),
+        [{"user_id": uid, "competition_id": competition.id} for uid in user_ids],
+    )
+    await db.execute(
+        insert(Pick),
+        [
+            {
+                "user_id": uid,
+                "competition_id": competition.id,
+                "game_id": game.id,
+                "predicted_winner_team_id": teams[i % 2].id,
+            }
+            for i, uid in enumerate(user_ids)
+        ],
+    )
+    await db.commit()
+    return user_ids
+
+
+@pytest.mark.scoring
+async def test_score_picks_for_game_grades_all_picks_and_participants(
+    db_session: AsyncSession, active_competition: Competition, test_teams: list[Team]
+):
+    game = await _final_game(db_session, active_competition, test_teams, "bulk")
+    user_ids = await _seed_pickers(db_session, active_competition, game, test_teams, 6)
+
+    scored = await score_picks_for_game(db_session, game)
+    await db_session.commit()
+
+    assert scored == 6
+    for i, uid in enumerate(user_ids):
+        participant = (
+            await db_session.execute(
+                Participant.__table__.select().where(Participant.user_id == uid)
+            )
+        ).one()
+        won = i % 2 == 0
+        assert participant.total_points == (1 if won else 0)
+        assert participant.total_wins == (1 if won else 0)
+        assert participant.total_losses == (0 if won else 1)
+        assert participant.accuracy_percentage == (100.0 if won else 0.0)
+        assert participant.current_streak == (1 if won else 0)
+
+
+@pytest.mark.scoring
+async def test_score_picks_for_game_tie_voids_previous_grade(
+    db_session: AsyncSession,
+    test_user: User,
+    participant: Participant,
+    active_competition: Competition,
+    test_teams: list[Team],
+):
+    """Re-scoring a game that became a tie clears an earlier win."""
+    game = await _final_game(db_session, active_competition, test_teams, "tie_after")
+    pick = Pick(
+        user_id=test_user.id,
+        competition_id=active_competition.id,
+        game_id=game.id,
+        predicted_winner_team_id=test_teams[0].id,
+    )
+    db_session.add(pick)
+    await db_session.commit()
+
+    await score_picks_for_game(db_session, game)
+    game.winner_team_id = None
+    await score_picks_for_game(db_session, game)
+    await db_session.commit()
+    await db_session.refresh(pick)
+    await db_session.refresh(participant)
+
+    assert pick.is_correct is None
+    assert pick.points_earned == 0
+    assert participant.total_points == 0
+    assert participant.total_wins == 0
+
+
+@pytest.mark.scoring
+@pytest.mark.slow
+async def test_score_picks_for_game_query_count_is_constant(
+    db_session: AsyncSession, active_competition: Competition, test_teams: list[Team]
+):
+    """Benchmark: statement count must not grow with pick volume."""
+    counts = {}
+    for size in (5, 500):
+        game = await _final_game(db_session, active_competition, test_teams, f"size_{size}")
+        await _seed_pickers(db_session, active_competition, game, test_teams, size)
+
+        with _count_queries() as queries:
+            scored = await score_picks_for_game(db_session, game)
+        await db_session.commit()
+
+        assert scored == size
+        counts[size] = queries["count"]
+
+    assert counts[5] == counts[500]
+    assert counts[500] <= 2
+
+
+@pytest.mark.scoring
+async def test_score_picks_for_game_applies_deltas_on_top_of_existing_totals(
+    db_session: AsyncSession,
+    test_user: User,
+    participant: Participant,
+    active_competition: Competition,
+    test_teams: list[Team],
+):
+    """Grading adds to the stored totals instead of recomputing them."""
+    participant.total_points = 7
+    participant.total_wins = 7
+    participant.total_losses = 3
+    await db_session.commit()
+
+    game = await _final_game(db_session, active_competition, test_teams, "delta")
+    db_session.add(
+        Pick(
+            user_id=test_user.id,
+            competition_id=active_competition.id,
+            game_id=game.id,
+            predicted_winner_team_id=test_teams[0].id,
+        )
+    )
+    await db_session.commit()
+
+    await score_picks_for_game(db_session, game)
+    # Re-scoring an unchanged result must not double count
+    await score_picks_for_game(db_session, game)
+    await db_session.commit()
+    await db_session.refresh(participant)
+
+    assert participant.total_points == 8
+    assert participant.total_wins == 8
+    assert participant.total_losses == 3
+    assert participant.accuracy_percentage == pytest.approx(8 / 11 * 100)
+
+
+@pytest.mark.scoring
+async def test_score_picks_for_game_flip_moves_win_to_loss(
+    db_session: AsyncSession,
+    test_user: User,
+    participant: Participant,
+    active_competition: Competition,
+    test_teams: list[Team],
+):
+    """A corrected winner flips the pick and swaps the win for a loss."""
+    game = await _final_game(db_session, active_competition, test_teams, "flip")
+    db_session.add(
+        Pick(
+            user_id=test_user.id,
+            competition_id=active_competition.id,
+            game_id=game.id,
+            predicted_winner_team_id=test_teams[0].id,
+        )
+    )
+    await db_session.commit()
+
+    await score_picks_for_game(db_session, game)
+    game.winner_team_id = test_teams[1].id
+    await score_picks_for_game(db_session, game)
+    await db_session.commit()
+    await db_session.refresh(participant)
+
+    assert participant.total_points == 0
+    assert participant.total_wins == 0
+    assert participant.total_losses == 1
+    assert participant.accuracy_percentage == 0.0
+
+
+@pytest.mark.scoring
+async def test_reconcile_participant_stats_repairs_drift(
+    db_session: AsyncSession,
+    test_user: User,
+    second_user: User,
+    participant: Participant,
+    active_competition: Competition,
+    test_teams: list[Team],
+):
+    game = await _final_game(db_session, active_competition, test_teams, "drift")
+    other = Participant(user_id=second_user.id, competition_id=active_competition.id)
+    db_session.add(other)
+    db_session.add_all(
+        [
+            Pick(
+                user_id=uid,
+                competition_id=active_competition.id,
+                game_id=game.id,
+                predicted_winner_team_id=test_teams[0].id,
+            )
+            for uid in (test_user.id, second_user.id)
+        ]
+    )
+    await db_session.commit()
+    await score_picks_for_game(db_session, game)
+    await db_session.commit()
+
+    assert await reconcile_participant_stats(db_session) == 0
+
+    participant.total_points = 42
+    await db_session.commit()
+
+    assert await reconcile_participant_stats(db_session) == 1
+    await db_session.commit()
+    await db_session.refresh(participant)
+    assert participant.total_points == 1
+    assert participant.total_wins == 1
+
+
+async def _finished_games(
+    db: AsyncSession,
+    competition: Competition,
+    teams: list[Team],
+    user: User,
+    results: list[bool],
+    prefix: str,
+):
+    """Create FINAL games ending an hour apart, each with a pick by ``user``.
+
+    ``results[i]`` says whether the user's pick on the i-th finished game is
+    correct. Picks are submitted in reverse order so submission time cannot
+    be mistaken for completion time.
+    """
+    base = datetime.utcnow() - timedelta(days=2)
+    games = []
+    for i, _ in enumerate(results):
+        game = Game(
+            competition_id=competition.id,
+            external_id=f"{prefix}_{i}",
+            home_team_id=teams[0].id,
+            away_team_id=teams[1].id,
+            scheduled_start_time=base + timedelta(hours=i),
+            end_time=base + timedelta(hours=i, minutes=50),
+            status=GameStatus.FINAL,
+            winner_team_id=teams[0].id,
+        )
+        db.add(game)
+        games.append(game)
+    await db.commit()
+    for i in reversed(range(len(results))):
+        db.add(
+            Pick(
+                user_id=user.id,
+                competition_id=competition.id,
+                game_id=games[i].id,
+                predicted_winner_team_id=teams[0].id if results[i] else teams[1].id,
+                created_at=datetime.utcnow() + timedelta(seconds=len(results) - i),
+            )
+        )
+    await db.commit()
+    return games
+
+
+@pytest.mark.scoring
+async def test_streaks_follow_game_completion_order(
+    db_session: AsyncSession,
+    test_user: User,
+    participant: Participant,
+    active_competition: Competition,
+    test_teams: list[Team],
+):
+    games = await _finished_games(
+        db_session,
+        active_competition,
+        test_teams,
+        test_user,
+        [True, True, True, False, True, True, True, True, True],
+        "order",
+    )
+
+    await score_picks_for_games(db_session, games[:6])
+    await db_session.commit()
+    await db_session.refresh(participant)
+    assert participant.current_streak == 2
+    assert participant.longest_streak == 3
+    assert participant.last_scored_game_at == games[5].end_time
+
+    await score_picks_for_games(db_session, games[6:])
+    await db_session.commit()
+    await db_session.refresh(participant)
+    assert participant.current_streak == 5
+    assert participant.longest_streak == 5
+
+
+@pytest.mark.scoring
+async def test_streaks_rebuild_when_games_are_graded_out_of_order(
+    db_session: AsyncSession,
+    test_user: User,
+    participant: Participant,
+    active_competition: Competition,
+    test_teams: list[Team],
+):
+    games = await _finished_games(
+        db_session, active_competition, test_teams, test_user, [True, False, True], "late"
+    )
+
+    await score_picks_for_games(db_session, [games[0], games[2]])
+    await db_session.commit()
+    await db_session.refresh(participant)
+    assert participant.current_streak == 2
+
+    # The loss finished between the two wins, so only the last win counts
+    await score_picks_for_game(db_session, games[1])
+    await db_session.commit()
+    await db_session.refresh(participant)
+    assert participant.current_streak == 1
+    assert participant.longest_streak == 1
+    assert await reconcile_participant_stats(db_session) == 0
+
+
+@pytest.mark.scoring
+async def test_rebuild_competition_streaks(
+    db_session: AsyncSession,
+    test_user: User,
+    participant: Participant,
+    active_competition: Competition,
+    test_teams: list[Team],
+):
+    games = await _finished_games(
+        db_session, active_competition, test_teams, test_user, [False, True, True], "rebuild"
+    )
+    await score_picks_for_games(db_session, games)
+    participant.current_streak = 0
+    participant.longest_streak = 0
+    participant.last_scored_game_at = None
+    await db_session.commit()
+
+    assert await rebuild_competition_streaks(db_session, active_competition.id) == 1
+    await db_session.commit()
+    await db_session.refresh(participant)
+    assert participant.current_streak == 2
+    assert participant.longest_streak == 2
+    assert participant.last_scored_game_at == games[2].end_time
+
+
+@pytest.mark.scoring
+async def test_streak_migration_backfills_like_rebuild(
+    db_session: AsyncSession,
+    test_user: User,
+    participant: Participant,
+    active_competition: Competition,
+    test_teams: list[Team],
+):
+    """Migration b7c1d2e3f4a5 fills streak state the way rebuild_streaks does."""
+    import importlib.util
+    from pathlib import Path
+
+    from sqlalchemy import text
+
+    path = next(Path(__file__).parents[1].glob("alembic/versions/*-b7c1d2e3f4a5_*.py"))
+    spec = importlib.util.spec_from_file_location("streak_migration", path)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+
+    games = await _finished_games(
+        db_session, active_competition, test_teams, test_user, [True, True, False, True], "mig"
+    )
+    await score_picks_for_games(db_session, games)
+    participant.current_streak = 0
+    participant.longest_streak = 0
+    participant.last_scored_game_at = None
+    await db_session.commit()
+
+    await db_session.execute(text(migration.BACKFILL_STREAKS))
+    await db_session.commit()
+    await db_session.refresh(participant)
+    assert participant.current_streak == 1
+    assert participant.longest_streak == 2
+    assert participant.last_scored_game_at == games[3].end_time
+    assert await reconcile_participant_stats(db_session) == 0
+
+
+@pytest.mark.scoring
+async def test_rescore_competition_query_count_is_constant(
+    db_session: AsyncSession, active_competition: Competition, test_teams: list[Team]
+):
+    """Benchmark: a whole-competition rescore uses a fixed number of statements."""
+    counts = []
+    for games in (1, 8):
+        for i in range(games):
+            game = await _final_game(
+                db_session, active_competition, test_teams, f"comp_{games}_{i}"
+            )
+            await _seed_pickers(db_session, active_competition, game, test_teams, 10)
+
+        stages = []
+
+        async def _on_stage(stage, progress, stages=stages):
+            stages.append(stage)
+
+        with _count_queries() as queries:
+            summary = await rescore_competition(
+                db_session, active_competition.id, on_stage=_on_stage
+            )
+        await db_session.commit()
+        counts.append(queries["count"])
+        assert stages == ["marking_games", "grading_picks", "rebuilding_participants"]
+
+    assert summary["games"] == 9
+    assert summary["picks"] == 90
+    assert summary["participants"] == 90
+    assert counts[0] == counts[1] == 3
@@ -1,3 +1,5 @@
+import json
+import time
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -9,20 +11,29 @@ from app.services.sports_api.sports_service import SportsDataService
 
 @pytest.fixture
 def mock_redis_client():
-    mock = MagicMock()
+    mock = AsyncMock()
     mock.get.return_value = None
     mock.setex.return_value = True
     return mock
 
 
 @pytest.fixture
-def sports_service(mock_redis_client):
-    with patch("redis.from_url", return_value=mock_redis_client):
+def sports_service(mock_redis_client, monkeypatch):
+    from app.core.config import settings
+
+    # Exercise the Redis tier; the local tier has its own tests
+    monkeypatch.setattr(settings, "SPORTS_LOCAL_CACHE_SECONDS", 0)
+    # Keep the configured provider order; ordering has its own tests
+    monkeypatch.setattr(settings, "API_PROVIDER_EXPLORATION_RATE", 0)
+    with patch("app.services.sports_api.sports_service.get_redis", return_value=mock_redis_client):
         service = SportsDataService()
         # Mock the clients to prevent actual API calls
         service.clients = [AsyncMock(), AsyncMock()]
         service.clients[0].provider = APIProvider.ESPN
         service.clients[1].provider = APIProvider.THE_ODDS_API
+        # Request budgets have their own tests
+        service.quotas = AsyncMock()
+        service.quotas.try_acquire.return_value = True
         yield service
 
 
@@ -110,6 +121,73 @@ async def test_get_schedule_rate_limit_skips_to_next(sports_service):
     assert len(games) == 1
 
 
+@pytest.mark.asyncio
+async def test_provider_over_budget_is_skipped(sports_service):
+    """A metered provider whose request budget is low is not called."""
+    from app.services.sports_api.base import APIUnavailableError
+
+    sports_service.clients[0].get_live_scores.side_effect = Exception("ESPN down")
+    sports_service.quotas.try_acquire.side_effect = (
+        lambda provider: provider != APIProvider.THE_ODDS_API
+    )
+
+    with pytest.raises(APIUnavailableError):
+        await sports_service.get_live_scores("NFL", use_cache=False)
+    sports_service.clients[1].get_live_scores.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_spends_no_request_budget(sports_service):
+    """The budget is only checked once the breaker admits the call."""
+    from app.services.circuit_breaker import CircuitBreakerManager
+    from app.services.sports_api.base import APIUnavailableError
+
+    manager = CircuitBreakerManager()
+    odds = manager.get_breaker(f"{APIProvider.THE_ODDS_API}_live_scores", timeout_seconds=60)
+    odds.failure_count = odds.failure_threshold
+    odds.last_failure_time = datetime.utcnow()
+    odds._trip()
+    sports_service.clients[0].get_live_scores.side_effect = Exception("ESPN down")
+
+    with (
+        patch("app.services.sports_api.sports_service.circuit_breaker_manager", manager),
+        pytest.raises(APIUnavailableError),
+    ):
+        await sports_service.get_live_scores("NFL", use_cache=False)
+
+    sports_service.quotas.try_acquire.assert_awaited_once_with(APIProvider.ESPN)
+    sports_service.clients[1].get_live_scores.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_breaker_probes_are_fixed_metered_requests(sports_service, monkeypatch):
+    """Probes request the probe league's live scores, and only with budget left."""
+    from app.core.config import settings
+    from app.services.circuit_breaker import CircuitBreakerManager, CircuitState
+
+    monkeypatch.setattr(settings, "CIRCUIT_BREAKER_MODE", "sliding_window")
+    monkeypatch.setattr(settings, "CIRCUIT_BREAKER_HALF_OPEN_CALLS", 1)
+    monkeypatch.setattr(settings, "CIRCUIT_BREAKER_PROBE_LEAGUE", "NBA")
+    manager = CircuitBreakerManager()
+    odds_client = sports_service.clients[1]
+    with patch("app.services.sports_api.sports_service.circuit_breaker_manager", manager):
+        breaker = sports_service._breaker(odds_client, "schedule")
+    breaker.timeout_seconds = 0
+    breaker._trip()
+
+    sports_service.quotas.try_acquire.return_value = False
+    await manager.probe_all()
+    odds_client.get_live_scores.assert_not_called()
+    assert breaker.probes["skipped"] == 1
+
+    sports_service.quotas.try_acquire.return_value = True
+    odds_client.get_live_scores.return_value = []
+    await manager.probe_all()
+    odds_client.get_live_scores.assert_awaited_once_with("NBA")
+    odds_client.get_schedule.assert_not_called()
+    assert breaker.state == CircuitState.CLOSED
+
+
 @pytest.mark.asyncio
 async def test_get_live_scores_success(sports_service, mock_redis_client):
     """get_live_scores returns games from primary API and caches result."""
@@ -243,10 +321,10 @@ def test_deserialize_invalid_json_returns_empty(sports_service):
     assert result == []
 
 
-async def test_get_from_cache_redis_error_returns_none(sports_service, mock_redis_client):
-    """_get_from_cache swallows Redis errors and returns None."""
+async def test_get_cached_games_redis_error_returns_none(sports_service, mock_redis_client):
+    """_get_cached_games swallows Redis errors and returns None."""
     mock_redis_client.get.side_effect = Exception("redis down")
-    result = await sports_service._get_from_cache("any_key")
+    result = await sports_service._get_cached_games("any_key", 60)
     assert result is None
 
 
@@ -256,10 +334,10 @@ async def test_set_cache_redis_error_is_silenced(sports_service, mock_redis_clie
     await sports_service._set_cache("key", "value", 60)  # should not raise
 
 
-async def test_get_from_cache_no_redis(sports_service):
-    """_get_from_cache returns None when redis_client is None."""
+async def test_get_cached_games_no_redis(sports_service):
+    """_get_cached_games returns None when redis_client is None."""
     sports_service.redis_client = None
-    assert await sports_service._get_from_cache("key") is None
+    assert await sports_service._get_cached_games("key", 60) is None
 
 
 async def test_set_cache_no_redis(sports_service):
@@ -420,17 +498,416 @@ def test_deserialize_games_skips_malformed_entry(sports_service):
     assert games[0].external_id == "v1"
 
 
-@pytest.mark.asyncio
-async def test_service_close_calls_client_close(sports_service):
-    """close() awaits client.close() for each API client and closes Redis."""
-    await sports_service.close()
-    for client in sports_service.clients:
-        client.close.assert_called_once()
-    sports_service.redis_client.close.assert_called_once()
-
-
 def test_sports_data_service_redis_init_failure():
     """SportsDataService sets redis_client=None when Redis connection fails."""
-    with patch("redis.from_url", side_effect=Exception("connection refused")):
+    with patch(
+        "app.services.sports_api.sports_service.get_redis",
+        side_effect=Exception("connection refused"),
+    ):
         service = SportsDataService()
     assert service.redis_client is None
+
+
+def _game(external_id: str) -> GameData:
+    return GameData(
+        external_id=external_id,
+        home_team="Home",
+        away_team="Away",
+        scheduled_start_time=datetime(2026, 3, 1, 18),
+        status="scheduled",
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_fetch(sports_service):
+    """Concurrent callers for the same key await a single upstream request."""
+    import asyncio
+
+    from app.services.sports_api.base import APIUnavailableError
+
+    async def slow_schedule(league, start, end):
+        await asyncio.sleep(0.05)
+        return [_game("sf1")]
+
+    primary = sports_service.clients[0]
+    primary.get_schedule.side_effect = slow_schedule
+    day = datetime(2026, 3, 1)
+
+    results = await asyncio.gather(
+        *(sports_service.get_schedule("NFL", day, day) for _ in range(5)),
+        sports_service.get_schedule("NBA", day, day),
+    )
+
+    assert primary.get_schedule.await_count == 2  # one per key
+    assert [[g.external_id for g in games] for games in results] == [["sf1"]] * 6
+    assert results[0] is not results[1]  # each caller gets its own list
+    status = sports_service.get_api_health_status()["single_flight"]
+    assert status == {"in_flight": 0, "coalesced_requests": 4}
+
+    # A failure reaches every waiter, and the next call fetches again
+    async def failing(league, start, end):
+        await asyncio.sleep(0.05)
+        raise RuntimeError("upstream down")
+
+    for client in sports_service.clients:
+        client.get_schedule.side_effect = failing
+    outcomes = await asyncio.gather(
+        *(sports_service.get_schedule("NFL", day, day) for _ in range(3)),
+        return_exceptions=True,
+    )
+    assert all(isinstance(outcome, APIUnavailableError) for outcome in outcomes)
+    assert primary.get_schedule.await_count == 3
+
+    primary.get_schedule.side_effect = None
+    primary.get_schedule.return_value = [_game("sf2")]
+    assert [g.external_id for g in await sports_service.get_schedule("NFL", day, day)] == ["sf2"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_fetch(sports_service):
+    import asyncio
+
+    async def slow_scores(league):
+        await asyncio.sleep(0.05)
+        return [_game("live1")]
+
+    sports_service.clients[0].get_live_scores.side_effect = slow_scores
+    first = asyncio.create_task(sports_service.get_live_scores("NFL"))
+    second = asyncio.create_task(sports_service.get_live_scores("NFL"))
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    assert [g.external_id for g in await second] == ["live1"]
+    assert sports_service.clients[0].get_live_scores.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_lock_is_shared_across_processes(monkeypatch):
+    """A second service instance (another process) waits for the first one's fetch."""
+    import asyncio
+    import uuid
+
+    from app.core.config import settings
+
+    leader, follower = SportsDataService(), SportsDataService()
+    redis_client = leader.redis_client
+    try:
+        await redis_client.ping()
+    except Exception:
+        pytest.skip("Redis not available")
+
+    league = f"TEST_{uuid.uuid4().hex[:8]}"
+    game_id = "g1"
+    key = f"game_details:{league}:{game_id}"
+    monkeypatch.setattr(settings, "SPORTS_FETCH_LOCK_SECONDS", 5)
+
+    async def slow_details(league, game_id):
+        await asyncio.sleep(0.3)
+        return _game(game_id)
+
+    for service, side_effect in ((leader, slow_details), (follower, None)):
+        client = AsyncMock()
+        client.provider = APIProvider.ESPN
+        client.get_game_details.side_effect = side_effect
+        service.clients = [client]
+
+    try:
+        leading = asyncio.create_task(leader.get_game_details(league, game_id))
+        await asyncio.sleep(0.1)
+        assert await redis_client.exists(f"fetch_lock:{key}")
+        followed = await follower.get_game_details(league, game_id)
+
+        assert followed.external_id == (await leading).external_id == game_id
+        follower.clients[0].get_game_details.assert_not_called()
+        assert follower.coalesced_requests == 1
+        assert not await redis_client.exists(f"fetch_lock:{key}")
+
+        # Bypassing the cache never takes another process's result
+        follower.clients[0].get_game_details.return_value = _game("fresh")
+        fresh = await follower.get_game_details(league, game_id, use_cache=False)
+        assert fresh.external_id == "fresh"
+    finally:
+        await redis_client.delete(key, f"fetch_lock:{key}")
+
+
+@pytest.mark.asyncio
+async def test_local_tier_serves_repeat_hits(sports_service, mock_redis_client, monkeypatch):
+    """Redis hits are parsed once, then served in-process for at most the Redis TTL."""
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "SPORTS_LOCAL_CACHE_SECONDS", 10)
+    monkeypatch.setattr(settings, "CACHE_SCORES_SECONDS", 3)
+    mock_redis_client.get.return_value = sports_service._serialize_games([_game("t1")])
+    parse = MagicMock(wraps=sports_service._decode_entry)
+    monkeypatch.setattr(sports_service, "_decode_entry", parse)
+
+    first = await sports_service.get_live_scores("NFL")
+    second = await sports_service.get_live_scores("NFL")
+
+    assert [g.external_id for g in second] == ["t1"]
+    assert first is not second and first[0] is second[0]
+    assert mock_redis_client.get.await_count == parse.call_count == 1
+    expires_at = sports_service.local_cache._entries["live_scores:NFL"][0]
+    assert expires_at - time.monotonic() <= 3
+
+    # A fresh fetch replaces the local copy and is announced to other processes
+    sports_service.clients[0].get_live_scores.return_value = [_game("t2")]
+    await sports_service.get_live_scores("NFL", use_cache=False)
+    assert [g.external_id for g in await sports_service.get_live_scores("NFL")] == ["t2"]
+    channel, message = mock_redis_client.publish.await_args.args
+    assert channel == "sports_cache_invalidate"
+    assert json.loads(message)["keys"] == ["live_scores:NFL"]
+
+    tiers = sports_service.get_api_health_status()["cache_tiers"]
+    assert (tiers["local"]["hits"], tiers["local"]["misses"], tiers["local"]["entries"]) == (
+        2,
+        1,
+        1,
+    )
+    assert tiers["local"]["approx_bytes"] > 0
+    assert tiers["redis"] == {"hits": 1, "misses": 0, "hit_ratio": 1.0}
+
+
+@pytest.mark.asyncio
+async def test_unknown_cache_format_is_a_miss(sports_service, mock_redis_client):
+    """An entry from a newer format version is fetched again, not served as no games."""
+    from app.services.sports_api import game_codec
+
+    mock_redis_client.get.return_value = json.dumps(
+        [game_codec.FORMAT_VERSION + 1, time.time(), [], []]
+    )
+    sports_service.clients[0].get_live_scores.return_value = [_game("fetched")]
+
+    games = await sports_service.get_live_scores("NFL")
+
+    assert [g.external_id for g in games] == ["fetched"]
+    sports_service.clients[0].get_live_scores.assert_awaited_once()
+    assert sports_service.get_api_health_status()["cache_tiers"]["redis"]["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_while_refreshing(sports_service, mock_redis_client):
+    """Past its TTL, an entry is returned marked stale and refreshed in the background."""
+    import asyncio
+
+    from app.core.config import settings
+
+    fetched_at = time.time() - settings.CACHE_SCORES_SECONDS - 30
+    mock_redis_client.get.return_value = sports_service._encode_entry([_game("old")], fetched_at)
+    refreshed = asyncio.Event()
+
+    async def slow_scores(league):
+        await asyncio.sleep(0.05)
+        refreshed.set()
+        return [_game("new")]
+
+    sports_service.clients[0].get_live_scores.side_effect = slow_scores
+
+    games = await sports_service.get_live_scores("NFL")
+    assert [g.external_id for g in games] == ["old"]
+    assert games.stale and games.age_seconds >= settings.CACHE_SCORES_SECONDS + 30
+    # A second stale read joins the refresh already running
+    await sports_service.get_live_scores("NFL")
+    await asyncio.wait_for(refreshed.wait(), 1)
+    await asyncio.sleep(0)
+
+    sports_service.clients[0].get_live_scores.assert_awaited_once()
+    key, ttl, value = mock_redis_client.setex.await_args.args
+    assert key == "live_scores:NFL"
+    assert ttl == settings.CACHE_SCORES_SECONDS + settings.CACHE_SCORES_STALE_SECONDS
+    mock_redis_client.get.return_value = value
+    games = await sports_service.get_live_scores("NFL")
+    assert [g.external_id for g in games] == ["new"] and not games.stale
+    assert sports_service.get_api_health_status()["stale_served"] == {
+        "revalidating": 2,
+        "provider_error": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_revalidate_waits_for_fresh_scores(sports_service, mock_redis_client):
+    """With ``revalidate`` a stale entry is refreshed first, and only served if that fails."""
+    from app.core.config import settings
+
+    fetched_at = time.time() - settings.CACHE_SCORES_SECONDS - 1
+    mock_redis_client.get.return_value = sports_service._encode_entry([_game("old")], fetched_at)
+    sports_service.clients[0].get_live_scores.return_value = [_game("new")]
+
+    games = await sports_service.get_live_scores("NFL", revalidate=True)
+    assert [g.external_id for g in games] == ["new"] and not games.stale
+
+    for client in sports_service.clients:
+        client.get_live_scores.side_effect = RuntimeError("upstream down")
+    games = await sports_service.get_live_scores("NFL", revalidate=True)
+    assert [g.external_id for g in games] == ["old"] and games.stale
+    assert sports_service.get_api_health_status()["stale_served"] == {
+        "revalidating": 0,
+        "provider_error": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_when_all_providers_fail(sports_service, mock_redis_client):
+    from app.core.config import settings
+    from app.services.sports_api.base import APIUnavailableError
+
+    for client in sports_service.clients:
+        client.get_schedule.side_effect = RuntimeError("upstream down")
+    day = datetime(2026, 3, 1)
+
+    with pytest.raises(APIUnavailableError):
+        await sports_service.get_schedule("NFL", day, day)
+
+    fetched_at = time.time() - settings.CACHE_SCHEDULE_SECONDS - 60
+    mock_redis_client.get.return_value = sports_service._encode_entry([_game("s1")], fetched_at)
+    games = await sports_service.get_schedule("NFL", day, day, use_cache=False)
+
+    assert [g.external_id for g in games] == ["s1"]
+    assert games.stale and games.age_seconds >= settings.CACHE_SCHEDULE_SECONDS + 60
+    assert sports_service.get_api_health_status()["stale_served"]["provider_error"] == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidation_is_broadcast_across_processes(monkeypatch):
+    """A fresh fetch in one process drops the stale local copy in another."""
+    import asyncio
+    import uuid
+
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "SPORTS_LOCAL_CACHE_SECONDS", 30)
+    writer, reader = SportsDataService(), SportsDataService()
+    try:
+        await writer.redis_client.ping()
+    except Exception:
+        pytest.skip("Redis not available")
+
+    league = f"TEST_{uuid.uuid4().hex[:8]}"
+    key = f"live_scores:{league}"
+    for service, game_id in ((writer, "new"), (reader, "old")):
+        client = AsyncMock()
+        client.provider = APIProvider.ESPN
+        client.get_live_scores.return_value = [_game(game_id)]
+        service.clients = [client]
+
+    await reader.start_cache_listener()
+    try:
+        await asyncio.sleep(0.1)  # let the subscription settle
+        assert [g.external_id for g in await reader.get_live_scores(league)] == ["old"]
+
+        await writer.get_live_scores(league, use_cache=False)
+        for _ in range(50):
+            if key not in reader.local_cache._entries:
+                break
+            await asyncio.sleep(0.02)
+
+        assert [g.external_id for g in await reader.get_live_scores(league)] == ["new"]
+        reader.clients[0].get_live_scores.assert_awaited_once()
+    finally:
+        await reader.stop_cache_listener()
+        await writer.redis_client.delete(key)
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_and_cancelled(sports_service, monkeypatch):
+    """Past the primary's p95 the next provider is started; the first answer wins."""
+    import asyncio
+
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "API_HEDGE_LIVE_SCORES", True)
+    monkeypatch.setattr(settings, "API_HEDGE_DEFAULT_DELAY_MS", 20)
+    cancelled = asyncio.Event()
+
+    async def hang(league):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    sports_service.clients[0].get_live_scores.side_effect = hang
+    sports_service.clients[1].get_live_scores.return_value = [_game("hedge")]
+
+    started = time.perf_counter()
+    games = await sports_service.get_live_scores("NFL", use_cache=False)
+
+    assert [g.external_id for g in games] == ["hedge"]
+    assert time.perf_counter() - started < 1
+    assert cancelled.is_set()
+    status = sports_service.get_api_health_status()["hedging"]
+    assert (status["fired"], status["won"], status["denied"]) == (1, 1, 0)
+
+
+@pytest.mark.asyncio
+async def test_hedging_stops_when_league_budget_is_spent(sports_service, monkeypatch):
+    """A league out of hedge budget waits for its primary instead of hedging."""
+    import asyncio
+
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "API_HEDGE_LIVE_SCORES", True)
+    monkeypatch.setattr(settings, "API_HEDGE_DEFAULT_DELAY_MS", 10)
+    monkeypatch.setattr(settings, "API_HEDGE_BUDGET_PERCENT", 0)
+
+    async def slow(league):
+        await asyncio.sleep(0.05)
+        return [_game("primary")]
+
+    sports_service.clients[0].get_live_scores.side_effect = slow
+    sports_service.clients[1].get_live_scores.side_effect = slow
+
+    for _ in range(2):
+        await sports_service.get_live_scores("NFL", use_cache=False)
+
+    # The first fetch hedged; the second had no budget left and kept the primary
+    assert sports_service.clients[1].get_live_scores.await_count == 1
+    status = sports_service.get_api_health_status()["hedging"]
+    assert (status["fired"], status["denied"]) == (1, 1)
+    # Another league has its own budget
+    await sports_service.get_live_scores("NBA", use_cache=False)
+    assert sports_service.clients[1].get_live_scores.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_hedge_delay_follows_observed_p95(sports_service, monkeypatch):
+    """Once enough calls are timed, a provider is hedged after its own p95."""
+    from app.core.config import settings
+    from app.services.sports_api.hedging import LatencyWindow
+
+    monkeypatch.setattr(settings, "API_HEDGE_DEFAULT_DELAY_MS", 1000)
+    espn = sports_service.clients[0]
+    assert sports_service._hedge_delay(espn) == 1.0
+
+    latency = sports_service.live_latency[espn.provider] = LatencyWindow()
+    for ms in range(1, 101):
+        latency.add(ms)
+    assert sports_service._hedge_delay(espn) == 0.095
+
+
+@pytest.mark.asyncio
+async def test_failing_provider_is_demoted_per_league(sports_service):
+    """A provider failing for one league is tried after the others for that league only."""
+    espn, odds = sports_service.clients
+
+    async def espn_scores(league):
+        if league == "NCAAB":
+            raise Exception("ESPN timeout")
+        return [_game("espn")]
+
+    espn.get_live_scores.side_effect = espn_scores
+    odds.get_live_scores.return_value = [_game("odds")]
+
+    for _ in range(3):
+        await sports_service.get_live_scores("NCAAB", use_cache=False)
+        await sports_service.get_live_scores("NFL", use_cache=False)
+    assert espn.get_live_scores.await_count == 6
+
+    ncaab = await sports_service.get_live_scores("NCAAB", use_cache=False)
+    assert [g.external_id for g in ncaab] == ["odds"]
+    assert espn.get_live_scores.await_count == 6
+
+    selection = sports_service.get_api_health_status()["provider_selection"]
+    assert selection["order"]["NCAAB:live_scores"] == ["the_odds_api", "espn"]
+    assert selection["order"]["NFL:live_scores"] == ["espn", "the_odds_api"]
+    assert selection["stats"]["NCAAB:live_scores"]["espn"]["success_rate"] == 0.0
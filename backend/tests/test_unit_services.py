@@ -22,10 +22,12 @@ from app.core.security import (
     verify_token,
 )
 from app.services.circuit_breaker import (
+    CallSkippedError,
     CircuitBreaker,
     CircuitBreakerManager,
     CircuitBreakerOpenError,
     CircuitState,
+    SlidingWindowCircuitBreaker,
 )
 from app.services.sports_api.base import (
     APIProvider,
@@ -55,6 +57,12 @@ class TestCircuitBreaker:
             cb.call(lambda: (_ for _ in ()).throw(ValueError("boom")))
         assert cb.failure_count == 1
 
+    def test_skipped_call_is_not_recorded(self):
+        cb = CircuitBreaker("test", failure_threshold=1)
+        with pytest.raises(CallSkippedError):
+            cb.call(lambda: (_ for _ in ()).throw(CallSkippedError("no budget")))
+        assert cb.failure_count == 0 and cb.state == CircuitState.CLOSED
+
     def test_trips_on_threshold(self):
         cb = CircuitBreaker("test", failure_threshold=2)
         for _ in range(2):
@@ -217,6 +225,123 @@ class TestCircuitBreakerManager:
         assert "b" in statuses
 
 
+class TestSlidingWindowCircuitBreaker:
+    @pytest.fixture(autouse=True)
+    def window_settings(self, monkeypatch):
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "CIRCUIT_BREAKER_MODE", "sliding_window")
+        monkeypatch.setattr(settings, "CIRCUIT_BREAKER_WINDOW_SECONDS", 60)
+        monkeypatch.setattr(settings, "CIRCUIT_BREAKER_MIN_CALLS", 4)
+        monkeypatch.setattr(settings, "CIRCUIT_BREAKER_FAILURE_RATE", 0.5)
+        monkeypatch.setattr(settings, "CIRCUIT_BREAKER_SLOW_CALL_SECONDS", 5.0)
+        monkeypatch.setattr(settings, "CIRCUIT_BREAKER_SLOW_CALL_RATE", 0.8)
+        monkeypatch.setattr(settings, "CIRCUIT_BREAKER_HALF_OPEN_CALLS", 2)
+        self.settings = settings
+
+    @staticmethod
+    def _fail():
+        raise RuntimeError("fail")
+
+    def test_trips_on_failure_rate_once_enough_calls(self):
+        cb = SlidingWindowCircuitBreaker("test", timeout_seconds=60)
+        cb.call(lambda: "ok")
+        cb.call(lambda: "ok")
+        with contextlib.suppress(RuntimeError):
+            cb.call(self._fail)
+        assert cb.state == CircuitState.CLOSED
+        with contextlib.suppress(RuntimeError):
+            cb.call(self._fail)
+        assert cb.state == CircuitState.OPEN
+        assert cb.get_status()["window"] == {
+            "calls": 4,
+            "failure_rate": 0.5,
+            "slow_call_rate": 0.0,
+        }
+        with pytest.raises(CircuitBreakerOpenError):
+            cb.call(lambda: "should not run")
+
+    def test_trips_on_slow_call_rate(self):
+        self.settings.CIRCUIT_BREAKER_SLOW_CALL_SECONDS = 0
+        cb = SlidingWindowCircuitBreaker("test")
+        for _ in range(4):
+            cb.call(lambda: "slow but ok")
+        assert cb.state == CircuitState.OPEN
+        assert cb.failure_count == 0
+
+    def test_calls_leave_the_window(self):
+        clock = [1000.0]
+        cb = SlidingWindowCircuitBreaker("test")
+        with patch("app.services.circuit_breaker.time.monotonic", lambda: clock[0]):
+            for _ in range(3):
+                with contextlib.suppress(RuntimeError):
+                    cb.call(self._fail)
+            clock[0] += 61
+            cb.call(lambda: "ok")
+        assert cb.state == CircuitState.CLOSED
+        assert len(cb.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_half_open_admits_bounded_trial_calls(self):
+        import asyncio
+
+        cb = SlidingWindowCircuitBreaker("test", timeout_seconds=0)
+        cb.state = CircuitState.OPEN
+        release = asyncio.Event()
+
+        async def trial():
+            await release.wait()
+            return "ok"
+
+        trials = [asyncio.create_task(cb.async_call(trial)) for _ in range(2)]
+        await asyncio.sleep(0)
+        assert cb.state == CircuitState.HALF_OPEN
+        with pytest.raises(CircuitBreakerOpenError):
+            await cb.async_call(trial)
+
+        release.set()
+        assert await asyncio.gather(*trials) == ["ok", "ok"]
+        assert cb.state == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_prober_closes_recovered_breaker(self):
+        mgr = CircuitBreakerManager()
+        self.settings.CIRCUIT_BREAKER_PROBE_INTERVAL_SECONDS = 3600
+        await mgr.start_prober()
+        try:
+            cb = mgr.get_breaker("api_probe", timeout_seconds=0)
+            assert isinstance(cb, SlidingWindowCircuitBreaker)
+            assert cb.probed_in_background
+            provider = AsyncMock(side_effect=RuntimeError("down"))
+            cb.probe_call = AsyncMock(side_effect=CallSkippedError("no budget"))
+            for _ in range(4):
+                with contextlib.suppress(RuntimeError):
+                    await cb.async_call(provider, "NFL", "2026-03-01")
+            assert cb.state == CircuitState.OPEN
+
+            # Callers are turned away even though the timeout has passed
+            with pytest.raises(CircuitBreakerOpenError):
+                await cb.async_call(provider, "NFL", "2026-03-01")
+            # A skipped probe leaves the breaker to the next round
+            await mgr.probe_all()
+            assert cb.state == CircuitState.HALF_OPEN and cb.half_open_in_flight == 0
+            cb.probe_call.side_effect = RuntimeError("down")
+            await mgr.probe_all()
+            assert cb.state == CircuitState.OPEN
+            assert cb.probes == {"succeeded": 0, "failed": 1, "skipped": 1}
+
+            cb.probe_call.side_effect = None
+            await mgr.probe_all()
+            assert cb.state == CircuitState.CLOSED
+            assert cb.probes == {"succeeded": 2, "failed": 1, "skipped": 1}
+            # Probes use their own fixed request, never the callers' arguments
+            cb.probe_call.assert_awaited_with()
+            assert provider.await_count == 4
+        finally:
+            await mgr.stop_prober()
+        assert not cb.probed_in_background
+
+
 # ── Security ─────────────────────────────────────────────────────────────────
 
 
@@ -367,11 +492,39 @@ class TestBaseSportsAPIClient:
                 await client._make_request("GET", "http://example.com")
 
     @pytest.mark.asyncio
-    async def test_close(self):
+    async def test_get_parsed_skips_unchanged_responses(self):
+        """304s and byte-identical bodies reuse the last parse instead of decoding."""
+        bodies = iter([b'{"n": 1}', b'{"n": 1}', b'{"n": 2}', b'{"n": 1}'])
+        seen_headers = []
+
+        def respond(request):
+            seen_headers.append(request.headers.get("if-none-match"))
+            if request.headers.get("if-none-match") == '"v1"' and len(seen_headers) == 2:
+                return httpx.Response(304)
+            body = next(bodies)
+            return httpx.Response(200, content=body, headers={"ETag": '"v1"'})
+
         client = ConcreteClient()
-        with patch.object(client.client, "aclose", new_callable=AsyncMock) as mock_close:
-            await client.close()
-            mock_close.assert_called_once()
+        client.client = httpx.AsyncClient(transport=httpx.MockTransport(respond))
+        parse = MagicMock(side_effect=lambda body: [body["n"]])
+        url = "http://example.com/scoreboard"
+
+        results = [await client._get_parsed(url, parse, params={"d": 1}) for _ in range(4)]
+
+        assert results == [[1], [1], [1], [2]]
+        assert results[1] is results[0]
+        assert parse.call_count == 2
+        assert seen_headers == [None, '"v1"', '"v1"', '"v1"']
+        assert client.skipped_parses == {"not_modified": 1, "unchanged_body": 1}
+
+        # Other params are a different request with its own validators
+        assert await client._get_parsed(url, parse, params={"d": 2}) == [1]
+        assert seen_headers[-1] is None
+        assert client.http_stats.latency.count >= 5
+        await client.client.aclose()
+
+    def test_clients_share_one_http_client(self):
+        assert ConcreteClient().client is ConcreteClient().client
 
 
 class TestGameData:
@@ -409,3 +562,63 @@ class TestGameData:
         assert gd.home_score == 21
         assert gd.venue == "Stadium"
         assert gd.home_team_abbreviation == "HTM"
+
+    @staticmethod
+    def _full(**overrides):
+        fields = {
+            "external_id": "g3",
+            "home_team": "H",
+            "away_team": "A",
+            "scheduled_start_time": datetime(2026, 3, 1, 19),
+            "status": "in_progress",
+            "home_score": 10,
+            "away_score": 7,
+            "venue": "Stadium",
+            "home_team_external_id": "h_ext",
+            "away_team_abbreviation": "ATM",
+            "home_team_wins": 3,
+            "away_team_ties": 0,
+            "spread": -3.5,
+            "over_under": 44.5,
+        }
+        return GameData(**{**fields, **overrides})
+
+    def test_cache_converters_round_trip(self):
+        gd = self._full(raw_data={"key": "val"})
+        restored = GameData.from_cache(gd.to_cache())
+
+        for field in GameData.CACHE_FIELDS:
+            assert getattr(restored, field) == getattr(gd, field)
+        assert restored.raw_data == {}
+        assert gd.to_cache()[3] == "2026-03-01T19:00:00"
+        with pytest.raises(ValueError):
+            GameData.from_cache(gd.to_cache()[:-1])
+
+    def test_slotted(self):
+        assert set(GameData.CACHE_FIELDS) | {"raw_data"} <= set(GameData.__slots__)
+        gd = self._full()
+        assert not hasattr(gd, "__dict__")
+        with pytest.raises(AttributeError):
+            gd.unknown = 1
+
+    def test_equality_and_hash_cover_scoring_fields(self):
+        gd = self._full()
+        # Fields no competition scores on don't make a game "changed"
+        same = self._full(venue="Elsewhere", home_team_wins=4, raw_data={"x": 1})
+        assert gd == same and hash(gd) == hash(same)
+        assert len({gd, same}) == 1
+        for change in ({"home_score": 11}, {"status": "final"}, {"spread": -4.0}):
+            assert gd != self._full(**change)
+        assert gd != "g3"
+
+    def test_from_cache_matches_keyword_construction(self):
+        gd = self._full(raw_data={"key": "val"})
+        values = gd.to_cache()
+        kwargs = dict(zip(GameData.CACHE_FIELDS, values, strict=True))
+        kwargs["scheduled_start_time"] = datetime.fromisoformat(values[3])
+
+        restored = GameData.from_cache(values)
+        built = GameData(**kwargs)
+        for field in (*GameData.CACHE_FIELDS, "raw_data"):
+            assert getattr(restored, field) == getattr(built, field)
+        assert restored == built and hash(restored) == hash(built)
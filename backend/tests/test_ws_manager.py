@@ -45,10 +45,8 @@ async def test_broadcast(manager: ScoreManager):
 @pytest.mark.asyncio
 async def test_publish_to_redis(manager: ScoreManager):
     """Test publishing a score update to Redis."""
-    with patch("redis.asyncio.from_url") as mock_from_url:
-        mock_redis = AsyncMock()
-        mock_from_url.return_value = mock_redis
-
+    mock_redis = AsyncMock()
+    with patch("app.services.ws_manager.get_redis", return_value=mock_redis):
         games = [{"id": "1", "score": "14-7"}]
         await manager.publish_score_update(games)
 
@@ -193,7 +191,9 @@ async def test_publish_redis_failure_falls_back_to_direct_broadcast():
     ws = AsyncMock()
     await score_manager.connect(ws)
     try:
-        with patch("redis.asyncio.from_url", side_effect=ConnectionError("no redis")):
+        down = AsyncMock()
+        down.publish.side_effect = ConnectionError("no redis")
+        with patch("app.services.ws_manager.get_redis", return_value=down):
             await score_manager.publish_score_update([{"id": "1"}])
         ws.send_text.assert_called_once()
     finally:
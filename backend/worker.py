@@ -30,7 +30,11 @@ logger = logging.getLogger("udl.worker")
 
 
 def main():
+    from app.db.redis import close_redis
     from app.services.background_jobs import start_background_jobs, stop_background_jobs
+    from app.services.circuit_breaker import circuit_breaker_manager
+    from app.services.sports_api.http_pool import close_http_client
+    from app.services.sports_api.sports_service import sports_service
 
     logger.info("Starting UDL background worker...")
     start_background_jobs()
@@ -48,9 +52,15 @@ def main():
 
     loop = asyncio.new_event_loop()
     try:
+        loop.run_until_complete(sports_service.start_cache_listener())
+        loop.run_until_complete(circuit_breaker_manager.start_prober())
         loop.run_until_complete(shutdown_event.wait())
     finally:
         stop_background_jobs()
+        loop.run_until_complete(sports_service.stop_cache_listener())
+        loop.run_until_complete(circuit_breaker_manager.stop_prober())
+        loop.run_until_complete(close_http_client())
+        loop.run_until_complete(close_redis())
         loop.close()
         logger.info("Worker shut down cleanly.")
 